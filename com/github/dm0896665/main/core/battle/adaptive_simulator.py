@@ -0,0 +1,197 @@
+import math
+from statistics import NormalDist
+from typing import Generator, List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class RunningStatistics:
+    """Running count, mean and variance for a grid of samples, updated a chunk at a time.
+
+    Chunks are merged with Chan's parallel form of Welford's algorithm, so nothing but three numbers per cell is kept.
+    """
+
+    def __init__(self, shape: tuple):
+        self.count: np.ndarray = np.zeros(shape, np.int64)
+        self.mean: np.ndarray = np.zeros(shape)
+        self.m2: np.ndarray = np.zeros(shape)
+
+    def add_samples(self, index: tuple, samples: np.ndarray):
+        # samples has one row of new values per indexed cell
+        batch_count: int = samples.shape[1]
+        batch_mean: np.ndarray = samples.mean(axis=1)
+        batch_m2: np.ndarray = ((samples - batch_mean[:, None]) ** 2).sum(axis=1)
+
+        count: np.ndarray = self.count[index]
+        total: np.ndarray = count + batch_count
+        delta: np.ndarray = batch_mean - self.mean[index]
+        self.mean[index] += delta * batch_count / total
+        self.m2[index] += batch_m2 + delta ** 2 * count * batch_count / total
+        self.count[index] = total
+
+    def get_variance(self) -> np.ndarray:
+        return np.divide(self.m2, self.count - 1, out=np.zeros(self.m2.shape), where=self.count > 1)
+
+    def get_standard_error(self) -> np.ndarray:
+        return np.sqrt(np.divide(self.get_variance(), self.count, out=np.zeros(self.m2.shape), where=self.count > 0))
+
+
+class AdaptiveSweep:
+    """Win rate estimates for a Weapon x MonsterType grid, as far as an AdaptiveSimulator has gotten.
+
+    Matchups are only looked at once they reach one of look_sizes battles, which grow geometrically up to the last
+    look, so there is a fixed, known number of looks. The chance of a miss is split evenly over them (Bonferroni), and
+    every interval is a Wilson score interval at that share. Stopping a matchup the first time its interval is narrow
+    enough then still leaves every reported interval holding the true win rate with at least the requested confidence.
+    """
+
+    def __init__(self, weapons: List[Weapon], monster_types: List[MonsterType], tolerance: float, confidence: float, look_sizes: List[int]):
+        shape: tuple = (len(weapons), len(monster_types))
+        self.weapons: List[Weapon] = weapons
+        self.monster_types: List[MonsterType] = monster_types
+        self.tolerance: float = tolerance
+        self.confidence: float = confidence
+        self.look_sizes: List[int] = look_sizes
+        self.wins: RunningStatistics = RunningStatistics(shape)
+        self.rounds: RunningStatistics = RunningStatistics(shape)
+        self.look_count: np.ndarray = np.zeros(shape, np.int64)
+        self.is_converged: np.ndarray = np.zeros(shape, bool)
+
+    def get_win_rate(self) -> np.ndarray:
+        return self.wins.mean
+
+    def get_mean_rounds(self) -> np.ndarray:
+        return self.rounds.mean
+
+    def get_battle_count(self) -> np.ndarray:
+        return self.wins.count
+
+    def get_total_battles(self) -> int:
+        return int(self.wins.count.sum())
+
+    def get_z(self) -> float:
+        # Every look gets the same share of the chance of a miss
+        alpha: float = (1 - self.confidence) / len(self.look_sizes)
+        return NormalDist().inv_cdf(1 - alpha / 2)
+
+    def get_confidence_interval(self) -> tuple:
+        # Wilson score interval, which stays honest for one-sided matchups where the win rate is 0 or 1
+        z: float = self.get_z()
+        count: np.ndarray = np.maximum(self.wins.count, 1)
+        win_rate: np.ndarray = self.wins.mean
+        denominator: np.ndarray = 1 + z ** 2 / count
+        center: np.ndarray = (win_rate + z ** 2 / (2 * count)) / denominator
+        half_width: np.ndarray = z * np.sqrt(win_rate * (1 - win_rate) / count + z ** 2 / (4 * count ** 2)) / denominator
+
+        # Pin the ends for all-win and all-loss matchups, where rounding would otherwise leave 1 or 0 just outside
+        low: np.ndarray = np.where(win_rate <= 0, 0.0, np.clip(center - half_width, 0, 1))
+        high: np.ndarray = np.where(win_rate >= 1, 1.0, np.clip(center + half_width, 0, 1))
+        return low, high
+
+    def get_half_width(self) -> np.ndarray:
+        low, high = self.get_confidence_interval()
+        return (high - low) / 2
+
+    def get_fixed_sample_battles(self) -> int:
+        # Battles per matchup a fixed-sample sweep needs to promise the same tolerance for a win rate it doesn't know
+        z: float = NormalDist().inv_cdf((1 + self.confidence) / 2)
+        return math.ceil(z ** 2 / (4 * self.tolerance ** 2))
+
+    def get_report(self) -> str:
+        low, high = self.get_confidence_interval()
+        fixed_sample_total: int = self.get_fixed_sample_battles() * self.is_converged.size
+        battle_ratio: float = fixed_sample_total / max(self.get_total_battles(), 1)
+        lines: List[str] = [
+            f"Adaptive sweep: {self.is_converged.sum()}/{self.is_converged.size} matchups within +/-{self.tolerance} at {self.confidence:.0%} confidence",
+            f"Battles simulated: {self.get_total_battles():,} vs {fixed_sample_total:,} for a fixed {self.get_fixed_sample_battles():,} per matchup "
+            f"({battle_ratio:.1f}x fewer)" if battle_ratio >= 1 else f"({1 / battle_ratio:.1f}x more)",
+            f"Every interval holds the true win rate with at least the stated confidence over all {len(self.look_sizes)} looks, "
+            f"even though each matchup stopped at the first look within tolerance.",
+            "weapon,monster,battles,win_rate,ci_low,ci_high,mean_rounds,rounds_standard_error,converged"]
+        rounds_standard_error: np.ndarray = self.rounds.get_standard_error()
+        for weapon_index, weapon in enumerate(self.weapons):
+            for monster_index, monster_type in enumerate(self.monster_types):
+                index: tuple = (weapon_index, monster_index)
+                lines.append(f"{weapon.weapon_name},{monster_type.monster_name},{self.wins.count[index]},{self.wins.mean[index]:.4f},"
+                             f"{low[index]:.4f},{high[index]:.4f},{self.rounds.mean[index]:.2f},{rounds_standard_error[index]:.3f},{self.is_converged[index]}")
+        return "\n".join(lines)
+
+
+class AdaptiveSimulator:
+    """Monte Carlo sweep that stops simulating each matchup once its win rate is pinned down.
+
+    stream() is a generator that simulates one chunk of battles for every unfinished matchup at a time, all in a single
+    BattleSimulator batch, and yields the AdaptiveSweep after each chunk. Chunks grow by look_ratio, so a matchup is
+    looked at a few dozen times at most and each look only costs a little confidence. One-sided matchups like a Stick
+    against an Eldritch Horror settle after a few hundred battles, which leaves the work for the close ones.
+
+    :param tolerance: Largest confidence interval half width to stop at
+    :param confidence: Confidence level of the intervals, over every look together
+    :param chunk_size: Battles simulated per matchup before the first look, and the step later looks are rounded to
+    :param max_battles: Battles per matchup to give up at, even if the interval is still too wide
+    :param look_ratio: How much the battles per matchup grow from one look to the next
+    """
+
+    def __init__(self, tolerance: float = 0.01, confidence: float = 0.95, chunk_size: int = 256, max_battles: int = 100000,
+                 player_health: int = 1000, battle_action: BattleAction = None, generator: np.random.Generator = None,
+                 look_ratio: float = 1.25):
+        self.tolerance: float = tolerance
+        self.confidence: float = confidence
+        self.chunk_size: int = chunk_size
+        self.max_battles: int = max_battles
+        self.look_ratio: float = look_ratio
+        self.battle_simulator: BattleSimulator = BattleSimulator(player_health, battle_action, generator)
+
+    def get_look_sizes(self) -> List[int]:
+        # Battles per matchup at every look, growing by look_ratio in whole chunks and ending at max_battles
+        look_sizes: List[int] = [min(self.chunk_size, self.max_battles)]
+        while look_sizes[-1] < self.max_battles:
+            look_sizes.append(min(math.ceil(look_sizes[-1] * self.look_ratio / self.chunk_size) * self.chunk_size, self.max_battles))
+        return look_sizes
+
+    def stream(self, weapons: List[Weapon] = None, monster_types: List[MonsterType] = None) -> Generator[AdaptiveSweep, None, None]:
+        if weapons is None:
+            weapons = list(Weapon)
+        if monster_types is None:
+            monster_types = MonsterType.get_spawnable_monster_types()
+
+        sweep: AdaptiveSweep = AdaptiveSweep(weapons, monster_types, self.tolerance, self.confidence, self.get_look_sizes())
+        weapon_damage: np.ndarray = np.array([weapon.damage for weapon in weapons])
+        weapon_attack_rate: np.ndarray = np.array([weapon.attack_rate for weapon in weapons])
+        is_fast_attack: np.ndarray = np.array([self.battle_simulator.get_battle_action(weapon) == BattleAction.FAST_ATTACK for weapon in weapons])
+        monster_health: np.ndarray = np.array([monster_type.health for monster_type in monster_types])
+        monster_attack: np.ndarray = np.array([monster_type.attack for monster_type in monster_types])
+        monster_attack_rate: np.ndarray = np.array([monster_type.attack_rate for monster_type in monster_types])
+
+        previous_look_size: int = 0
+        for look_size in sweep.look_sizes:
+            weapon_index, monster_index = np.nonzero(~sweep.is_converged)
+            if len(weapon_index) == 0:
+                return
+
+            # One flat batch that brings every matchup that is still going up to the next look
+            chunk_size: int = look_size - previous_look_size
+            previous_look_size = look_size
+            is_player_won, rounds, _, _ = self.battle_simulator.simulate_battles(
+                np.repeat(weapon_damage[weapon_index], chunk_size), np.repeat(weapon_attack_rate[weapon_index], chunk_size),
+                np.repeat(is_fast_attack[weapon_index], chunk_size), np.repeat(monster_health[monster_index], chunk_size),
+                np.repeat(monster_attack[monster_index], chunk_size), np.repeat(monster_attack_rate[monster_index], chunk_size),
+                self.battle_simulator.player_health)
+
+            index: tuple = (weapon_index, monster_index)
+            sweep.wins.add_samples(index, is_player_won.reshape(-1, chunk_size).astype(np.float64))
+            sweep.rounds.add_samples(index, rounds.reshape(-1, chunk_size).astype(np.float64))
+            sweep.look_count[index] += 1
+            sweep.is_converged[index] = sweep.get_half_width()[index] <= self.tolerance
+            yield sweep
+
+    def run(self, weapons: List[Weapon] = None, monster_types: List[MonsterType] = None) -> AdaptiveSweep:
+        sweep: AdaptiveSweep = None
+        for sweep in self.stream(weapons, monster_types):
+            pass
+        return sweep
@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+
+
+class BalanceSweep:
+    """Outcome statistics of a sweep over player level x Weapon x MonsterType.
+
+    stats[level - 1, weapon, monster type] holds the STAT_* columns. Monster types outside a level's spawn pool
+    have no battles.
+    """
+    STAT_BATTLES: int = 0
+    STAT_WINS: int = 1
+    STAT_ROUNDS: int = 2
+    STAT_HEALTH_REMAINING: int = 3
+    STAT_COUNT: int = 4
+
+    def __init__(self, levels: List[int], weapons: List[Weapon], monster_types: List[MonsterType], stats: np.ndarray):
+        self.levels: List[int] = levels
+        self.weapons: List[Weapon] = weapons
+        self.monster_types: List[MonsterType] = monster_types
+        self.stats: np.ndarray = stats
+
+    def get_win_rate(self) -> np.ndarray:
+        battles: np.ndarray = self.stats[..., BalanceSweep.STAT_BATTLES]
+        return np.divide(self.stats[..., BalanceSweep.STAT_WINS], battles, out=np.full(battles.shape, np.nan), where=battles > 0)
+
+    def get_mean_rounds(self) -> np.ndarray:
+        battles: np.ndarray = self.stats[..., BalanceSweep.STAT_BATTLES]
+        return np.divide(self.stats[..., BalanceSweep.STAT_ROUNDS], battles, out=np.full(battles.shape, np.nan), where=battles > 0)
+
+    def get_mean_health_remaining(self) -> np.ndarray:
+        # Average player health left after the battles the player won
+        wins: np.ndarray = self.stats[..., BalanceSweep.STAT_WINS]
+        return np.divide(self.stats[..., BalanceSweep.STAT_HEALTH_REMAINING], wins, out=np.full(wins.shape, np.nan), where=wins > 0)
+
+    def get_level_win_rate(self) -> np.ndarray:
+        # Win rate per (level, weapon) against that level's whole spawn pool
+        totals: np.ndarray = self.stats.sum(axis=2)
+        return totals[..., BalanceSweep.STAT_WINS] / totals[..., BalanceSweep.STAT_BATTLES]
+
+    def save_csv(self, path: str):
+        win_rate: np.ndarray = self.get_win_rate()
+        mean_rounds: np.ndarray = self.get_mean_rounds()
+        mean_health_remaining: np.ndarray = self.get_mean_health_remaining()
+
+        with open(path, "w") as csv_file:
+            csv_file.write("level,weapon,monster,battles,wins,win_rate,mean_rounds,mean_health_remaining\n")
+            for level_index, level in enumerate(self.levels):
+                for weapon_index, weapon in enumerate(self.weapons):
+                    for monster_index, monster_type in enumerate(self.monster_types):
+                        stats: np.ndarray = self.stats[level_index, weapon_index, monster_index]
+                        if stats[BalanceSweep.STAT_BATTLES] == 0:
+                            continue
+                        index: tuple = (level_index, weapon_index, monster_index)
+                        csv_file.write(f"{level},{weapon.weapon_name},{monster_type.monster_name},{int(stats[BalanceSweep.STAT_BATTLES])},"
+                                       f"{int(stats[BalanceSweep.STAT_WINS])},{win_rate[index]:.6f},{mean_rounds[index]:.4f},{mean_health_remaining[index]:.2f}\n")
+
+    def save_npz(self, path: str):
+        np.savez_compressed(path, levels=np.array(self.levels), weapons=np.array([weapon.name for weapon in self.weapons]),
+                            monster_types=np.array([monster_type.name for monster_type in self.monster_types]), stats=self.stats,
+                            win_rate=self.get_win_rate(), mean_rounds=self.get_mean_rounds(), level_win_rate=self.get_level_win_rate())
+
+
+# Shared memory attached once per worker process by BalanceSweeper.attach_worker
+_worker_shared_memory: SharedMemory = None
+_worker_stats: np.ndarray = None
+
+
+class BalanceSweeper:
+    """Sweeps player level x Weapon x MonsterType across a process pool.
+
+    Each task simulates one (level, weapon) pair against monsters drawn from that level's spawn pool, the same way
+    Monster.get_random_monster_type picks them, and writes its statistics straight into a shared memory array, so
+    nothing but the task arguments is pickled between processes.
+
+    :param battles_per_task: Battles simulated for each (level, weapon) pair
+    :param player_health: The health the player starts every battle with
+    :param battle_action: The attack style to use, or None for BestAttackPolicy's pick per weapon
+    :param seed: Seed for the per task random streams, so a sweep can be reproduced
+    :param max_workers: Worker processes to use, defaults to the number of cores
+    """
+
+    def __init__(self, battles_per_task: int = 10000, player_health: int = 1000, battle_action: BattleAction = None, seed: int = None, max_workers: int = None):
+        self.battles_per_task: int = battles_per_task
+        self.player_health: int = player_health
+        self.battle_action: BattleAction = battle_action
+        self.seed: int = seed
+        self.max_workers: int = max_workers if max_workers is not None else os.cpu_count()
+
+    def sweep(self, levels: List[int] = None) -> BalanceSweep:
+        if levels is None:
+            levels = list(range(1, 101))
+        weapons: List[Weapon] = list(Weapon)
+        monster_types: List[MonsterType] = MonsterType.get_spawnable_monster_types()
+        shape: tuple = (len(levels), len(weapons), len(monster_types), BalanceSweep.STAT_COUNT)
+
+        # One independent random stream per task
+        seed_sequences: list = np.random.SeedSequence(self.seed).spawn(len(levels) * len(weapons))
+
+        shared_memory: SharedMemory = SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+        try:
+            stats: np.ndarray = np.ndarray(shape, np.float64, shared_memory.buf)
+            stats.fill(0)
+
+            tasks: list = [(level_index, level, weapon_index, seed_sequences[level_index * len(weapons) + weapon_index])
+                           for level_index, level in enumerate(levels) for weapon_index in range(len(weapons))]
+            with ProcessPoolExecutor(self.max_workers, initializer=BalanceSweeper.attach_worker, initargs=(shared_memory.name, shape)) as executor:
+                # Chunk tasks so each worker gets a steady stream of work without a round trip per task
+                chunk_size: int = max(1, len(tasks) // (self.max_workers * 4))
+                list(executor.map(self.run_task, tasks, chunksize=chunk_size))
+
+            sweep: BalanceSweep = BalanceSweep(levels, weapons, monster_types, stats.copy())
+            del stats
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        return sweep
+
+    @staticmethod
+    def attach_worker(shared_memory_name: str, shape: tuple):
+        global _worker_shared_memory, _worker_stats
+        _worker_shared_memory = SharedMemory(name=shared_memory_name)
+        _worker_stats = np.ndarray(shape, np.float64, _worker_shared_memory.buf)
+
+    def run_task(self, task: tuple):
+        level_index, level, weapon_index, seed_sequence = task
+        weapon: Weapon = WeaponRegistry.catalog[weapon_index]
+        monster_types: List[MonsterType] = MonsterType.get_spawnable_monster_types()
+        simulator: BattleSimulator = BattleSimulator(self.player_health, self.battle_action, np.random.default_rng(seed_sequence))
+
+        # Draw monsters uniformly from the level's spawn pool like Monster.get_random_monster_type does
+        pool_size: int = Monster.get_max_monster_index(level) + 1
+        monster_index: np.ndarray = simulator.generator.integers(0, pool_size, self.battles_per_task)
+        monster_health: np.ndarray = np.array([monster_type.health for monster_type in monster_types])[monster_index]
+        monster_attack: np.ndarray = np.array([monster_type.attack for monster_type in monster_types])[monster_index]
+        monster_attack_rate: np.ndarray = np.array([monster_type.attack_rate for monster_type in monster_types])[monster_index]
+        ones: np.ndarray = np.ones(self.battles_per_task, np.int64)
+
+        is_player_won, rounds, player_health, _ = simulator.simulate_battles(
+            ones * weapon.damage, ones * weapon.attack_rate, ones * (simulator.get_battle_action(weapon) == BattleAction.FAST_ATTACK),
+            monster_health, monster_attack, monster_attack_rate, self.player_health)
+
+        # Each task owns its own (level, weapon) slice, so workers never write to the same cells
+        stats: np.ndarray = _worker_stats[level_index, weapon_index]
+        stats[:, BalanceSweep.STAT_BATTLES] = np.bincount(monster_index, minlength=len(monster_types))
+        stats[:, BalanceSweep.STAT_WINS] = np.bincount(monster_index, is_player_won, len(monster_types))
+        stats[:, BalanceSweep.STAT_ROUNDS] = np.bincount(monster_index, rounds, len(monster_types))
+        stats[:, BalanceSweep.STAT_HEALTH_REMAINING] = np.bincount(monster_index, np.where(is_player_won, player_health, 0), len(monster_types))
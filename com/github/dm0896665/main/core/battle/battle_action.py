@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class BattleAction(Enum):
+    FAST_ATTACK = "Fast Attack", True
+    LARGE_ATTACK = "Large Attack", True
+    SWITCH_WEAPONS = "Switch Weapons", False
+    RUN = "Run", False
+    VIEW_STATS = "View Stats", False
+    # A round that passes with nothing done, like backing out of running away. Kept last so journals keep their indexes
+    STAY = "Stay", False
+
+    def __new__(cls, *args, **kwds):
+        obj = object.__new__(cls)
+        obj._value_ = args[0]
+        return obj
+
+    # ignore the first param since it's already set by __new__
+    def __init__(self, action_name: str, is_attack: bool):
+        self.action_name = action_name
+        self.is_attack = is_attack
+
+    def __str__(self):
+        return self.action_name
+
+    def get_action_name(self):
+        return self.action_name
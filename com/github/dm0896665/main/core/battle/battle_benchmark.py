@@ -0,0 +1,236 @@
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+from com.github.dm0896665.main.core.weapon.weapon_table import WeaponTable
+
+
+class BattleBenchmark:
+    """Fixed-seed benchmarks of the combat code, reported as a dict that saves straight to JSON.
+
+        single_battle    BattleEngine's round loop against single monsters, journaled in memory like a real battle. Rounds
+                         per second only counts time spent in rounds, battles per second includes setting each one up
+        swarm_battle     the same against MonsterGroup swarms
+        bulk_simulation  BattleSimulator battles over every weapon and spawnable monster type in one batch
+        session_memory   Python heap per concurrent BattleSession with its player, monster and engine, from tracemalloc
+        monster_instances  Monster construction rate and Python heap per Monster held at once
+        weapon_table     WeaponTable wear and kill updates after a battle across a large inventory, and its saved size
+    Every matchup, seed and roll is the same from run to run, so two results only differ by the code and the machine.
+    Throughput benchmarks are run repeat times and the fastest run is kept.
+
+    :param battle_count: Battles fought through the engine per run
+    :param simulated_battles: Battles simulated in bulk per run
+    :param session_count: Sessions held at once for the memory benchmark
+    :param monster_count: Monsters built for the monster instance benchmark
+    :param weapon_count: Weapon instances held in the weapon table benchmark
+    :param repeat: Runs of each throughput benchmark
+    :param seed: Seed for every benchmark
+    """
+    # 1 when a higher value is better, -1 when a lower one is
+    metric_directions: Dict[str, int] = {
+        "rounds_per_second": 1,
+        "battles_per_second": 1,
+        "round_latency_p50_us": -1,
+        "round_latency_p99_us": -1,
+        "bytes_per_session": -1,
+        "monsters_per_second": 1,
+        "bytes_per_monster": -1,
+        "weapon_updates_per_second": 1,
+        "saved_bytes_per_weapon": -1,
+    }
+
+    def __init__(self, battle_count: int = 2000, simulated_battles: int = 1000000, session_count: int = 1000, repeat: int = 3, seed: int = 0,
+                 monster_count: int = 100000, weapon_count: int = 100000):
+        self.battle_count: int = battle_count
+        self.simulated_battles: int = simulated_battles
+        self.session_count: int = session_count
+        self.monster_count: int = monster_count
+        self.weapon_count: int = weapon_count
+        self.repeat: int = repeat
+        self.seed: int = seed
+
+    def run(self) -> dict:
+        return {
+            "seed": self.seed,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "benchmarks": {
+                "single_battle": self.run_best(lambda: self.benchmark_battles(False)),
+                "swarm_battle": self.run_best(lambda: self.benchmark_battles(True)),
+                "bulk_simulation": self.run_best(self.benchmark_bulk_simulation),
+                "session_memory": self.benchmark_session_memory(),
+                "monster_instances": self.benchmark_monster_instances(),
+                "weapon_table": self.run_best(self.benchmark_weapon_table),
+            },
+        }
+
+    def run_best(self, benchmark) -> dict:
+        return min((benchmark() for _ in range(self.repeat)), key=lambda result: result["seconds"])
+
+    def benchmark_battles(self, is_swarm: bool) -> dict:
+        monster_types: List[MonsterType] = list(MonsterGroup.swarm_sizes) if is_swarm else MonsterType.get_spawnable_monster_types()
+        weapons: List[Weapon] = list(Weapon)
+        battle_policy: BestAttackPolicy = BestAttackPolicy()
+        battle_journal: BattleJournal = BattleJournal()
+        round_latency: List[int] = []
+
+        start_time: float = time.perf_counter()
+        for battle_index, battle_session in enumerate(BattleSession.spawn_sessions(self.battle_count, self.seed)):
+            player: Player = Player()
+            player.selected_weapon = weapons[battle_index % len(weapons)]
+            monster_type: MonsterType = monster_types[battle_index % len(monster_types)]
+            monster: Monster | MonsterGroup = MonsterGroup(monster_type) if is_swarm else Monster(monster_type)
+            battle_engine: BattleEngine = BattleEngine(battle_session, player, monster, battle_policy, battle_journal)
+
+            battle_engine.start()
+            while battle_session.battle_status == BattleStatus.IN_PROGRESS:
+                round_start: int = time.perf_counter_ns()
+                battle_engine.run_battle_round()
+                round_latency.append(time.perf_counter_ns() - round_start)
+            battle_engine.finish()
+        seconds: float = time.perf_counter() - start_time
+
+        latency_us: np.ndarray = np.array(round_latency) / 1000
+        return {
+            "battles": self.battle_count,
+            "rounds": len(round_latency),
+            "seconds": seconds,
+            "rounds_per_second": len(round_latency) / (sum(round_latency) / 1e9),
+            "battles_per_second": self.battle_count / seconds,
+            "round_latency_p50_us": float(np.percentile(latency_us, 50)),
+            "round_latency_p99_us": float(np.percentile(latency_us, 99)),
+        }
+
+    def benchmark_bulk_simulation(self) -> dict:
+        weapons: List[Weapon] = list(Weapon)
+        monster_types: List[MonsterType] = MonsterType.get_spawnable_monster_types()
+        simulator: BattleSimulator = BattleSimulator(generator=np.random.default_rng(self.seed))
+
+        # The same weapon and monster for each battle every run, cycling through every matchup
+        matchup: np.ndarray = np.arange(self.simulated_battles) % (len(weapons) * len(monster_types))
+        weapon_index: np.ndarray = matchup // len(monster_types)
+        monster_index: np.ndarray = matchup % len(monster_types)
+        is_fast_attack: np.ndarray = np.array([simulator.get_battle_action(weapon) == BattleAction.FAST_ATTACK for weapon in weapons])
+
+        start_time: float = time.perf_counter()
+        _, rounds, _, _ = simulator.simulate_battles(
+            np.array([weapon.damage for weapon in weapons])[weapon_index], np.array([weapon.attack_rate for weapon in weapons])[weapon_index],
+            is_fast_attack[weapon_index], np.array([monster_type.health for monster_type in monster_types])[monster_index],
+            np.array([monster_type.attack for monster_type in monster_types])[monster_index],
+            np.array([monster_type.attack_rate for monster_type in monster_types])[monster_index], simulator.player_health)
+        seconds: float = time.perf_counter() - start_time
+
+        return {
+            "battles": self.simulated_battles,
+            "rounds": int(rounds.sum()),
+            "seconds": seconds,
+            "battles_per_second": self.simulated_battles / seconds,
+        }
+
+    def benchmark_session_memory(self) -> dict:
+        # Only Python allocations are traced, the Qt side of each Player's signal object isn't counted
+        monster_types: List[MonsterType] = MonsterType.get_spawnable_monster_types()
+        tracemalloc.start()
+        try:
+            start_bytes: int = tracemalloc.get_traced_memory()[0]
+            battle_engines: List[BattleEngine] = []
+            for battle_index, battle_session in enumerate(BattleSession.spawn_sessions(self.session_count, self.seed)):
+                monster: Monster | MonsterGroup = MonsterGroup.create_encounter(monster_types[battle_index % len(monster_types)])
+                battle_engines.append(BattleEngine(battle_session, Player(), monster, BestAttackPolicy()))
+            total_bytes: int = tracemalloc.get_traced_memory()[0] - start_bytes
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "sessions": len(battle_engines),
+            "total_bytes": total_bytes,
+            "bytes_per_session": total_bytes / len(battle_engines),
+        }
+
+    def benchmark_monster_instances(self) -> dict:
+        monster_types: List[MonsterType] = MonsterType.get_spawnable_monster_types()
+        spawn_order: List[MonsterType] = [monster_types[index % len(monster_types)] for index in range(self.monster_count)]
+
+        seconds: float = min(self.time_monster_construction(spawn_order) for _ in range(self.repeat))
+
+        tracemalloc.start()
+        try:
+            start_bytes: int = tracemalloc.get_traced_memory()[0]
+            monsters: List[Monster] = [Monster(monster_type) for monster_type in spawn_order]
+            # The list holding them isn't part of a monster
+            total_bytes: int = tracemalloc.get_traced_memory()[0] - start_bytes - sys.getsizeof(monsters)
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "monsters": len(monsters),
+            "seconds": seconds,
+            "monsters_per_second": len(monsters) / seconds,
+            "bytes_per_monster": total_bytes / len(monsters),
+        }
+
+    @staticmethod
+    def time_monster_construction(spawn_order: List[MonsterType]) -> float:
+        start_time: float = time.perf_counter()
+        for monster_type in spawn_order:
+            Monster(monster_type)
+        return time.perf_counter() - start_time
+
+    def benchmark_weapon_table(self) -> dict:
+        # Every weapon wears down by 1 and a random tenth of them, some more than once, wear more and get the kills
+        generator: np.random.Generator = np.random.default_rng(self.seed)
+        weapon_table: WeaponTable = WeaponTable()
+        weapon_table.add_type_indexes(generator.integers(0, len(WeaponRegistry.catalog), self.weapon_count))
+        used_handles: np.ndarray = generator.choice(weapon_table.get_handles(), self.weapon_count // 10)
+
+        start_time: float = time.perf_counter()
+        weapon_table.wear(1)
+        weapon_table.wear(4, used_handles)
+        weapon_table.add_kills(1, used_handles)
+        seconds: float = time.perf_counter() - start_time
+
+        return {
+            "weapons": len(weapon_table),
+            "seconds": seconds,
+            "weapon_updates_per_second": (len(weapon_table) + 2 * len(used_handles)) / seconds,
+            "saved_bytes_per_weapon": len(weapon_table.to_bytes()) / len(weapon_table),
+        }
+
+    @staticmethod
+    def compare(baseline: dict, current: dict, threshold: float) -> tuple:
+        """Compares every metric two results share.
+
+        Returns:
+            A tuple of (report lines, regressions), where regressions are the lines of metrics that got worse by more
+            than the threshold fraction.
+        """
+        lines: List[str] = []
+        regressions: List[str] = []
+        for benchmark_name, metrics in current["benchmarks"].items():
+            baseline_metrics: dict = baseline.get("benchmarks", {}).get(benchmark_name, {})
+            for metric_name, direction in BattleBenchmark.metric_directions.items():
+                if metric_name not in metrics or not baseline_metrics.get(metric_name):
+                    continue
+
+                change: float = metrics[metric_name] / baseline_metrics[metric_name] - 1
+                line: str = f"{benchmark_name}.{metric_name}: {baseline_metrics[metric_name]:,.2f} -> {metrics[metric_name]:,.2f} ({change:+.1%})"
+                lines.append(line)
+                if change * direction < -threshold:
+                    regressions.append(line)
+        return lines, regressions
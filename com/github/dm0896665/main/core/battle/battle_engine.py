@@ -0,0 +1,227 @@
+from typing import Dict, List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_result import BattleResult, BattleReward
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.monster.monster import Monster
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
+
+
+class BattleEngine:
+    """Resolves the rules of a battle without touching the UI.
+
+    The Battle screen drives the engine one round at a time with the player's menu choice and renders the returned
+    BattleRound, while headless callers hand it a BattlePolicy and call fight() to resolve the whole battle at once.
+    When given a BattleJournal every round and the final reward are recorded to it. A MonsterGroup is fought with
+    every hit and counter-attack of the swarm resolved at once on the session's NumPy generator.
+    """
+    run_away_damage: int = 150
+    practice_xp: int = 10
+    crit_chance: float = 0.25
+    # A swarm's draws crit on 1 of every crit_draws outcomes, so one draw picks both a hit's target or roll and its crit
+    crit_draws: int = round(1 / crit_chance)
+    # get_member_rolls by member attack rate
+    member_rolls: Dict[int, np.ndarray] = {}
+
+    def __init__(self, battle_session: BattleSession, player: Player = None, monster: Monster = None, battle_policy: BattlePolicy = None,
+                 battle_journal: BattleJournal = None):
+        self.battle_session: BattleSession = battle_session
+        self.battle_policy: BattlePolicy = battle_policy
+        self.battle_journal: BattleJournal = battle_journal
+
+        if player is not None:
+            self.battle_session.player = player
+        if monster is not None:
+            self.battle_session.monster = monster
+
+    def start(self):
+        if self.battle_journal is not None:
+            self.battle_journal.begin_battle(self.battle_session)
+        self.battle_session.battle_status = BattleStatus.IN_PROGRESS
+
+    def fight(self) -> BattleResult:
+        rounds: List[BattleRound] = []
+
+        self.start()
+        while self.battle_session.battle_status == BattleStatus.IN_PROGRESS:
+            rounds.append(self.run_battle_round())
+
+        return BattleResult(self.battle_session.battle_status, rounds, self.finish())
+
+    def run_battle_round(self, battle_action: BattleAction = None, weapon: Weapon = None) -> BattleRound:
+        # Let the policy decide when the caller didn't
+        if battle_action is None:
+            battle_action = self.battle_policy.choose_action(self.battle_session)
+
+        battle_round: BattleRound = BattleRound(self.battle_session.round, battle_action, self.battle_session.player.selected_weapon)
+
+        if battle_action.is_attack:
+            self.do_attack(battle_round)
+            self.do_monster_attack(battle_round)
+        else:
+            self.do_nonattack(battle_round, weapon)
+
+        self.battle_session.round += 1
+
+        # Record the state the round left the battle in
+        battle_round.player_health = self.battle_session.player.health
+        battle_round.monster_health = self.battle_session.monster.health
+        battle_round.battle_status = self.battle_session.battle_status
+
+        if self.battle_journal is not None:
+            self.battle_journal.record_round(battle_round, self.get_monster_count())
+        return battle_round
+
+    def get_monster_count(self) -> int:
+        # Members still standing, a single monster always counts as one
+        if isinstance(self.battle_session.monster, MonsterGroup):
+            return self.battle_session.monster.get_alive_count()
+        return 1
+
+    def do_attack(self, battle_round: BattleRound):
+        if isinstance(self.battle_session.monster, MonsterGroup):
+            self.do_swarm_attack(battle_round)
+            return
+
+        weapon: Weapon = battle_round.weapon
+
+        if battle_round.battle_action == BattleAction.FAST_ATTACK:
+            battle_round.number_of_attacks = self.battle_session.random.randint(1, weapon.attack_rate)
+            battle_round.is_crit = self.is_crit()
+            battle_round.damage = weapon.damage * battle_round.number_of_attacks * (2 if battle_round.is_crit else 1)
+        elif battle_round.battle_action == BattleAction.LARGE_ATTACK:
+            battle_round.attack_boost = self.battle_session.random.randint(0, weapon.damage * 3)
+            battle_round.damage = weapon.damage + battle_round.attack_boost
+
+        self.battle_session.monster.health -= battle_round.damage
+
+    def do_swarm_attack(self, battle_round: BattleRound):
+        weapon: Weapon = battle_round.weapon
+        monster_group: MonsterGroup = self.battle_session.monster
+        generator: np.random.Generator = self.battle_session.generator
+        alive_count: int = monster_group.get_alive_count()
+
+        # Fast attacks land every hit on a random member with its own crit, a large attack is one big hit. A fast
+        # attack's draw per hit picks its target out of crit_draws times the members alive, and the first of them crit
+        if battle_round.battle_action == BattleAction.FAST_ATTACK:
+            battle_round.number_of_attacks = self.battle_session.random.randint(1, weapon.attack_rate)
+            draws: np.ndarray = (generator.random(battle_round.number_of_attacks) * (alive_count * BattleEngine.crit_draws)).astype(np.int64)
+            is_crit: np.ndarray = draws < alive_count
+            crit_count: int = int(np.count_nonzero(is_crit))
+            hit_damage: np.ndarray = weapon.damage * (1 + is_crit)
+            battle_round.is_crit = crit_count > 0
+            battle_round.damage = weapon.damage * (battle_round.number_of_attacks + crit_count)
+        else:
+            battle_round.number_of_attacks = 1
+            battle_round.attack_boost = self.battle_session.random.randint(0, weapon.damage * 3)
+            draws = (generator.random(1) * alive_count).astype(np.int64)
+            battle_round.damage = weapon.damage + battle_round.attack_boost
+            hit_damage = np.array([battle_round.damage])
+
+        # Hits are aimed at members alive when the attack started, and whatever a hit has left once its member is dead
+        # carries on to the next members, so no damage is lost to a swarm
+        targets: np.ndarray = monster_group.get_alive_members()[draws % alive_count]
+        battle_round.monsters_killed = monster_group.take_hits(hit_damage, targets, battle_round.damage)
+
+    def is_crit(self) -> bool:
+        return self.battle_session.random.randint(0, 3) == 3
+
+    def do_nonattack(self, battle_round: BattleRound, weapon: Weapon = None):
+        match battle_round.battle_action:
+            case BattleAction.SWITCH_WEAPONS:
+                if weapon is None and self.battle_policy is not None:
+                    weapon = self.battle_policy.choose_weapon(self.battle_session)
+                if weapon is not None:
+                    WeaponUtil.select_weapon(weapon, self.battle_session.player)
+                    battle_round.weapon = weapon
+            case BattleAction.RUN:
+                self.run_away(battle_round)
+
+    def run_away(self, battle_round: BattleRound):
+        battle_round.run_damage = BattleEngine.run_away_damage
+        self.battle_session.player.health -= battle_round.run_damage
+        self.battle_session.battle_status = BattleStatus.RAN_AWAY
+
+    def do_monster_attack(self, battle_round: BattleRound):
+        monster: Monster | MonsterGroup = self.battle_session.monster
+
+        if monster.health <= 0:
+            self.battle_session.battle_status = BattleStatus.PLAYER_WON
+            return
+
+        if isinstance(monster, MonsterGroup):
+            self.do_swarm_monster_attack(battle_round)
+        else:
+            battle_round.monster_number_of_attacks = self.battle_session.random.randint(0, monster.attack_rate)
+            battle_round.is_monster_crit = self.is_crit()
+            battle_round.monster_damage = monster.attack * battle_round.monster_number_of_attacks * (2 if battle_round.is_monster_crit else 1)
+        self.battle_session.player.health -= battle_round.monster_damage
+
+        if self.battle_session.player.health <= 0:
+            self.battle_session.battle_status = BattleStatus.MONSTER_WON
+
+    def do_swarm_monster_attack(self, battle_round: BattleRound):
+        monster_group: MonsterGroup = self.battle_session.monster
+
+        # Every member still alive strikes back with its own number of attacks and crit, one draw per member picks both
+        member_rolls: np.ndarray = BattleEngine.get_member_rolls(monster_group.member_attack_rate)
+        draws: np.ndarray = (self.battle_session.generator.random(monster_group.get_alive_count()) * len(member_rolls)).astype(np.int64)
+        hits, crit_hits = member_rolls.take(draws, axis=0).sum(axis=0).tolist()
+        battle_round.monster_number_of_attacks = hits
+        battle_round.is_monster_crit = crit_hits > hits
+        battle_round.monster_damage = monster_group.member_attack * crit_hits
+
+    @staticmethod
+    def get_member_rolls(attack_rate: int) -> np.ndarray:
+        # Every equally likely roll of a swarm member as its hits and its hits with a crit doubling them, with the first
+        # of the crit_draws runs of 0 to attack_rate hits being the crits
+        member_rolls: np.ndarray = BattleEngine.member_rolls.get(attack_rate)
+        if member_rolls is None:
+            hits: np.ndarray = np.tile(np.arange(attack_rate + 1, dtype=np.int64), BattleEngine.crit_draws)
+            is_crit: np.ndarray = np.arange(len(hits)) <= attack_rate
+            member_rolls = np.stack([hits, hits * (1 + is_crit)], axis=1)
+            BattleEngine.member_rolls[attack_rate] = member_rolls
+        return member_rolls
+
+    def finish(self) -> BattleReward:
+        battle_reward: BattleReward = BattleReward()
+        match self.battle_session.battle_status:
+            case BattleStatus.PLAYER_WON:
+                battle_reward = self.player_won()
+            case BattleStatus.MONSTER_WON:
+                battle_reward = self.monster_won()
+
+        if self.battle_journal is not None:
+            self.battle_journal.end_battle(self.battle_session, battle_reward)
+        return battle_reward
+
+    def player_won(self) -> BattleReward:
+        player: Player = self.battle_session.player
+
+        if self.battle_session.is_practice:
+            player.score += BattleEngine.practice_xp
+            return BattleReward(0, BattleEngine.practice_xp)
+
+        monster: Monster = self.battle_session.monster
+        money: int = (((monster.get_original_health() + monster.attack) * monster.attack_rate) / 10) + 50
+        score: int = (monster.get_original_health() * self.battle_session.random.randint(0, monster.attack_rate)) + 100
+        weapon_drops: List[Weapon] = WeaponUtil.weapon_drop(monster, player, self.battle_session.random)
+
+        player.money += money
+        player.score += score
+        player.kills += 1
+        return BattleReward(money, score, weapon_drops)
+
+    def monster_won(self) -> BattleReward:
+        if not self.battle_session.is_practice:
+            self.battle_session.player.deaths += 1
+        return BattleReward()
@@ -0,0 +1,139 @@
+from typing import List
+
+from PySide6.QtCore import SignalInstance
+
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_result import BattleResult
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import Monster
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.monster.monster_spawner import MonsterSpawner
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class GrindResult:
+    def __init__(self, player: Player):
+        # Totals across every battle fought
+        self.battle_count: int = 0
+        self.wins: int = 0
+        self.ran_away: int = 0
+        self.money: float = 0
+        self.score: int = 0
+        self.kills: int = 0
+        self.deaths: int = 0
+        self.weapon_drops: List[Weapon] = []
+        self.new_weapons: List[Weapon] = []
+
+        # The player's state once the grind stopped
+        self.player_health: int = player.health
+        self.selected_weapon: Weapon = player.selected_weapon
+        self.weapons: List[Weapon] = list(player.weapons)
+
+    def add_battle(self, battle_result: BattleResult, player: Player):
+        self.battle_count += 1
+        match battle_result.battle_status:
+            case BattleStatus.PLAYER_WON:
+                self.wins += 1
+                self.kills += 1
+            case BattleStatus.MONSTER_WON:
+                self.deaths += 1
+            case BattleStatus.RAN_AWAY:
+                self.ran_away += 1
+
+        self.money += battle_result.battle_reward.money
+        self.score += battle_result.battle_reward.score
+        self.weapon_drops += battle_result.battle_reward.weapon_drops
+
+        self.player_health = player.health
+        self.selected_weapon = player.selected_weapon
+        self.weapons = list(player.weapons)
+
+    def apply(self, player: Player):
+        # Everything lands on the player at once, on the thread that owns it
+        player.money += self.money
+        player.score += self.score
+        player.kills += self.kills
+        player.deaths += self.deaths
+        player.health = self.player_health
+        player.weapons = list(self.weapons)
+        player.selected_weapon = self.selected_weapon
+
+    def __str__(self):
+        return ("Battles: " + str(self.battle_count) + ", Wins: " + str(self.wins) + ", Ran Away: " + str(self.ran_away)
+                + ", Deaths: " + str(self.deaths) + ", Coins: " + str(self.money) + ", Score: " + str(self.score)
+                + ", New Weapons: " + str(len(self.new_weapons)))
+
+
+class BattleGrinder:
+    """Fights battles back to back for a player off the UI thread.
+
+    The battles are fought by a stand-in copy of the player, so nothing the UI is bound to changes while the grind
+    runs. Monsters, rewards and weapon drops come from the same code as a normal battle, and the totals are returned
+    as a GrindResult to be applied to the real player in one go. Dropped weapons the player doesn't own yet join the
+    stand-in's inventory straight away so later drops are rolled against it.
+
+    :param player: The player to grind for, only read from
+    :param battle_count: The most battles to fight
+    :param battle_policy: How each battle is fought, defaults to BestAttackPolicy
+    :param stop_health: Stop starting new battles once the player's health is at or below this
+    :param seed: Seed for the battle sessions, so a grind can be reproduced
+    :param battle_journal: Journal to record every battle to
+    """
+
+    def __init__(self, player: Player, battle_count: int, battle_policy: BattlePolicy = None, stop_health: int = 0, seed: int = None,
+                 battle_journal: BattleJournal = None):
+        self.player: Player = player
+        self.battle_count: int = battle_count
+        self.battle_policy: BattlePolicy = battle_policy if battle_policy is not None else BestAttackPolicy()
+        self.stop_health: int = stop_health
+        self.seed: int = seed
+        self.battle_journal: BattleJournal = battle_journal
+        self.is_cancelled: bool = False
+
+    def cancel(self):
+        # Checked between battles, the battle in progress is always finished
+        self.is_cancelled = True
+
+    def grind(self, progress_callback: SignalInstance = None) -> GrindResult:
+        player: Player = self.create_stand_in_player()
+        grind_result: GrindResult = GrindResult(player)
+        last_progress: int = -1
+
+        for battle_session in BattleSession.spawn_sessions(self.battle_count, self.seed):
+            if self.is_cancelled or player.health <= self.stop_health:
+                break
+
+            monster: Monster | MonsterGroup = MonsterGroup.create_encounter(MonsterSpawner.default.spawn(player.level, battle_session.spawn_random))
+            battle_result: BattleResult = BattleEngine(battle_session, player, monster, self.battle_policy, self.battle_journal).fight()
+            for weapon in battle_result.battle_reward.weapon_drops:
+                if weapon != player.selected_weapon and weapon not in player.weapons:
+                    player.weapons.append(weapon)
+                    grind_result.new_weapons.append(weapon)
+            grind_result.add_battle(battle_result, player)
+
+            if battle_result.battle_status == BattleStatus.MONSTER_WON:
+                break
+
+            # Only report whole percents so a long grind doesn't flood the UI thread with signals
+            progress: int = 100 * grind_result.battle_count // self.battle_count
+            if progress_callback is not None and progress != last_progress:
+                progress_callback.emit(float(progress))
+                last_progress = progress
+
+        if progress_callback is not None:
+            progress_callback.emit(100.0)
+        return grind_result
+
+    def create_stand_in_player(self) -> Player:
+        player: Player = Player(self.player.name)
+        player.health = self.player.health
+        player.strength = self.player.strength
+        player.level = self.player.level
+        player.selected_weapon = self.player.selected_weapon
+        player.weapons = list(self.player.weapons)
+        return player
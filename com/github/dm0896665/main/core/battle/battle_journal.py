@@ -0,0 +1,153 @@
+import os
+import struct
+from typing import List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_result import BattleReward
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.util.save_load_util import SaveLoadUtil
+
+
+class BattleJournal:
+    """Append only binary log of every battle a profile fights.
+
+    Every record is the same fixed-size struct, so a journal can be read back in bulk with numpy. A battle is written as
+        START      seed, practice flag, selected weapon, monster type, swarm size and both starting healths
+        INVENTORY  one per weapon in Player.weapons, in order, so weapon drops can be replayed exactly
+        ROUND      one per BattleRound with the action, rolls, damage, crits, both healths and swarm members left afterwards
+        DROP       one per weapon the monster dropped
+        END        final status, round count, money and score
+    Records are buffered in memory while the battle runs and appended to the file when it ends. A journal without a
+    path never writes and keeps everything in its buffer.
+    """
+    ext: str = '.journal'
+
+    KIND_START: int = 0
+    KIND_INVENTORY: int = 1
+    KIND_ROUND: int = 2
+    KIND_DROP: int = 3
+    KIND_END: int = 4
+
+    FLAG_CRIT: int = 1
+    FLAG_MONSTER_CRIT: int = 2
+    FLAG_PRACTICE: int = 4
+
+    record_fields: List[tuple] = [
+        ("kind", "B", np.uint8), ("action", "B", np.uint8), ("weapon", "B", np.uint8), ("monster", "B", np.uint8),
+        ("status", "B", np.uint8), ("flags", "B", np.uint8),
+        ("round", "H", np.uint16), ("number_of_attacks", "H", np.uint16), ("monster_number_of_attacks", "H", np.uint16),
+        ("monster_count", "H", np.uint16),
+        ("attack_boost", "i", np.int32), ("damage", "i", np.int32), ("monster_damage", "i", np.int32),
+        ("run_damage", "i", np.int32), ("player_health", "i", np.int32), ("monster_health", "i", np.int32),
+        ("seed", "Q", np.uint64), ("score", "q", np.int64), ("money", "d", np.float64)]
+    record_struct: struct.Struct = struct.Struct("<" + "".join(field[1] for field in record_fields))
+    record_dtype: np.dtype = np.dtype([(field[0], "<" + np.dtype(field[2]).str[1:]) for field in record_fields])
+
+    # Enum members are stored by their index
+    weapons: List[Weapon] = list(Weapon)
+    monster_types: List[MonsterType] = list(MonsterType)
+    battle_actions: List[BattleAction] = list(BattleAction)
+    battle_statuses: List[BattleStatus] = list(BattleStatus)
+
+    def __init__(self, path: str = None):
+        self.path: str = path
+        self.buffer: bytearray = bytearray()
+
+    @staticmethod
+    def for_player(player: Player) -> "BattleJournal":
+        return BattleJournal(BattleJournal.get_path(player.name))
+
+    @staticmethod
+    def get_path(player_name: str) -> str:
+        return SaveLoadUtil.path + player_name + BattleJournal.ext
+
+    def write_record(self, kind: int, action: int = 0, weapon: int = 0, monster: int = 0, status: int = 0, flags: int = 0,
+                     round_number: int = 0, number_of_attacks: int = 0, monster_number_of_attacks: int = 0, monster_count: int = 0, attack_boost: int = 0,
+                     damage: int = 0, monster_damage: int = 0, run_damage: int = 0, player_health: int = 0, monster_health: int = 0,
+                     seed: int = 0, score: int = 0, money: float = 0):
+        self.buffer += BattleJournal.record_struct.pack(kind, action, weapon, monster, status, flags, round_number, number_of_attacks,
+                                                        monster_number_of_attacks, monster_count, attack_boost, damage, monster_damage, run_damage,
+                                                        player_health, monster_health, seed, score, money)
+
+    def begin_battle(self, battle_session: BattleSession):
+        player: Player = battle_session.player
+        flags: int = BattleJournal.FLAG_PRACTICE if battle_session.is_practice else 0
+
+        self.write_record(BattleJournal.KIND_START, weapon=BattleJournal.weapons.index(player.selected_weapon),
+                          monster=BattleJournal.monster_types.index(battle_session.monster.monster_type),
+                          status=BattleJournal.battle_statuses.index(battle_session.battle_status), flags=flags,
+                          monster_count=battle_session.monster.count, player_health=player.health, monster_health=battle_session.monster.health, seed=battle_session.seed)
+        for weapon in player.weapons:
+            self.write_record(BattleJournal.KIND_INVENTORY, weapon=BattleJournal.weapons.index(weapon))
+
+    def record_round(self, battle_round: BattleRound, monster_count: int = 1):
+        flags: int = (BattleJournal.FLAG_CRIT if battle_round.is_crit else 0) | (BattleJournal.FLAG_MONSTER_CRIT if battle_round.is_monster_crit else 0)
+
+        self.write_record(BattleJournal.KIND_ROUND, BattleJournal.battle_actions.index(battle_round.battle_action),
+                          BattleJournal.weapons.index(battle_round.weapon), 0, BattleJournal.battle_statuses.index(battle_round.battle_status),
+                          flags, battle_round.round_number, battle_round.number_of_attacks, battle_round.monster_number_of_attacks,
+                          monster_count, battle_round.attack_boost, battle_round.damage, battle_round.monster_damage, battle_round.run_damage,
+                          battle_round.player_health, battle_round.monster_health)
+
+    def end_battle(self, battle_session: BattleSession, battle_reward: BattleReward):
+        for weapon in battle_reward.weapon_drops:
+            self.write_record(BattleJournal.KIND_DROP, weapon=BattleJournal.weapons.index(weapon))
+
+        self.write_record(BattleJournal.KIND_END, status=BattleJournal.battle_statuses.index(battle_session.battle_status),
+                          round_number=battle_session.round, player_health=battle_session.player.health,
+                          monster_health=battle_session.monster.health, seed=battle_session.seed,
+                          score=battle_reward.score, money=battle_reward.money)
+        self.flush()
+
+    def flush(self):
+        if self.path is None or len(self.buffer) == 0:
+            return
+
+        directory: str = os.path.dirname(self.path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "ab") as journal_file:
+            journal_file.write(self.buffer)
+        self.buffer.clear()
+
+    def get_buffered_records(self) -> np.ndarray:
+        return np.frombuffer(bytes(self.buffer), BattleJournal.record_dtype)
+
+    @staticmethod
+    def read(path: str) -> np.ndarray:
+        # The whole journal as one structured array, ignoring a torn record at the end
+        if not os.path.exists(path):
+            return np.zeros(0, BattleJournal.record_dtype)
+
+        record_count: int = os.path.getsize(path) // BattleJournal.record_dtype.itemsize
+        return np.fromfile(path, BattleJournal.record_dtype, record_count)
+
+    @staticmethod
+    def split_battles(records: np.ndarray) -> List[np.ndarray]:
+        # One view per battle, from its START record up to (not including) the next one
+        starts: np.ndarray = np.flatnonzero(records["kind"] == BattleJournal.KIND_START)
+        ends: np.ndarray = np.append(starts[1:], len(records))
+        return [records[start:end] for start, end in zip(starts, ends)]
+
+    @staticmethod
+    def get_weapon(record: np.void) -> Weapon:
+        return BattleJournal.weapons[record["weapon"]]
+
+    @staticmethod
+    def get_monster_type(record: np.void) -> MonsterType:
+        return BattleJournal.monster_types[record["monster"]]
+
+    @staticmethod
+    def get_battle_action(record: np.void) -> BattleAction:
+        return BattleJournal.battle_actions[record["action"]]
+
+    @staticmethod
+    def get_battle_status(record: np.void) -> BattleStatus:
+        return BattleJournal.battle_statuses[record["status"]]
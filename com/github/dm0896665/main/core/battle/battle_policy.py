@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class BattlePolicy(ABC):
+    """Decides what the player does each round of a headless battle.
+
+    Sub-types live in core.battle.policies and only need to override choose_action.
+    choose_weapon is only asked when choose_action returns BattleAction.SWITCH_WEAPONS.
+    """
+
+    @abstractmethod
+    def choose_action(self, battle_session: BattleSession) -> BattleAction:
+        pass
+
+    def choose_weapon(self, battle_session: BattleSession) -> Weapon:
+        return battle_session.player.selected_weapon
@@ -0,0 +1,78 @@
+from typing import Callable, List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_result import BattleResult, BattleReward
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.journal_policy import JournalPolicy
+from com.github.dm0896665.main.core.monster.monster import Monster
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+
+
+class BattleReplay:
+    def __init__(self, battle_session: BattleSession, battle_result: BattleResult, mismatched_records: List[int]):
+        self.battle_session: BattleSession = battle_session
+        self.battle_result: BattleResult = battle_result
+        self.mismatched_records: List[int] = mismatched_records
+
+    def is_faithful(self) -> bool:
+        return len(self.mismatched_records) == 0
+
+
+class BattleReplayer:
+    """Re-runs journaled battles through BattleEngine.
+
+    The session seed, the player's starting health and weapons and the recorded actions are fed back into a fresh
+    engine, which journals the replay into memory so every record can be compared byte for byte with the original.
+    """
+
+    @staticmethod
+    def replay_battle(battle_records: np.ndarray, on_round: Callable[[BattleRound], None] = None) -> BattleReplay:
+        kinds: np.ndarray = battle_records["kind"]
+        start_record: np.void = battle_records[0]
+
+        # Rebuild the player and monster the way the battle found them
+        player: Player = Player()
+        player.health = int(start_record["player_health"])
+        player.selected_weapon = BattleJournal.get_weapon(start_record)
+        player.weapons = [BattleJournal.get_weapon(record) for record in battle_records[kinds == BattleJournal.KIND_INVENTORY]]
+        monster_count: int = int(start_record["monster_count"])
+        if monster_count > 1:
+            monster: Monster | MonsterGroup = MonsterGroup(BattleJournal.get_monster_type(start_record), monster_count)
+        else:
+            monster = Monster(BattleJournal.get_monster_type(start_record))
+            monster.health = int(start_record["monster_health"])
+
+        is_practice: bool = bool(start_record["flags"] & BattleJournal.FLAG_PRACTICE)
+        battle_session: BattleSession = BattleSession(is_practice, int(start_record["seed"]))
+        round_records: np.ndarray = battle_records[kinds == BattleJournal.KIND_ROUND]
+        replay_journal: BattleJournal = BattleJournal()
+        battle_engine: BattleEngine = BattleEngine(battle_session, player, monster, JournalPolicy(round_records), replay_journal)
+
+        rounds: List[BattleRound] = []
+        battle_engine.start()
+        for _ in range(len(round_records)):
+            if battle_session.battle_status != BattleStatus.IN_PROGRESS:
+                break
+            battle_round: BattleRound = battle_engine.run_battle_round()
+            rounds.append(battle_round)
+            if on_round is not None:
+                on_round(battle_round)
+
+        # Journals only hold finished battles, so the replay is finished the same way
+        battle_reward: BattleReward = battle_engine.finish()
+        battle_result: BattleResult = BattleResult(battle_session.battle_status, rounds, battle_reward)
+
+        return BattleReplay(battle_session, battle_result, BattleReplayer.compare_records(battle_records, replay_journal.get_buffered_records()))
+
+    @staticmethod
+    def compare_records(original_records: np.ndarray, replayed_records: np.ndarray) -> List[int]:
+        # Indexes of records that differ, with any missing or extra records counted as differing
+        common: int = min(len(original_records), len(replayed_records))
+        mismatched_records: List[int] = np.flatnonzero(original_records[:common] != replayed_records[:common]).tolist()
+        return mismatched_records + list(range(common, max(len(original_records), len(replayed_records))))
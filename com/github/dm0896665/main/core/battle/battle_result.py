@@ -0,0 +1,25 @@
+from typing import List
+
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class BattleReward:
+    def __init__(self, money: int = 0, score: int = 0, weapon_drops: List[Weapon] = None):
+        self.money: int = money
+        self.score: int = score
+        self.weapon_drops: List[Weapon] = weapon_drops if weapon_drops is not None else []
+
+
+class BattleResult:
+    def __init__(self, battle_status: BattleStatus, rounds: List[BattleRound], battle_reward: BattleReward):
+        self.battle_status: BattleStatus = battle_status
+        self.rounds: List[BattleRound] = rounds
+        self.battle_reward: BattleReward = battle_reward
+
+    def get_round_count(self) -> int:
+        return len(self.rounds)
+
+    def is_player_won(self) -> bool:
+        return self.battle_status == BattleStatus.PLAYER_WON
@@ -0,0 +1,34 @@
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class BattleRound:
+    def __init__(self, round_number: int, battle_action: BattleAction, weapon: Weapon):
+        # What the player did this round
+        self.round_number: int = round_number
+        self.battle_action: BattleAction = battle_action
+        self.weapon: Weapon = weapon
+
+        # The player's attack
+        self.number_of_attacks: int = 0
+        self.attack_boost: int = 0
+        self.damage: int = 0
+        self.is_crit: bool = False
+        self.monsters_killed: int = 0
+
+        # The monster's counter-attack (or the parting hit when running away)
+        self.monster_number_of_attacks: int = 0
+        self.monster_damage: int = 0
+        self.is_monster_crit: bool = False
+        self.run_damage: int = 0
+
+        # State after the round was resolved
+        self.player_health: int = 0
+        self.monster_health: int = 0
+        self.battle_status: BattleStatus = BattleStatus.IN_PROGRESS
+
+    def __str__(self):
+        return ("Round " + str(self.round_number) + ": " + str(self.battle_action) + " with " + self.weapon.weapon_name
+                + ", Damage: " + str(self.damage) + ", Monster Damage: " + str(self.monster_damage + self.run_damage)
+                + ", Player Health: " + str(self.player_health) + ", Monster Health: " + str(self.monster_health))
@@ -0,0 +1,55 @@
+import random
+import secrets
+from typing import List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.monster.monster import Monster
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+
+
+class BattleSession:
+    def __init__(self, is_practice: bool = False, seed: int = None):
+        self.monster: Monster | MonsterGroup = None
+        self.player: Player = None
+        self.is_practice: bool = is_practice
+        self.fail: int = 0
+        self.round: int = 0
+        self.battle_status: BattleStatus = BattleStatus.READY
+        self.fast_attack_shown: bool = True
+        self.large_attack_shown: bool = True
+        self.choices_shown: bool = True
+        self.switch_weapons_shown: bool = True
+        self.view_stats_shown: bool = True
+        self.run_shown: bool = True
+        self.attacked_shown: bool = True
+
+        # Every session rolls from its own stream, so a battle can be replayed from its seed. Picking the monster
+        # has a stream of its own so the battle rolls don't depend on how the monster was chosen
+        self.seed: int = seed if seed is not None else secrets.randbits(64)
+        self.random: random.Random = random.Random(self.seed)
+        self.spawn_random: random.Random = random.Random(str(self.seed) + ":spawn")
+
+        # Swarm encounters roll every hit at once, which needs a NumPy stream
+        self.generator: np.random.Generator = np.random.default_rng(np.random.SeedSequence(self.seed))
+
+        if is_practice:
+            self.fast_attack_shown = False
+            self.large_attack_shown = False
+            self.choices_shown = False
+            self.switch_weapons_shown = False
+            self.view_stats_shown = False
+            self.run_shown: bool = False
+            self.attacked_shown = False
+
+    def spawn_generators(self, count: int) -> List[np.random.Generator]:
+        # Independent NumPy streams derived from the session seed, e.g. one per simulation worker
+        return [np.random.default_rng(seed_sequence) for seed_sequence in np.random.SeedSequence(self.seed).spawn(count)]
+
+    @staticmethod
+    def spawn_sessions(count: int, seed: int = None, is_practice: bool = False) -> List["BattleSession"]:
+        # Sessions with independent, reproducible seeds for running many battles side by side
+        seed_sequences: list = np.random.SeedSequence(seed).spawn(count)
+        return [BattleSession(is_practice, int(seed_sequence.generate_state(1, np.uint64)[0])) for seed_sequence in seed_sequences]
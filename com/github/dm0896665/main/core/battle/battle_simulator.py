@@ -0,0 +1,193 @@
+from typing import List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.monster.monster_batch import MonsterBatch
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class BattleSimulation:
+    """Outcome of many simulated battles of one weapon against one monster type.
+
+    Every array holds one entry per simulated battle.
+    """
+
+    def __init__(self, weapon: Weapon, monster_type: MonsterType, battle_action: BattleAction, player_health: int,
+                 is_player_won: np.ndarray, rounds: np.ndarray, player_health_remaining: np.ndarray, monster_health_remaining: np.ndarray):
+        self.weapon: Weapon = weapon
+        self.monster_type: MonsterType = monster_type
+        self.battle_action: BattleAction = battle_action
+        self.player_health: int = player_health
+        self.is_player_won: np.ndarray = is_player_won
+        self.rounds: np.ndarray = rounds
+        self.player_health_remaining: np.ndarray = player_health_remaining
+        self.monster_health_remaining: np.ndarray = monster_health_remaining
+
+    def get_battle_count(self) -> int:
+        return len(self.is_player_won)
+
+    def get_win_rate(self) -> float:
+        return float(self.is_player_won.mean())
+
+    def get_mean_rounds(self) -> float:
+        return float(self.rounds.mean())
+
+    def get_player_health_histogram(self, bin_count: int = 10) -> np.ndarray:
+        # Health left over after won battles, bucketed from 0 up to the starting health
+        won_health: np.ndarray = self.player_health_remaining[self.is_player_won]
+        return np.histogram(won_health, bin_count, (0, self.player_health))[0]
+
+
+class BattleSimulationMatrix:
+    """Per matchup outcome statistics over a Weapon x MonsterType grid.
+
+    Row i is weapons[i] and column j is monster_types[j].
+    """
+
+    def __init__(self, weapons: List[Weapon], monster_types: List[MonsterType], battle_count: int, player_health: int, bin_count: int):
+        shape: tuple = (len(weapons), len(monster_types))
+        self.weapons: List[Weapon] = weapons
+        self.monster_types: List[MonsterType] = monster_types
+        self.battle_count: int = battle_count
+        self.player_health: int = player_health
+        self.win_rate: np.ndarray = np.zeros(shape)
+        self.mean_rounds: np.ndarray = np.zeros(shape)
+        self.mean_player_health_remaining: np.ndarray = np.zeros(shape)
+        self.player_health_histogram: np.ndarray = np.zeros(shape + (bin_count,), np.int64)
+
+    def get_win_rate(self, weapon: Weapon, monster_type: MonsterType) -> float:
+        return float(self.win_rate[self.weapons.index(weapon), self.monster_types.index(monster_type)])
+
+    def get_mean_rounds(self, weapon: Weapon, monster_type: MonsterType) -> float:
+        return float(self.mean_rounds[self.weapons.index(weapon), self.monster_types.index(monster_type)])
+
+
+class BattleSimulator:
+    """Runs many battles at once as NumPy arrays using the same rules as BattleEngine.
+
+    Each simulated battle repeats a single attack style every round:
+        fast attack     weapon damage * randint(1, attack rate), with a 25% chance of a 2x crit
+        large attack    weapon damage + randint(0, 3 * weapon damage)
+        counter-attack  monster attack * randint(0, monster attack rate), with a 25% chance of a 2x crit
+
+    :param player_health: The health the player starts every battle with
+    :param battle_action: BattleAction.FAST_ATTACK or BattleAction.LARGE_ATTACK, or None to use BestAttackPolicy's pick for each weapon
+    :param generator: The NumPy generator to draw rolls from
+    """
+    max_rounds: int = 10000
+    crit_chance: float = 0.25
+
+    def __init__(self, player_health: int = 1000, battle_action: BattleAction = None, generator: np.random.Generator = None):
+        self.player_health: int = player_health
+        self.battle_action: BattleAction = battle_action
+        self.generator: np.random.Generator = generator if generator is not None else np.random.default_rng()
+
+    def get_battle_action(self, weapon: Weapon) -> BattleAction:
+        if self.battle_action is None:
+            return BestAttackPolicy.get_best_attack(weapon)
+        return self.battle_action
+
+    def simulate(self, weapon: Weapon, monster_type: MonsterType, battle_count: int) -> BattleSimulation:
+        battle_action: BattleAction = self.get_battle_action(weapon)
+        ones: np.ndarray = np.ones(battle_count, np.int64)
+
+        is_player_won, rounds, player_health, monster_health = self.simulate_battles(
+            ones * weapon.damage, ones * weapon.attack_rate, ones * (battle_action == BattleAction.FAST_ATTACK),
+            ones * monster_type.health, ones * monster_type.attack, ones * monster_type.attack_rate, self.player_health)
+
+        return BattleSimulation(weapon, monster_type, battle_action, self.player_health, is_player_won, rounds, player_health, monster_health)
+
+    def simulate_matrix(self, battle_count: int, weapons: List[Weapon] = None, monster_types: List[MonsterType] = None, bin_count: int = 10) -> BattleSimulationMatrix:
+        if weapons is None:
+            weapons = list(Weapon)
+        if monster_types is None:
+            monster_types = list(MonsterType)
+
+        matrix: BattleSimulationMatrix = BattleSimulationMatrix(weapons, monster_types, battle_count, self.player_health, bin_count)
+
+        # Every monster type is simulated battle_count times in one flat batch per weapon
+        monster_health: np.ndarray = np.repeat([monster_type.health for monster_type in monster_types], battle_count)
+        monster_attack: np.ndarray = np.repeat([monster_type.attack for monster_type in monster_types], battle_count)
+        monster_attack_rate: np.ndarray = np.repeat([monster_type.attack_rate for monster_type in monster_types], battle_count)
+        ones: np.ndarray = np.ones(len(monster_health), np.int64)
+
+        for weapon_index, weapon in enumerate(weapons):
+            is_fast_attack: bool = self.get_battle_action(weapon) == BattleAction.FAST_ATTACK
+            is_player_won, rounds, player_health, _ = self.simulate_battles(
+                ones * weapon.damage, ones * weapon.attack_rate, ones * is_fast_attack,
+                monster_health, monster_attack, monster_attack_rate, self.player_health)
+
+            # Reshape back to one row of battles per monster type
+            is_player_won = is_player_won.reshape(len(monster_types), battle_count)
+            rounds = rounds.reshape(len(monster_types), battle_count)
+            player_health = player_health.reshape(len(monster_types), battle_count)
+
+            matrix.win_rate[weapon_index] = is_player_won.mean(axis=1)
+            matrix.mean_rounds[weapon_index] = rounds.mean(axis=1)
+            matrix.mean_player_health_remaining[weapon_index] = np.where(is_player_won, player_health, 0).mean(axis=1)
+            for monster_index in range(len(monster_types)):
+                won_health: np.ndarray = player_health[monster_index][is_player_won[monster_index]]
+                matrix.player_health_histogram[weapon_index, monster_index] = np.histogram(won_health, bin_count, (0, self.player_health))[0]
+
+        return matrix
+
+    def simulate_monster_batch(self, weapon_damage: np.ndarray, weapon_attack_rate: np.ndarray, is_fast_attack: np.ndarray,
+                               monster_batch: MonsterBatch, player_health: int | np.ndarray) -> tuple:
+        """Fights one battle against every monster in the batch, leaving each monster's remaining health in the batch.
+
+        Returns:
+            A tuple of (is_player_won, rounds, player_health_remaining) arrays.
+        """
+        is_player_won, rounds, player_health, monster_batch.health = self.simulate_battles(
+            weapon_damage, weapon_attack_rate, is_fast_attack, monster_batch.health, monster_batch.attack, monster_batch.attack_rate, player_health)
+        return is_player_won, rounds, player_health
+
+    def simulate_battles(self, weapon_damage: np.ndarray, weapon_attack_rate: np.ndarray, is_fast_attack: np.ndarray,
+                         monster_health: np.ndarray, monster_attack: np.ndarray, monster_attack_rate: np.ndarray,
+                         player_health: int | np.ndarray) -> tuple:
+        """Resolves one battle per array entry until every battle has a winner.
+
+        All arguments are per battle arrays of the same length (player_health may also be a single starting health).
+
+        Returns:
+            A tuple of (is_player_won, rounds, player_health_remaining, monster_health_remaining) arrays.
+        """
+        battle_count: int = len(monster_health)
+        monster_health = np.array(monster_health, np.int64)
+        player_health = np.broadcast_to(np.asarray(player_health, np.int64), (battle_count,)).copy()
+        is_fast_attack = np.asarray(is_fast_attack, bool)
+        is_player_won: np.ndarray = np.zeros(battle_count, bool)
+        rounds: np.ndarray = np.zeros(battle_count, np.int64)
+
+        # Indexes of the battles that are still being fought
+        active: np.ndarray = np.arange(battle_count)
+        round_number: int = 0
+        while len(active) > 0 and round_number < BattleSimulator.max_rounds:
+            round_number += 1
+            rounds[active] = round_number
+
+            # Player attacks
+            damage: np.ndarray = weapon_damage[active]
+            fast: np.ndarray = is_fast_attack[active]
+            number_of_attacks: np.ndarray = self.generator.integers(1, weapon_attack_rate[active] + 1)
+            is_crit: np.ndarray = self.generator.random(len(active)) < BattleSimulator.crit_chance
+            attack_boost: np.ndarray = self.generator.integers(0, damage * 3 + 1)
+            damage = np.where(fast, damage * number_of_attacks * (1 + is_crit), damage + attack_boost)
+            monster_health[active] -= damage
+
+            # Monsters that were killed don't strike back
+            is_monster_dead: np.ndarray = monster_health[active] <= 0
+            is_player_won[active[is_monster_dead]] = True
+            active = active[~is_monster_dead]
+
+            # Monster counter-attacks
+            monster_hits: np.ndarray = self.generator.integers(0, monster_attack_rate[active] + 1)
+            is_monster_crit: np.ndarray = self.generator.random(len(active)) < BattleSimulator.crit_chance
+            player_health[active] -= monster_attack[active] * monster_hits * (1 + is_monster_crit)
+
+            active = active[player_health[active] > 0]
+
+        return is_player_won, rounds, player_health, monster_health
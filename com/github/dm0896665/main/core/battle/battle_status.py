@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class BattleStatus(Enum):
+    READY = "Ready"
+    IN_PROGRESS = "In Progress"
+    PLAYER_WON = "Player Won"
+    MONSTER_WON = "Monster Won"
+    RAN_AWAY = "Ran Away"
+
+    def __new__(cls, *args, **kwds):
+        obj = object.__new__(cls)
+        obj._value_ = args[0]
+        return obj
+
+    def __init__(self, battle_status: str):
+        self.battle_status = battle_status
+
+    def __str__(self):
+        return self.battle_status
+
+    def get_battle_status(self):
+        return self.battle_status
+
+    @property
+    def is_finished(self) -> bool:
+        return self not in (BattleStatus.READY, BattleStatus.IN_PROGRESS)
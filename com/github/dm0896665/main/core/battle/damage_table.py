@@ -0,0 +1,138 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class DamageDistribution:
+    """Probability mass function of the damage done by one attack (or several rounds of attacks).
+
+    pmf[damage] is the chance of doing exactly that much damage.
+    """
+
+    def __init__(self, pmf: np.ndarray):
+        self.pmf: np.ndarray = pmf
+        self.pmf.setflags(write=False)
+
+        # Only the damage values that can happen, used for sampling and sparse sums
+        self.damage: np.ndarray = np.flatnonzero(pmf)
+        self.probability: np.ndarray = pmf[self.damage]
+        self.cdf: np.ndarray = np.cumsum(self.probability)
+        self.cdf[-1] = 1.0
+
+    def get_probability(self, damage: int) -> float:
+        if 0 <= damage < len(self.pmf):
+            return float(self.pmf[damage])
+        return 0.0
+
+    def get_expected_damage(self) -> float:
+        return float(self.damage @ self.probability)
+
+    def get_min_damage(self) -> int:
+        return int(self.damage[0])
+
+    def get_max_damage(self) -> int:
+        return int(self.damage[-1])
+
+    def sample(self, size: int | tuple, generator: np.random.Generator) -> np.ndarray:
+        # Inverse transform sampling off the cumulative distribution
+        return self.damage[np.searchsorted(self.cdf, generator.random(size), side="right")]
+
+    def convolve(self, other: "DamageDistribution") -> "DamageDistribution":
+        return DamageDistribution(np.convolve(self.pmf, other.pmf))
+
+
+class DamageTable:
+    """Damage distributions for every weapon attack and monster counter-attack, built once on first use.
+
+    The distributions follow the same rules as BattleEngine:
+        fast attack     weapon damage * randint(1, attack rate), with a 25% chance of a 2x crit
+        large attack    weapon damage + randint(0, 3 * weapon damage)
+        counter-attack  monster attack * randint(0, monster attack rate), with a 25% chance of a 2x crit
+    """
+    crit_chance: float = 0.25
+    _fast_attacks: Dict[Weapon, DamageDistribution] = None
+    _large_attacks: Dict[Weapon, DamageDistribution] = None
+    _counter_attacks: Dict[MonsterType, DamageDistribution] = None
+    _multi_round_attacks: Dict[Tuple[Weapon, BattleAction, int], DamageDistribution] = {}
+
+    @staticmethod
+    def build():
+        DamageTable._fast_attacks = {weapon: DamageTable.create_fast_attack_distribution(weapon) for weapon in Weapon}
+        DamageTable._large_attacks = {weapon: DamageTable.create_large_attack_distribution(weapon) for weapon in Weapon}
+        DamageTable._counter_attacks = {monster_type: DamageTable.create_counter_attack_distribution(monster_type) for monster_type in MonsterType}
+
+    @staticmethod
+    def is_built() -> bool:
+        return DamageTable._counter_attacks is not None
+
+    @staticmethod
+    def get_attack_distribution(weapon: Weapon, battle_action: BattleAction) -> DamageDistribution:
+        if not DamageTable.is_built():
+            DamageTable.build()
+
+        if battle_action == BattleAction.LARGE_ATTACK:
+            return DamageTable._large_attacks[weapon]
+        return DamageTable._fast_attacks[weapon]
+
+    @staticmethod
+    def get_counter_attack_distribution(monster_type: MonsterType) -> DamageDistribution:
+        if not DamageTable.is_built():
+            DamageTable.build()
+
+        return DamageTable._counter_attacks[monster_type]
+
+    @staticmethod
+    def get_multi_round_attack_distribution(weapon: Weapon, battle_action: BattleAction, rounds: int) -> DamageDistribution:
+        # Total damage over a number of rounds, built by repeated squaring of the single round distribution
+        key: Tuple[Weapon, BattleAction, int] = (weapon, battle_action, rounds)
+        if key in DamageTable._multi_round_attacks:
+            return DamageTable._multi_round_attacks[key]
+
+        if rounds <= 1:
+            return DamageTable.get_attack_distribution(weapon, battle_action)
+
+        half: DamageDistribution = DamageTable.get_multi_round_attack_distribution(weapon, battle_action, rounds // 2)
+        distribution: DamageDistribution = half.convolve(half)
+        if rounds % 2 == 1:
+            distribution = distribution.convolve(DamageTable.get_attack_distribution(weapon, battle_action))
+
+        DamageTable._multi_round_attacks[key] = distribution
+        return distribution
+
+    @staticmethod
+    def get_expected_damage(weapon: Weapon, battle_action: BattleAction) -> float:
+        return DamageTable.get_attack_distribution(weapon, battle_action).get_expected_damage()
+
+    @staticmethod
+    def sample_attack(weapon: Weapon, battle_action: BattleAction, size: int | tuple, generator: np.random.Generator) -> np.ndarray:
+        return DamageTable.get_attack_distribution(weapon, battle_action).sample(size, generator)
+
+    @staticmethod
+    def sample_counter_attack(monster_type: MonsterType, size: int | tuple, generator: np.random.Generator) -> np.ndarray:
+        return DamageTable.get_counter_attack_distribution(monster_type).sample(size, generator)
+
+    @staticmethod
+    def create_fast_attack_distribution(weapon: Weapon) -> DamageDistribution:
+        pmf: np.ndarray = np.zeros(weapon.damage * weapon.attack_rate * 2 + 1)
+        number_of_attacks: np.ndarray = np.arange(1, weapon.attack_rate + 1)
+        pmf[weapon.damage * number_of_attacks] += (1 - DamageTable.crit_chance) / weapon.attack_rate
+        pmf[weapon.damage * number_of_attacks * 2] += DamageTable.crit_chance / weapon.attack_rate
+        return DamageDistribution(pmf)
+
+    @staticmethod
+    def create_large_attack_distribution(weapon: Weapon) -> DamageDistribution:
+        pmf: np.ndarray = np.zeros(weapon.damage * 4 + 1)
+        pmf[weapon.damage:] = 1 / (weapon.damage * 3 + 1)
+        return DamageDistribution(pmf)
+
+    @staticmethod
+    def create_counter_attack_distribution(monster_type: MonsterType) -> DamageDistribution:
+        pmf: np.ndarray = np.zeros(monster_type.attack * monster_type.attack_rate * 2 + 1)
+        number_of_attacks: np.ndarray = np.arange(0, monster_type.attack_rate + 1)
+        pmf[monster_type.attack * number_of_attacks] += (1 - DamageTable.crit_chance) / (monster_type.attack_rate + 1)
+        pmf[monster_type.attack * number_of_attacks * 2] += DamageTable.crit_chance / (monster_type.attack_rate + 1)
+        return DamageDistribution(pmf)
@@ -0,0 +1,210 @@
+import difflib
+import inspect
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+
+
+class DifficultyCurve:
+    """The win rate a monster should give a player at the level it first spawns at.
+
+    The curve is linear between (level, win rate) points. A player at a level is assumed to carry the weapon that
+    level's share of the way through the Weapon catalog, so the first levels fight with a Stick and level 100 with a
+    Heavy Crossbow.
+
+    :param points: (level, target win rate) pairs, in level order
+    :param player_health: The health the player starts every battle with
+    """
+    default_points: List[tuple] = [(1, 0.95), (50, 0.8), (100, 0.6)]
+
+    def __init__(self, points: List[tuple] = None, player_health: int = 1000):
+        self.points: List[tuple] = points if points is not None else DifficultyCurve.default_points
+        self.player_health: int = player_health
+
+    def get_target_win_rate(self, level: int) -> float:
+        return float(np.interp(level, [point[0] for point in self.points], [point[1] for point in self.points]))
+
+    @staticmethod
+    def get_reference_weapon(level: int) -> Weapon:
+        weapons: Tuple[Weapon, ...] = WeaponRegistry.catalog
+        return weapons[min(len(weapons) - 1, (level - 1) * len(weapons) // 100)]
+
+    @staticmethod
+    def get_debut_level(monster_type: MonsterType) -> int:
+        # The first level whose spawn pool, as picked by Monster.get_random_monster_type, holds the monster type
+        monster_index: int = monster_type.get_spawn_index()
+        for level in range(1, 101):
+            if Monster.get_max_monster_index(level) >= monster_index:
+                return level
+        return 100
+
+
+class MonsterFit:
+    """Stats proposed for one monster type, next to the stats it has now."""
+
+    def __init__(self, monster_type: MonsterType, debut_level: int, weapon: Weapon, target_win_rate: float,
+                 original_win_rate: float, health: int, attack: int, attack_rate: int, win_rate: float, evaluations: int):
+        self.monster_type: MonsterType = monster_type
+        self.debut_level: int = debut_level
+        self.weapon: Weapon = weapon
+        self.target_win_rate: float = target_win_rate
+        self.original_win_rate: float = original_win_rate
+        self.health: int = health
+        self.attack: int = attack
+        self.attack_rate: int = attack_rate
+        self.win_rate: float = win_rate
+        self.evaluations: int = evaluations
+
+    def is_changed(self) -> bool:
+        return (self.health, self.attack, self.attack_rate) != (self.monster_type.health, self.monster_type.attack, self.monster_type.attack_rate)
+
+
+class DifficultyFit:
+    """Proposed stats for every spawnable monster type, with a report and a diff against the MonsterType catalog."""
+
+    def __init__(self, difficulty_curve: DifficultyCurve, monster_fits: List[MonsterFit]):
+        self.difficulty_curve: DifficultyCurve = difficulty_curve
+        self.monster_fits: List[MonsterFit] = monster_fits
+
+    def get_report(self) -> str:
+        lines: List[str] = ["monster,debut_level,weapon,target,win_rate_before,win_rate_after,health,attack,attack_rate"]
+        for monster_fit in self.monster_fits:
+            monster_type: MonsterType = monster_fit.monster_type
+            lines.append(f"{monster_type.monster_name},{monster_fit.debut_level},{monster_fit.weapon.weapon_name},{monster_fit.target_win_rate:.3f},"
+                         f"{monster_fit.original_win_rate:.3f},{monster_fit.win_rate:.3f},"
+                         f"{monster_type.health}->{monster_fit.health},{monster_type.attack}->{monster_fit.attack},{monster_type.attack_rate}->{monster_fit.attack_rate}")
+        return "\n".join(lines)
+
+    def get_catalog_diff(self) -> str:
+        # Rewrite each changed MonsterType line in monster.py and diff it against the file as it is
+        path: str = inspect.getsourcefile(MonsterType)
+        with open(path) as source_file:
+            source_lines: List[str] = source_file.readlines()
+
+        proposed_lines: List[str] = list(source_lines)
+        for monster_fit in self.monster_fits:
+            if not monster_fit.is_changed():
+                continue
+            monster_type: MonsterType = monster_fit.monster_type
+            prefix: str = "    " + monster_type.name + " = "
+            for line_index, line in enumerate(source_lines):
+                if line.startswith(prefix):
+                    proposed_lines[line_index] = (prefix + '"' + monster_type.monster_name + '", ' + str(monster_fit.health) + ", "
+                                                  + str(monster_fit.attack) + ", " + str(monster_fit.attack_rate) + "\n")
+                    break
+
+        relative_path: str = os.path.relpath(path)
+        return "".join(difflib.unified_diff(source_lines, proposed_lines, "a/" + relative_path, "b/" + relative_path))
+
+
+class DifficultySolver:
+    """Searches for MonsterType stats that give the win rates a DifficultyCurve asks for.
+
+    Every spawnable monster type is fit on its own in a process pool, against the reference weapon of the level it
+    first spawns at. The fit is a coordinate descent over health, attack and attack rate: each pass tries one step up
+    and down on every stat, keeps any step that lowers the loss and halves the step once none does. The loss is the
+    squared miss of the target win rate plus a small pull towards the current stats, so the search changes a
+    monster no more than it has to. Every candidate is scored on the same seeded battles, which keeps the
+    comparisons between candidates free of most of the simulation noise. Swarms are fit as the single monster their
+    member stats are balanced against.
+
+    :param difficulty_curve: The target win rates
+    :param battles_per_evaluation: Battles simulated to score each candidate
+    :param closeness: Weight of the pull towards the current stats, per squared log of each stat's ratio
+    :param seed: Seed for the battles, so a fit can be reproduced
+    :param max_workers: Worker processes to use, defaults to the number of cores
+    """
+    health_step: int = 50
+    attack_step: int = 5
+    min_log_step: float = 0.01
+
+    def __init__(self, difficulty_curve: DifficultyCurve = None, battles_per_evaluation: int = 4000, closeness: float = 0.001,
+                 seed: int = None, max_workers: int = None):
+        self.difficulty_curve: DifficultyCurve = difficulty_curve if difficulty_curve is not None else DifficultyCurve()
+        self.battles_per_evaluation: int = battles_per_evaluation
+        self.closeness: float = closeness
+        self.seed: int = seed
+        self.max_workers: int = max_workers if max_workers is not None else os.cpu_count()
+
+    def solve(self, monster_types: List[MonsterType] = None) -> DifficultyFit:
+        if monster_types is None:
+            monster_types = MonsterType.get_spawnable_monster_types()
+
+        # One independent battle stream per monster type
+        seed_sequences: list = np.random.SeedSequence(self.seed).spawn(len(monster_types))
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            monster_fits: List[MonsterFit] = list(executor.map(self.fit_monster, monster_types, seed_sequences))
+
+        return DifficultyFit(self.difficulty_curve, monster_fits)
+
+    def fit_monster(self, monster_type: MonsterType, seed_sequence: np.random.SeedSequence) -> MonsterFit:
+        debut_level: int = DifficultyCurve.get_debut_level(monster_type)
+        weapon: Weapon = DifficultyCurve.get_reference_weapon(debut_level)
+        target_win_rate: float = self.difficulty_curve.get_target_win_rate(debut_level)
+        original: np.ndarray = np.array([monster_type.health, monster_type.attack, monster_type.attack_rate], np.float64)
+        evaluations: int = 0
+
+        def get_loss(stats: tuple) -> tuple:
+            nonlocal evaluations
+            evaluations += 1
+            win_rate: float = self.get_win_rate(weapon, stats, seed_sequence)
+            drift: float = float((np.log(np.array(stats) / original) ** 2).sum())
+            return (win_rate - target_win_rate) ** 2 + self.closeness * drift, win_rate
+
+        best: tuple = (monster_type.health, monster_type.attack, monster_type.attack_rate)
+        best_loss, original_win_rate = get_loss(best)
+        best_win_rate: float = original_win_rate
+
+        # Health and attack move by multiplicative steps, attack rate by whole hits
+        log_step: float = 0.5
+        while log_step >= DifficultySolver.min_log_step:
+            is_improved: bool = False
+            for stat_index in range(3):
+                for direction in (1, -1):
+                    candidate: tuple = self.step(best, stat_index, direction, log_step)
+                    if candidate == best:
+                        continue
+                    loss, win_rate = get_loss(candidate)
+                    if loss < best_loss:
+                        best, best_loss, best_win_rate = candidate, loss, win_rate
+                        is_improved = True
+                        break
+            if not is_improved:
+                log_step /= 2
+
+        return MonsterFit(monster_type, debut_level, weapon, target_win_rate, original_win_rate, *best, best_win_rate, evaluations)
+
+    @staticmethod
+    def step(stats: tuple, stat_index: int, direction: int, log_step: float) -> tuple:
+        health, attack, attack_rate = stats
+        match stat_index:
+            case 0:
+                health = max(DifficultySolver.health_step, DifficultySolver.round_to(health * math.exp(direction * log_step), DifficultySolver.health_step))
+            case 1:
+                attack = max(DifficultySolver.attack_step, DifficultySolver.round_to(attack * math.exp(direction * log_step), DifficultySolver.attack_step))
+            case 2:
+                attack_rate = max(1, attack_rate + direction)
+        return health, attack, attack_rate
+
+    @staticmethod
+    def round_to(value: float, step: int) -> int:
+        return int(round(value / step)) * step
+
+    def get_win_rate(self, weapon: Weapon, stats: tuple, seed_sequence: np.random.SeedSequence) -> float:
+        # A fresh generator from the same seed every time, so candidates are compared on the same rolls
+        health, attack, attack_rate = stats
+        simulator: BattleSimulator = BattleSimulator(self.difficulty_curve.player_health, None, np.random.default_rng(seed_sequence))
+        ones: np.ndarray = np.ones(self.battles_per_evaluation, np.int64)
+
+        is_player_won, _, _, _ = simulator.simulate_battles(
+            ones * weapon.damage, ones * weapon.attack_rate, ones * (simulator.get_battle_action(weapon) == BattleAction.FAST_ATTACK),
+            ones * health, ones * attack, ones * attack_rate, self.difficulty_curve.player_health)
+        return float(is_player_won.mean())
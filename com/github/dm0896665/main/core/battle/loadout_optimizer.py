@@ -0,0 +1,78 @@
+import bisect
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.damage_table import DamageDistribution, DamageTable
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+
+
+class LoadoutOptimizer:
+    """Ranks weapons by the damage a round with them is expected to do to a monster, from tables built on first use.
+
+    A weapon is rated by its better attack style against the monster's remaining health, as the expected damage that
+    counts against it: E[min(damage, monster health)], so a weapon that reliably finishes a weak monster beats one with
+    a higher average that mostly overkills it. Each attack style keeps DamageTable's damage values in order with prefix
+    sums of damage * chance and of chance, which makes a rating one bisect, and ranking a player's weapons a few
+    microseconds.
+    """
+    attack_actions: Tuple[BattleAction, ...] = (BattleAction.FAST_ATTACK, BattleAction.LARGE_ATTACK)
+    # Per weapon, a (damage values, prefix sums of damage * chance, prefix sums of chance) table per attack style in
+    # attack_actions order
+    _tables: Dict[Weapon, Tuple[tuple, tuple]] = None
+
+    @staticmethod
+    def build():
+        tables: Dict[Weapon, Tuple[tuple, tuple]] = {}
+        for weapon in WeaponRegistry.catalog:
+            tables[weapon] = tuple(LoadoutOptimizer.create_table(DamageTable.get_attack_distribution(weapon, battle_action))
+                                   for battle_action in LoadoutOptimizer.attack_actions)
+        LoadoutOptimizer._tables = tables
+
+    @staticmethod
+    def create_table(distribution: DamageDistribution) -> Tuple[List[int], List[float], List[float]]:
+        return (distribution.damage.tolist(), [0.0] + np.cumsum(distribution.damage * distribution.probability).tolist(),
+                [0.0] + distribution.cdf.tolist())
+
+    @staticmethod
+    def get_table_damage(table: Tuple[List[int], List[float], List[float]], monster_health: int) -> float:
+        # Damage below the monster's health counts in full, anything at or above it counts as its health
+        damage, damage_sums, chance_sums = table
+        below: int = bisect.bisect_left(damage, monster_health)
+        return damage_sums[below] + monster_health * (1 - chance_sums[below])
+
+    @staticmethod
+    def get_tables(weapon: Weapon) -> Tuple[tuple, tuple]:
+        if LoadoutOptimizer._tables is None:
+            LoadoutOptimizer.build()
+        return LoadoutOptimizer._tables[weapon]
+
+    @staticmethod
+    def get_effective_damage(weapon: Weapon, battle_action: BattleAction, monster_health: int) -> float:
+        return LoadoutOptimizer.get_table_damage(LoadoutOptimizer.get_tables(weapon)[LoadoutOptimizer.attack_actions.index(battle_action)], monster_health)
+
+    @staticmethod
+    def get_weapon_rating(weapon: Weapon, monster_health: int) -> Tuple[float, BattleAction]:
+        # The weapon's better attack style and how much damage it is expected to do with it, fast attack on a tie
+        fast_table, large_table = LoadoutOptimizer.get_tables(weapon)
+        fast_damage: float = LoadoutOptimizer.get_table_damage(fast_table, monster_health)
+        large_damage: float = LoadoutOptimizer.get_table_damage(large_table, monster_health)
+        if large_damage > fast_damage:
+            return large_damage, BattleAction.LARGE_ATTACK
+        return fast_damage, BattleAction.FAST_ATTACK
+
+    @staticmethod
+    def get_ratings(weapons: Tuple[Weapon, ...], monster_health: int) -> List[float]:
+        return [LoadoutOptimizer.get_weapon_rating(weapon, monster_health)[0] for weapon in weapons]
+
+    @staticmethod
+    def rank_weapons(weapons: Tuple[Weapon, ...], monster_health: int) -> List[Weapon]:
+        # Best first, weapons that rate the same stay in the order they were given
+        ratings: List[float] = LoadoutOptimizer.get_ratings(weapons, monster_health)
+        return [weapons[index] for index in sorted(range(len(weapons)), key=lambda index: -ratings[index])]
+
+    @staticmethod
+    def get_best_weapon(weapons: Tuple[Weapon, ...], monster_health: int) -> Weapon:
+        ratings: List[float] = LoadoutOptimizer.get_ratings(weapons, monster_health)
+        return weapons[ratings.index(max(ratings))]
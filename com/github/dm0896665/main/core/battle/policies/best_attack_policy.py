@@ -0,0 +1,16 @@
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.damage_table import DamageTable
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class BestAttackPolicy(BattlePolicy):
+    def choose_action(self, battle_session: BattleSession) -> BattleAction:
+        return BestAttackPolicy.get_best_attack(battle_session.player.selected_weapon)
+
+    @staticmethod
+    def get_best_attack(weapon: Weapon) -> BattleAction:
+        if DamageTable.get_expected_damage(weapon, BattleAction.FAST_ATTACK) > DamageTable.get_expected_damage(weapon, BattleAction.LARGE_ATTACK):
+            return BattleAction.FAST_ATTACK
+        return BattleAction.LARGE_ATTACK
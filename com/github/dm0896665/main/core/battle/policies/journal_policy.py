@@ -0,0 +1,21 @@
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class JournalPolicy(BattlePolicy):
+    # Plays back the actions and weapon switches of a battle's ROUND records
+    def __init__(self, round_records: np.ndarray):
+        self.round_records: np.ndarray = round_records
+        self.round_index: int = 0
+
+    def choose_action(self, battle_session: BattleSession) -> BattleAction:
+        self.round_index += 1
+        return BattleJournal.get_battle_action(self.round_records[self.round_index - 1])
+
+    def choose_weapon(self, battle_session: BattleSession) -> Weapon:
+        return BattleJournal.get_weapon(self.round_records[self.round_index - 1])
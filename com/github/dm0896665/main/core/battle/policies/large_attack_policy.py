@@ -0,0 +1,8 @@
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+
+
+class LargeAttackPolicy(BattlePolicy):
+    def choose_action(self, battle_session: BattleSession) -> BattleAction:
+        return BattleAction.LARGE_ATTACK
@@ -0,0 +1,20 @@
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.policy_solver import PolicySolver, PolicySolution
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
+
+
+class OptimalPolicy(BattlePolicy):
+    def choose_action(self, battle_session: BattleSession) -> BattleAction:
+        player_health: int = battle_session.player.health
+        monster_health: int = battle_session.monster.health
+        return self.get_solution(battle_session).get_action(player_health, monster_health, battle_session.player.selected_weapon)
+
+    def choose_weapon(self, battle_session: BattleSession) -> Weapon:
+        return self.get_solution(battle_session).get_best_weapon(battle_session.player.health, battle_session.monster.health)
+
+    def get_solution(self, battle_session: BattleSession) -> PolicySolution:
+        player_health: int = battle_session.player.health
+        return PolicySolver.get_solution(player_health, WeaponUtil.get_owned_weapons(battle_session.player), battle_session.monster.monster_type)
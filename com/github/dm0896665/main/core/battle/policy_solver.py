@@ -0,0 +1,155 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.damage_table import DamageTable, DamageDistribution
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class PolicySolution:
+    """The optimal action for every state of one matchup.
+
+    Rows are player health states (player_health - row * monster attack) and columns are monster health (0 to the
+    monster type's health), like WinProbabilityTable. best_weapon indexes into weapons and best_action indexes into
+    PolicySolver.actions.
+    """
+
+    def __init__(self, player_health: int, monster_type: MonsterType, weapons: List[Weapon], value: np.ndarray, best_weapon: np.ndarray, best_action: np.ndarray):
+        self.player_health: int = player_health
+        self.monster_type: MonsterType = monster_type
+        self.weapons: List[Weapon] = weapons
+        self.value: np.ndarray = value
+        self.best_weapon: np.ndarray = best_weapon
+        self.best_action: np.ndarray = best_action
+
+    def get_row(self, player_health: int) -> int:
+        # Returns the row for the player health or -1 if the solution doesn't have that health
+        lost_health: int = self.player_health - player_health
+        if lost_health < 0 or lost_health % self.monster_type.attack != 0 or player_health <= 0:
+            return -1
+        return lost_health // self.monster_type.attack
+
+    def has_state(self, player_health: int, monster_health: int) -> bool:
+        return self.get_row(player_health) >= 0 and 0 < monster_health < self.value.shape[1]
+
+    def get_best_weapon(self, player_health: int, monster_health: int) -> Weapon:
+        return self.weapons[self.best_weapon[self.get_row(player_health), monster_health]]
+
+    def get_action(self, player_health: int, monster_health: int, selected_weapon: Weapon) -> BattleAction:
+        # Switching comes first whenever the best attack needs a different weapon
+        row: int = self.get_row(player_health)
+        battle_action: BattleAction = PolicySolver.actions[self.best_action[row, monster_health]]
+        if battle_action.is_attack and self.weapons[self.best_weapon[row, monster_health]] != selected_weapon:
+            return BattleAction.SWITCH_WEAPONS
+        return battle_action
+
+    def get_value(self, player_health: int, monster_health: int) -> float:
+        return float(self.value[self.get_row(player_health), monster_health])
+
+
+class PolicySolver:
+    """Finds the action that maximizes the expected battle reward in every (player health, monster health, weapon) state.
+
+    Switching weapons doesn't give the monster a counter-attack and every attack takes health off the monster, so
+    value iteration converges in a single sweep from 1 monster health up to the monster type's full health. Each sweep
+    step scores fast and large attacks with every owned weapon at once against running away.
+    Solutions are cached per (monster type, owned weapons) and reused for any player health on their grid.
+    """
+    actions: List[BattleAction] = [BattleAction.FAST_ATTACK, BattleAction.LARGE_ATTACK, BattleAction.RUN]
+    win_reward: float = 1.0
+    death_reward: float = -1.0
+    run_reward: float = 0.0
+    _solutions: Dict[Tuple[MonsterType, Tuple[Weapon, ...]], List[PolicySolution]] = {}
+
+    @staticmethod
+    def get_solution(player_health: int, weapons: List[Weapon], monster_type: MonsterType) -> PolicySolution:
+        # Keep weapon order stable so the same set of weapons always shares a cache entry
+        weapons = sorted(set(weapons), key=Weapon.get_catalog_index)
+        key: Tuple[MonsterType, Tuple[Weapon, ...]] = (monster_type, tuple(weapons))
+
+        solutions: List[PolicySolution] = PolicySolver._solutions.setdefault(key, [])
+        for solution in solutions:
+            if solution.get_row(player_health) >= 0:
+                return solution
+
+        solution = PolicySolver.solve(player_health, weapons, monster_type)
+        solutions.append(solution)
+        return solution
+
+    @staticmethod
+    def get_cached_solution(player_health: int, weapons: List[Weapon], monster_type: MonsterType) -> PolicySolution:
+        # Same as get_solution, but returns None instead of solving when nothing is cached yet
+        key: Tuple[MonsterType, Tuple[Weapon, ...]] = (monster_type, tuple(sorted(set(weapons), key=Weapon.get_catalog_index)))
+        for solution in PolicySolver._solutions.get(key, []):
+            if solution.get_row(player_health) >= 0:
+                return solution
+        return None
+
+    @staticmethod
+    def clear_cache():
+        PolicySolver._solutions.clear()
+
+    @staticmethod
+    def solve(player_health: int, weapons: List[Weapon], monster_type: MonsterType) -> PolicySolution:
+        weapon_count: int = len(weapons)
+
+        # Fast attack supports padded to the same length with zero probability entries
+        fast_attacks: List[DamageDistribution] = [DamageTable.get_attack_distribution(weapon, BattleAction.FAST_ATTACK) for weapon in weapons]
+        support_size: int = max(len(distribution.damage) for distribution in fast_attacks)
+        fast_damage: np.ndarray = np.zeros((weapon_count, support_size), np.int64)
+        fast_probability: np.ndarray = np.zeros((weapon_count, support_size))
+        for weapon_index, distribution in enumerate(fast_attacks):
+            fast_damage[weapon_index] = distribution.get_min_damage()
+            fast_damage[weapon_index, :len(distribution.damage)] = distribution.damage
+            fast_probability[weapon_index, :len(distribution.damage)] = distribution.probability
+
+        # Large attacks are uniform runs of damage, resolved with prefix sums
+        large_attacks: List[DamageDistribution] = [DamageTable.get_attack_distribution(weapon, BattleAction.LARGE_ATTACK) for weapon in weapons]
+        large_min: np.ndarray = np.array([distribution.get_min_damage() for distribution in large_attacks])
+        large_max: np.ndarray = np.array([distribution.get_max_damage() for distribution in large_attacks])
+        large_count: np.ndarray = large_max - large_min + 1
+
+        # Player health rows go down one monster attack at a time, counter-attacks past the last row are deaths
+        counter_attack: DamageDistribution = DamageTable.get_counter_attack_distribution(monster_type)
+        hits: np.ndarray = counter_attack.damage // monster_type.attack
+        row_count: int = -(-player_health // monster_type.attack)
+        transition: np.ndarray = np.zeros((row_count, row_count))
+        for row in range(row_count):
+            for hit, probability in zip(hits, counter_attack.probability):
+                if row + hit < row_count:
+                    transition[row, row + hit] += probability
+        death_probability: np.ndarray = 1 - transition.sum(axis=1)
+
+        # Columns up to `offset` are monster health already beaten
+        offset: int = int(max(fast_damage.max(), large_max.max()))
+        width: int = offset + monster_type.health + 1
+        value: np.ndarray = np.full((row_count, width), PolicySolver.win_reward)
+        best_weapon: np.ndarray = np.zeros((row_count, width), np.int8)
+        best_action: np.ndarray = np.zeros((row_count, width), np.int8)
+
+        # after_counter_attack[:, column] is the value of a state once the monster survived and struck back
+        after_counter_attack: np.ndarray = np.full((row_count, width), PolicySolver.win_reward)
+        prefix: np.ndarray = np.cumsum(after_counter_attack, axis=1)
+        rows: np.ndarray = np.arange(row_count)
+        run_action: int = PolicySolver.actions.index(BattleAction.RUN)
+
+        for column in range(offset + 1, width):
+            # Expected value of every (weapon, attack style) pair, shape (rows, weapons, 2)
+            fast_value: np.ndarray = np.einsum("rws,ws->rw", after_counter_attack[:, column - fast_damage], fast_probability)
+            large_value: np.ndarray = (prefix[:, column - large_min] - prefix[:, column - large_max - 1]) / large_count
+            attack_value: np.ndarray = np.stack([fast_value, large_value], axis=2).reshape(row_count, -1)
+
+            choice: np.ndarray = attack_value.argmax(axis=1)
+            best_value: np.ndarray = attack_value[rows, choice]
+            is_run: np.ndarray = PolicySolver.run_reward > best_value
+
+            value[:, column] = np.where(is_run, PolicySolver.run_reward, best_value)
+            best_weapon[:, column] = choice // 2
+            best_action[:, column] = np.where(is_run, run_action, choice % 2)
+
+            after_counter_attack[:, column] = transition @ value[:, column] + death_probability * PolicySolver.death_reward
+            prefix[:, column] = prefix[:, column - 1] + after_counter_attack[:, column]
+
+        return PolicySolution(player_health, monster_type, weapons, value[:, offset:], best_weapon[:, offset:], best_action[:, offset:])
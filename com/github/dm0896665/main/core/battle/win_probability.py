@@ -0,0 +1,155 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.damage_table import DamageTable, DamageDistribution
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import MonsterType, Monster
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class WinProbability:
+    def __init__(self, win_probability: float, expected_rounds: float):
+        self.win_probability: float = win_probability
+        self.loss_probability: float = 1 - win_probability
+        self.expected_rounds: float = expected_rounds
+
+    def __str__(self):
+        return f"Win: {self.win_probability:.2%}, Loss: {self.loss_probability:.2%}, Expected Rounds: {self.expected_rounds:.2f}"
+
+
+class WinProbabilityTable:
+    """Exact win probability and expected rounds for every state of one matchup.
+
+    Rows are player health states (player_health - row * monster attack) and columns are monster health (0 to the
+    monster type's health). The monster's counter-attacks are always a multiple of its attack, so the rows cover every
+    health the player can have for the rest of the battle.
+    """
+
+    def __init__(self, player_health: int, monster_attack: int, win_probability: np.ndarray, expected_rounds: np.ndarray):
+        self.player_health: int = player_health
+        self.monster_attack: int = monster_attack
+        self.win_probability: np.ndarray = win_probability
+        self.expected_rounds: np.ndarray = expected_rounds
+
+    def get_row(self, player_health: int) -> int:
+        # Returns the row for the player health or -1 if the table doesn't have that health
+        lost_health: int = self.player_health - player_health
+        if lost_health < 0 or lost_health % self.monster_attack != 0 or player_health <= 0:
+            return -1
+        return lost_health // self.monster_attack
+
+    def get_win_probability(self, player_health: int, monster_health: int) -> WinProbability:
+        row: int = self.get_row(player_health)
+        if monster_health <= 0:
+            return WinProbability(1, 0)
+        return WinProbability(float(self.win_probability[row, monster_health]), float(self.expected_rounds[row, monster_health]))
+
+
+class WinProbabilityCalculator:
+    """Computes exact battle odds with dynamic programming instead of sampling.
+
+    Every attack takes at least the weapon's damage off the monster, so the battle is a Markov chain that can be
+    solved one monster health at a time from 1 up to the monster type's full health. Tables are memoized per
+    (weapon, monster type, attack style) so repeated questions about a matchup are a dictionary and array lookup.
+    """
+    _tables: Dict[Tuple[Weapon, MonsterType, BattleAction], List[WinProbabilityTable]] = {}
+
+    @staticmethod
+    def get_win_probability(player_health: int, weapon: Weapon, monster_type: MonsterType, battle_action: BattleAction = None, monster_health: int = None) -> WinProbability:
+        if monster_health is None:
+            monster_health = monster_type.health
+        # A dead player has already lost, and no table has a row for them
+        if player_health <= 0:
+            return WinProbability(0, 1)
+        # Tables only run up to the monster type's full health
+        if monster_health > monster_type.health:
+            raise ValueError("A " + monster_type.monster_name + " has at most " + str(monster_type.health) + " health, not " + str(monster_health))
+
+        table: WinProbabilityTable = WinProbabilityCalculator.get_table(player_health, weapon, monster_type, battle_action)
+        return table.get_win_probability(player_health, monster_health)
+
+    @staticmethod
+    def get_win_probability_for_player(player: Player, monster: Monster, battle_action: BattleAction = None) -> WinProbability:
+        return WinProbabilityCalculator.get_win_probability(player.health, player.selected_weapon, monster.monster_type, battle_action, monster.health)
+
+    @staticmethod
+    def get_table(player_health: int, weapon: Weapon, monster_type: MonsterType, battle_action: BattleAction = None) -> WinProbabilityTable:
+        if player_health <= 0:
+            raise ValueError("A table needs a living player, not one at " + str(player_health) + " health")
+        if battle_action is None:
+            battle_action = BestAttackPolicy.get_best_attack(weapon)
+
+        # Reuse any table that already covers this player health
+        key: Tuple[Weapon, MonsterType, BattleAction] = (weapon, monster_type, battle_action)
+        tables: List[WinProbabilityTable] = WinProbabilityCalculator._tables.setdefault(key, [])
+        for table in tables:
+            if table.get_row(player_health) >= 0:
+                return table
+
+        table = WinProbabilityCalculator.solve(player_health, weapon, monster_type, battle_action)
+        tables.append(table)
+        return table
+
+    @staticmethod
+    def clear_cache():
+        WinProbabilityCalculator._tables.clear()
+
+    @staticmethod
+    def solve(player_health: int, weapon: Weapon, monster_type: MonsterType, battle_action: BattleAction) -> WinProbabilityTable:
+        attack_distribution: DamageDistribution = DamageTable.get_attack_distribution(weapon, battle_action)
+        damage: np.ndarray = attack_distribution.damage
+        damage_probability: np.ndarray = attack_distribution.probability
+
+        # Counter-attacks are always a whole number of monster attacks
+        counter_attack_distribution: DamageDistribution = DamageTable.get_counter_attack_distribution(monster_type)
+        hits: np.ndarray = counter_attack_distribution.damage // monster_type.attack
+        hit_probability: np.ndarray = counter_attack_distribution.probability
+
+        # Player health rows go down one monster attack at a time until the player is dead
+        row_count: int = -(-player_health // monster_type.attack)
+        monster_health: int = monster_type.health
+
+        # transition[row, next_row] is the chance the counter-attack moves the player between the two rows, missing
+        # rows past the last one are deaths and simply drop out of the sum
+        transition: np.ndarray = np.zeros((row_count, row_count))
+        for row in range(row_count):
+            for hit, probability in zip(hits, hit_probability):
+                if row + hit < row_count:
+                    transition[row, row + hit] += probability
+
+        # Columns below zero are monster health already beaten, offset so column `offset` is zero monster health
+        offset: int = int(damage.max())
+        width: int = offset + monster_health + 1
+        win_probability: np.ndarray = np.zeros((row_count, width))
+        expected_rounds: np.ndarray = np.zeros((row_count, width))
+
+        # after_counter_attack[:, column] is the value of a state once the monster survived and struck back
+        win_after_counter_attack: np.ndarray = np.ones((row_count, width))
+        rounds_after_counter_attack: np.ndarray = np.zeros((row_count, width))
+
+        # Large attacks are a uniform run of damage values, which prefix sums resolve in constant time per column
+        is_uniform: bool = battle_action == BattleAction.LARGE_ATTACK
+        minimum_damage: int = int(damage.min())
+        win_prefix: np.ndarray = np.cumsum(win_after_counter_attack, axis=1) if is_uniform else None
+        rounds_prefix: np.ndarray = np.zeros((row_count, width)) if is_uniform else None
+
+        for column in range(offset + 1, width):
+            if is_uniform:
+                low: int = column - offset - 1
+                high: int = column - minimum_damage
+                win_probability[:, column] = (win_prefix[:, high] - win_prefix[:, low]) / len(damage)
+                expected_rounds[:, column] = 1 + (rounds_prefix[:, high] - rounds_prefix[:, low]) / len(damage)
+            else:
+                win_probability[:, column] = win_after_counter_attack[:, column - damage] @ damage_probability
+                expected_rounds[:, column] = 1 + rounds_after_counter_attack[:, column - damage] @ damage_probability
+
+            win_after_counter_attack[:, column] = transition @ win_probability[:, column]
+            rounds_after_counter_attack[:, column] = transition @ expected_rounds[:, column]
+            if is_uniform:
+                win_prefix[:, column] = win_prefix[:, column - 1] + win_after_counter_attack[:, column]
+                rounds_prefix[:, column] = rounds_prefix[:, column - 1] + rounds_after_counter_attack[:, column]
+
+        return WinProbabilityTable(player_health, monster_type.attack, win_probability[:, offset:], expected_rounds[:, offset:])
@@ -0,0 +1,49 @@
+from typing import Dict, List, Tuple
+
+from com.github.dm0896665.main.core.battle.win_probability import WinProbabilityCalculator
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+class WinRatePreview:
+    """Expected win rate of a weapon against every monster a player's level can spawn, for shop previews.
+
+    The win rate is the exact odds from WinProbabilityCalculator for a player at a new player's full health, averaged
+    over the level's spawn pool the same way Monster.get_random_monster_type picks from it. Levels that share a spawn
+    pool share a tier, and results are cached per (weapon, tier), so a cached value is only ever replaced when one of
+    those changes.
+    """
+    player_health: int = Player().health
+    _win_rates: Dict[Tuple[Weapon, int], float] = {}
+
+    @staticmethod
+    def get_key(weapon: Weapon, level: int) -> Tuple[Weapon, int]:
+        # Levels are keyed by their spawn pool
+        return weapon, Monster.get_max_monster_index(level)
+
+    @staticmethod
+    def get_cached_win_rate(weapon: Weapon, level: int) -> float:
+        # None when it hasn't been worked out yet, so callers on the UI thread never wait on it
+        return WinRatePreview._win_rates.get(WinRatePreview.get_key(weapon, level))
+
+    @staticmethod
+    def get_win_rate(weapon: Weapon, level: int) -> float:
+        key: Tuple[Weapon, int] = WinRatePreview.get_key(weapon, level)
+        win_rate: float = WinRatePreview._win_rates.get(key)
+        if win_rate is not None:
+            return win_rate
+
+        monster_types: Tuple[MonsterType, ...] = MonsterType.get_spawn_pool(key[1])
+        win_rate = sum(WinProbabilityCalculator.get_win_probability(WinRatePreview.player_health, weapon, monster_type).win_probability
+                       for monster_type in monster_types) / len(monster_types)
+        WinRatePreview._win_rates[key] = win_rate
+        return win_rate
+
+    @staticmethod
+    def get_win_rates(weapons: List[Weapon], level: int) -> List[float]:
+        return [WinRatePreview.get_win_rate(weapon, level) for weapon in weapons]
+
+    @staticmethod
+    def clear_cache():
+        WinRatePreview._win_rates.clear()
@@ -0,0 +1,239 @@
+from typing import List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.battle.damage_table import DamageTable
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster_batch import MonsterBatch
+from com.github.dm0896665.main.core.monster.monster_spawner import MonsterSpawner
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
+
+
+class Population:
+    """Struct-of-arrays state for a population of players, one entry per player in every array.
+
+    owned[player, weapon] marks every weapon a player has, the selected one included, with weapons in catalog order.
+    """
+
+    def __init__(self, player_count: int, weapon_count: int):
+        starting_player: Player = Player()
+        self.money: np.ndarray = np.full(player_count, starting_player.money, np.float64)
+        self.bank: np.ndarray = np.full(player_count, starting_player.bank, np.int64)
+        self.score: np.ndarray = np.full(player_count, starting_player.score, np.int64)
+        self.health: np.ndarray = np.full(player_count, starting_player.health, np.int64)
+        self.level: np.ndarray = np.full(player_count, starting_player.level, np.int64)
+        self.strength: np.ndarray = np.full(player_count, starting_player.strength, np.int64)
+        self.kills: np.ndarray = np.zeros(player_count, np.int64)
+        self.deaths: np.ndarray = np.zeros(player_count, np.int64)
+        self.selected_weapon: np.ndarray = np.full(player_count, starting_player.selected_weapon.get_catalog_index(), np.int64)
+        self.owned: np.ndarray = np.zeros((player_count, weapon_count), bool)
+        self.owned[np.arange(player_count), self.selected_weapon] = True
+
+        # How much of their on-hand coins each player puts in the bank after a session
+        self.deposit_rate: np.ndarray = np.zeros(player_count)
+
+    def get_player_count(self) -> int:
+        return len(self.money)
+
+    def get_net_worth(self) -> np.ndarray:
+        return self.money + self.bank
+
+
+class EconomyHistory:
+    """Distributions of a population's economy after every session.
+
+    Percentile arrays are indexed [session, percentile] with the percentiles in EconomyHistory.percentiles.
+    """
+    percentiles: List[float] = [10, 25, 50, 75, 90, 99]
+
+    def __init__(self, session_count: int, weapons: List[Weapon]):
+        percentile_shape: tuple = (session_count, len(EconomyHistory.percentiles))
+        self.weapons: List[Weapon] = weapons
+        self.money_supply: np.ndarray = np.zeros(session_count)
+        self.net_worth: np.ndarray = np.zeros(percentile_shape)
+        self.score: np.ndarray = np.zeros(percentile_shape)
+        self.level: np.ndarray = np.zeros(percentile_shape)
+        self.win_rate: np.ndarray = np.zeros(session_count)
+        self.deaths: np.ndarray = np.zeros(session_count, np.int64)
+        self.coins_stolen: np.ndarray = np.zeros(session_count)
+        self.weapons_bought: np.ndarray = np.zeros(session_count, np.int64)
+        self.weapons_dropped: np.ndarray = np.zeros(session_count, np.int64)
+        self.weapon_ownership: np.ndarray = np.zeros((session_count, len(weapons)))
+        self.selected_weapon_share: np.ndarray = np.zeros((session_count, len(weapons)))
+
+    def record(self, session: int, population: Population):
+        self.money_supply[session] = population.get_net_worth().sum()
+        self.net_worth[session] = np.percentile(population.get_net_worth(), EconomyHistory.percentiles)
+        self.score[session] = np.percentile(population.score, EconomyHistory.percentiles)
+        self.level[session] = np.percentile(population.level, EconomyHistory.percentiles)
+        self.weapon_ownership[session] = population.owned.mean(axis=0)
+        self.selected_weapon_share[session] = np.bincount(population.selected_weapon, minlength=len(self.weapons)) / population.get_player_count()
+
+    def save_csv(self, path: str):
+        percentile_names: List[str] = ["p" + str(percentile) for percentile in EconomyHistory.percentiles]
+        with open(path, "w") as csv_file:
+            csv_file.write("session,money_supply,win_rate,deaths,coins_stolen,weapons_bought,weapons_dropped,"
+                           + ",".join(["net_worth_" + name for name in percentile_names] + ["score_" + name for name in percentile_names]
+                                      + ["level_" + name for name in percentile_names] + ["owns_" + weapon.name for weapon in self.weapons]) + "\n")
+            for session in range(len(self.money_supply)):
+                values: list = ([session + 1, f"{self.money_supply[session]:.0f}", f"{self.win_rate[session]:.4f}", self.deaths[session],
+                                 f"{self.coins_stolen[session]:.0f}", self.weapons_bought[session], self.weapons_dropped[session]]
+                                + [f"{value:.0f}" for value in self.net_worth[session]] + [f"{value:.0f}" for value in self.score[session]]
+                                + [f"{value:.0f}" for value in self.level[session]] + [f"{value:.4f}" for value in self.weapon_ownership[session]])
+                csv_file.write(",".join(str(value) for value in values) + "\n")
+
+    def save_npz(self, path: str):
+        np.savez_compressed(path, percentiles=np.array(EconomyHistory.percentiles), weapons=np.array([weapon.name for weapon in self.weapons]),
+                            money_supply=self.money_supply, net_worth=self.net_worth, score=self.score, level=self.level,
+                            win_rate=self.win_rate, deaths=self.deaths, coins_stolen=self.coins_stolen, weapons_bought=self.weapons_bought,
+                            weapons_dropped=self.weapons_dropped, weapon_ownership=self.weapon_ownership,
+                            selected_weapon_share=self.selected_weapon_share)
+
+
+class EconomySimulator:
+    """Simulates the economy of a whole population of players at once, session by session.
+
+    Each session every player fights battles_per_session battles, with BattleSimulator and BestAttackPolicy's attack
+    against monsters drawn from their level's spawn pool, then banks and shops. The rules follow the game:
+        win         money ((health + attack) * attack rate) / 10 + 50 and score health * randint(0, attack rate) + 100,
+                    and a 15% chance of an unowned weapon drop from the monster's health section of the drop pool
+        death       on-hand coins are stolen, 500xp is lost and health is set to 500
+        bank        after each session a player deposits their own share of their on-hand coins
+        shop        a player buys the strongest weapon they can wield and afford, withdrawing from the bank as needed,
+                    and sells the weapon it replaces at half price
+    The game doesn't grow level or strength or heal the player yet, so the simulator assumes one level per
+    score_per_level score (up to 100), strength_per_level strength per level and heal_per_session health restored
+    after every session, up to a new player's health (none by default, like the game).
+
+    :param player_count: Players in the population
+    :param battles_per_session: Battles each player fights per session
+    :param score_per_level: Score needed for each level
+    :param strength_per_level: Strength gained with each level
+    :param heal_per_session: Health restored after each session
+    :param seed: Seed for the simulation, so a run can be reproduced
+    :param monster_spawner: Picks each battle's monster for the player's level, defaults to the game's own spawner
+    """
+    death_score_loss: int = 500
+    death_health: int = 500
+
+    def __init__(self, player_count: int = 100000, battles_per_session: int = 5, score_per_level: int = 5000, strength_per_level: int = 10,
+                 heal_per_session: int = 0, seed: int = None, monster_spawner: MonsterSpawner = None):
+        self.player_count: int = player_count
+        self.battles_per_session: int = battles_per_session
+        self.score_per_level: int = score_per_level
+        self.strength_per_level: int = strength_per_level
+        self.heal_per_session: int = heal_per_session
+        self.max_health: int = Player().health
+        self.generator: np.random.Generator = np.random.default_rng(seed)
+        self.monster_spawner: MonsterSpawner = monster_spawner if monster_spawner is not None else MonsterSpawner.default
+        self.battle_simulator: BattleSimulator = BattleSimulator(generator=self.generator)
+
+        # Catalog tables, indexed by weapon
+        self.weapons: List[Weapon] = list(Weapon)
+        self.weapon_damage: np.ndarray = np.array([weapon.damage for weapon in self.weapons])
+        self.weapon_attack_rate: np.ndarray = np.array([weapon.attack_rate for weapon in self.weapons])
+        self.weapon_strength: np.ndarray = np.array([weapon.strength for weapon in self.weapons])
+        self.weapon_price: np.ndarray = np.array([weapon.price for weapon in self.weapons])
+        self.is_fast_attack: np.ndarray = np.array([BestAttackPolicy.get_best_attack(weapon) == BattleAction.FAST_ATTACK for weapon in self.weapons])
+        self.expected_damage: np.ndarray = np.array([DamageTable.get_expected_damage(weapon, BestAttackPolicy.get_best_attack(weapon)) for weapon in self.weapons])
+
+
+    def create_population(self) -> Population:
+        population: Population = Population(self.player_count, len(self.weapons))
+        population.deposit_rate = self.generator.random(self.player_count)
+        return population
+
+    def simulate(self, session_count: int = 100, population: Population = None) -> EconomyHistory:
+        if population is None:
+            population = self.create_population()
+        economy_history: EconomyHistory = EconomyHistory(session_count, self.weapons)
+
+        for session in range(session_count):
+            wins: int = 0
+            for _ in range(self.battles_per_session):
+                wins += self.fight(population, economy_history, session)
+            economy_history.win_rate[session] = wins / (self.player_count * self.battles_per_session)
+
+            self.bank(population)
+            self.shop(population, economy_history, session)
+            self.progress(population)
+            economy_history.record(session, population)
+
+        return economy_history
+
+    def fight(self, population: Population, economy_history: EconomyHistory, session: int) -> int:
+        # Everybody fights one battle against a monster from their own level's spawn pool
+        monster_index: np.ndarray = self.monster_spawner.spawn_indexes(population.level, self.player_count, self.generator)
+        monster_batch: MonsterBatch = MonsterBatch.from_spawn_indexes(monster_index)
+        weapon_index: np.ndarray = population.selected_weapon
+        is_player_won, _, player_health = self.battle_simulator.simulate_monster_batch(
+            self.weapon_damage[weapon_index], self.weapon_attack_rate[weapon_index], self.is_fast_attack[weapon_index], monster_batch, population.health)
+        population.health = np.maximum(player_health, 0)
+
+        # Winners are paid with Battle.player_won's formulas
+        winners: np.ndarray = np.flatnonzero(is_player_won)
+        health: np.ndarray = monster_batch.get_original_health()[winners]
+        attack_rate: np.ndarray = monster_batch.get_original_attack_rate()[winners]
+        population.money[winners] += ((health + monster_batch.get_original_attack()[winners]) * attack_rate) / 10 + 50
+        population.score[winners] += health * self.generator.integers(0, attack_rate + 1) + 100
+        population.kills[winners] += 1
+        economy_history.weapons_dropped[session] += self.drop_weapons(population, winners, monster_batch.take(winners))
+
+        # The dead lose their coins, some score, and come back with less health
+        losers: np.ndarray = np.flatnonzero(~is_player_won)
+        economy_history.deaths[session] += len(losers)
+        economy_history.coins_stolen[session] += population.money[losers].sum()
+        population.money[losers] = 0
+        population.score[losers] = np.maximum(population.score[losers] - EconomySimulator.death_score_loss, 0)
+        population.health[losers] = EconomySimulator.death_health
+        population.deaths[losers] += 1
+        return len(winners)
+
+    def drop_weapons(self, population: Population, winners: np.ndarray, winner_monsters: MonsterBatch) -> int:
+        # WeaponUtil.weapon_drop_many against each winner's own weapons, only unowned drops change the economy
+        _, unowned_drops = WeaponUtil.weapon_drop_many(winner_monsters, self.generator, population.owned[winners])
+        droppers: np.ndarray = np.flatnonzero(unowned_drops >= 0)
+        population.owned[winners[droppers], unowned_drops[droppers]] = True
+        return len(droppers)
+
+    def bank(self, population: Population):
+        deposit: np.ndarray = (population.money * population.deposit_rate).astype(np.int64)
+        population.bank += deposit
+        population.money -= deposit
+
+    def shop(self, population: Population, economy_history: EconomyHistory, session: int):
+        # The strongest weapon each player can wield, owned or affordable
+        can_wield: np.ndarray = self.weapon_strength[None, :] <= population.strength[:, None]
+        can_afford: np.ndarray = self.weapon_price[None, :] <= population.get_net_worth()[:, None]
+        candidate_damage: np.ndarray = np.where(can_wield & (population.owned | can_afford), self.expected_damage[None, :], -1)
+        best_weapon: np.ndarray = np.argmax(candidate_damage, axis=1)
+
+        players: np.ndarray = np.flatnonzero(self.expected_damage[best_weapon] > self.expected_damage[population.selected_weapon])
+        if len(players) == 0:
+            return
+        new_weapon: np.ndarray = best_weapon[players]
+        old_weapon: np.ndarray = population.selected_weapon[players]
+
+        # Buy the ones they don't own, paying from their coins first and the bank for the rest
+        buyers: np.ndarray = players[~population.owned[players, new_weapon]]
+        price: np.ndarray = self.weapon_price[best_weapon[buyers]]
+        withdrawal: np.ndarray = np.maximum(price - population.money[buyers], 0).astype(np.int64)
+        population.bank[buyers] -= withdrawal
+        population.money[buyers] += withdrawal - price
+        population.owned[buyers, best_weapon[buyers]] = True
+        economy_history.weapons_bought[session] += len(buyers)
+
+        # Sell what it replaces at half price, like WeaponItemTableCell does
+        population.money[players] += (self.weapon_price[old_weapon] / 2).astype(np.int64)
+        population.owned[players, old_weapon] = False
+        population.selected_weapon[players] = new_weapon
+
+    def progress(self, population: Population):
+        population.level = np.minimum(1 + population.score // self.score_per_level, 100)
+        population.strength = population.level * self.strength_per_level
+        if self.heal_per_session > 0:
+            population.health = np.maximum(population.health, np.minimum(population.health + self.heal_per_session, self.max_health))
@@ -1,5 +1,6 @@
 import random
 from enum import Enum
+from typing import Dict, Tuple
 
 from com.github.dm0896665.main.util.player_util import PlayerUtil
 
@@ -45,14 +46,18 @@ class MonsterType(Enum):
 
     @staticmethod
     def get_monster_type_by_monster_name(monster_name: str):
-        for monster_type in MonsterType:
-            if monster_type.monster_name == monster_name:
-                return monster_type
-        return None
+        return MonsterTypeRegistry.by_name.get(monster_name)
+
+    @staticmethod
+    def get_monster_type_by_image_name(image_name: str):
+        return MonsterTypeRegistry.by_image_name.get(image_name)
 
     def get_monster_name(self):
         return self.monster_name
 
+    def get_image_name(self):
+        return self.monster_name.lower().replace(" ", "_")
+
     def get_health(self):
         return self.health
 
@@ -63,28 +68,59 @@ class MonsterType(Enum):
         return self.attack_rate
 
     @staticmethod
-    def get_random_monster_type(max_index: int = None):
+    def get_random_monster_type(max_index: int = None, rng: random.Random = None):
+        if rng is None:
+            rng = random
+
         if max_index is None or max_index >= MonsterType.get_monster_count():
             max_index = MonsterType.get_monster_count() - 1
 
-        random_index = random.randint(0, max_index)
-        monsters = list(filter(lambda m: m.get_monster_name() != MonsterType.PRACTICE_DUMMY.get_monster_name(), [monster for monster in MonsterType]))
-        return monsters[random_index]
+        random_index = rng.randint(0, max_index)
+        return MonsterTypeRegistry.spawnable[random_index]
+
+    @staticmethod
+    def get_spawnable_monster_types() -> Tuple["MonsterType", ...]:
+        return MonsterTypeRegistry.spawnable
+
+    @staticmethod
+    def get_spawn_pool(max_index: int) -> Tuple["MonsterType", ...]:
+        # The monster types get_random_monster_type picks from for a max index
+        return MonsterTypeRegistry.spawn_pools[max_index]
+
+    def get_spawn_index(self) -> int:
+        return MonsterTypeRegistry.spawn_indexes[self]
 
     @staticmethod
     def get_monster_count():
-        return len(MonsterType) - 1
+        return len(MonsterTypeRegistry.spawnable)
 
 
 class Monster:
+    """One monster in a battle, a flyweight over its MonsterType.
+
+    Only health changes during a battle, so it is the one stat a monster stores, in a slot with no instance dict.
+    Its name, attack and attack rate are read from the shared MonsterType.
+    """
+    __slots__ = ("monster_type", "health")
+    count: int = 1
+
     def __init__(self, monster_type: MonsterType = None):
         if monster_type is None:
             monster_type = Monster.get_random_monster_type()
         self.monster_type: MonsterType = monster_type
-        self.monster_name: str = monster_type.get_monster_name()
         self.health: int = monster_type.get_health()
-        self.attack: int = monster_type.get_attack()
-        self.attack_rate: int = monster_type.get_attack_rate()
+
+    @property
+    def monster_name(self) -> str:
+        return self.monster_type.monster_name
+
+    @property
+    def attack(self) -> int:
+        return self.monster_type.attack
+
+    @property
+    def attack_rate(self) -> int:
+        return self.monster_type.attack_rate
 
     def get_original_health(self):
         return self.monster_type.get_health()
@@ -93,10 +129,19 @@ class Monster:
         return self.monster_type.get_attack()
 
     @staticmethod
-    def get_random_monster_type():
-        level: int = PlayerUtil.current_player.level
+    def get_random_monster_type(rng: random.Random = None):
+        return MonsterType.get_random_monster_type(Monster.get_max_monster_index(PlayerUtil.current_player.level), rng)
+
+    @staticmethod
+    def get_max_monster_index(level: int) -> int:
+        if 0 <= level < len(MonsterTypeRegistry.level_max_indexes):
+            return MonsterTypeRegistry.level_max_indexes[level]
+        return Monster.calculate_max_monster_index(level)
+
+    @staticmethod
+    def calculate_max_monster_index(level: int) -> int:
         if level == 100:
-            return MonsterType.get_random_monster_type()
+            return MonsterType.get_monster_count() - 1
 
         monsters_per_level_rank: float = MonsterType.get_monster_count() / 10
 
@@ -104,4 +149,30 @@ class Monster:
 
         number_of_possible_monsters: int = round(level_rank * monsters_per_level_rank) + 1
 
-        return MonsterType.get_random_monster_type(number_of_possible_monsters)
+        return min(number_of_possible_monsters, MonsterType.get_monster_count() - 1)
+
+
+class MonsterTypeRegistry:
+    """Lookups over the MonsterType catalog, built once when this module is imported.
+
+    spawnable holds every monster type but the practice dummy in catalog order, spawn_pools[max_index] is the first
+    max_index + 1 of them and level_max_indexes[level] is Monster.get_max_monster_index worked out for levels 0 to 100.
+    """
+    by_name: Dict[str, MonsterType] = {}
+    by_image_name: Dict[str, MonsterType] = {}
+    spawnable: Tuple[MonsterType, ...] = ()
+    spawn_indexes: Dict[MonsterType, int] = {}
+    spawn_pools: Tuple[Tuple[MonsterType, ...], ...] = ()
+    level_max_indexes: Tuple[int, ...] = ()
+
+    @staticmethod
+    def build():
+        MonsterTypeRegistry.by_name = {monster_type.monster_name: monster_type for monster_type in MonsterType}
+        MonsterTypeRegistry.by_image_name = {monster_type.get_image_name(): monster_type for monster_type in MonsterType}
+        MonsterTypeRegistry.spawnable = tuple(monster_type for monster_type in MonsterType if monster_type != MonsterType.PRACTICE_DUMMY)
+        MonsterTypeRegistry.spawn_indexes = {monster_type: index for index, monster_type in enumerate(MonsterTypeRegistry.spawnable)}
+        MonsterTypeRegistry.spawn_pools = tuple(MonsterTypeRegistry.spawnable[:max_index + 1] for max_index in range(len(MonsterTypeRegistry.spawnable)))
+        MonsterTypeRegistry.level_max_indexes = tuple(Monster.calculate_max_monster_index(level) for level in range(101))
+
+
+MonsterTypeRegistry.build()
@@ -0,0 +1,132 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+
+
+class MonsterBatch:
+    """Many monsters as struct-of-arrays, one entry per monster in every array.
+
+    type_index is the monster's position in the MonsterType catalog and health, attack and attack_rate are its current
+    stats, so a batch of a million monsters is four int64 arrays rather than a million Monster objects. Damage is applied
+    to the whole batch or to chosen entries at once, and a monster is alive while its health is above 0.
+
+    :param type_index: Catalog index of every monster
+    :param health: Current health of every monster, defaults to each monster type's health
+    :param attack: Attack of every monster, defaults to each monster type's attack
+    :param attack_rate: Attack rate of every monster, defaults to each monster type's attack rate
+    """
+    catalog: Tuple[MonsterType, ...] = tuple(MonsterType)
+    catalog_indexes: Dict[MonsterType, int] = {monster_type: index for index, monster_type in enumerate(catalog)}
+    catalog_health: np.ndarray = np.array([monster_type.health for monster_type in catalog], np.int64)
+    catalog_attack: np.ndarray = np.array([monster_type.attack for monster_type in catalog], np.int64)
+    catalog_attack_rate: np.ndarray = np.array([monster_type.attack_rate for monster_type in catalog], np.int64)
+    # Catalog index of each spawn index, as drawn by MonsterSpawner
+    spawn_catalog_indexes: np.ndarray = np.array(list(map(catalog_indexes.get, MonsterType.get_spawnable_monster_types())), np.int64)
+
+    def __init__(self, type_index: np.ndarray, health: np.ndarray = None, attack: np.ndarray = None, attack_rate: np.ndarray = None):
+        self.type_index: np.ndarray = np.asarray(type_index, np.int64)
+        self.health: np.ndarray = MonsterBatch.get_column(health, MonsterBatch.catalog_health, self.type_index)
+        self.attack: np.ndarray = MonsterBatch.get_column(attack, MonsterBatch.catalog_attack, self.type_index)
+        self.attack_rate: np.ndarray = MonsterBatch.get_column(attack_rate, MonsterBatch.catalog_attack_rate, self.type_index)
+
+    @staticmethod
+    def get_column(values: np.ndarray, catalog_values: np.ndarray, type_index: np.ndarray) -> np.ndarray:
+        # A copy either way, so the batch never writes through to a caller's array or a catalog table
+        if values is None:
+            return catalog_values[type_index]
+        return np.broadcast_to(np.asarray(values, np.int64), type_index.shape).copy()
+
+    def __len__(self) -> int:
+        return len(self.type_index)
+
+    @staticmethod
+    def from_monster_types(monster_types: List[MonsterType]) -> "MonsterBatch":
+        return MonsterBatch(np.array([MonsterBatch.catalog_indexes[monster_type] for monster_type in monster_types], np.int64))
+
+    @staticmethod
+    def from_spawn_indexes(spawn_indexes: np.ndarray) -> "MonsterBatch":
+        return MonsterBatch(MonsterBatch.spawn_catalog_indexes[spawn_indexes])
+
+    @staticmethod
+    def from_monsters(monsters: List[Monster]) -> "MonsterBatch":
+        return MonsterBatch(np.array([MonsterBatch.catalog_indexes[monster.monster_type] for monster in monsters], np.int64),
+                            np.array([monster.health for monster in monsters], np.int64),
+                            np.array([monster.attack for monster in monsters], np.int64),
+                            np.array([monster.attack_rate for monster in monsters], np.int64))
+
+    def take(self, indexes: np.ndarray) -> "MonsterBatch":
+        # A new batch of the monsters at indexes, as they are now
+        return MonsterBatch(self.type_index[indexes], self.health[indexes], self.attack[indexes], self.attack_rate[indexes])
+
+    def get_monster_type(self, index: int) -> MonsterType:
+        return MonsterBatch.catalog[self.type_index[index]]
+
+    def get_monster(self, index: int) -> Monster:
+        # A Monster only carries its health, its attack and attack rate always come from its monster type
+        monster: Monster = Monster(self.get_monster_type(index))
+        monster.health = int(self.health[index])
+        return monster
+
+    def to_monsters(self) -> List[Monster]:
+        return [self.get_monster(index) for index in range(len(self))]
+
+    def get_original_health(self) -> np.ndarray:
+        return MonsterBatch.catalog_health[self.type_index]
+
+    def get_original_attack(self) -> np.ndarray:
+        return MonsterBatch.catalog_attack[self.type_index]
+
+    def get_original_attack_rate(self) -> np.ndarray:
+        return MonsterBatch.catalog_attack_rate[self.type_index]
+
+    def get_alive_mask(self) -> np.ndarray:
+        return self.health > 0
+
+    def get_alive_indexes(self) -> np.ndarray:
+        return np.flatnonzero(self.health > 0)
+
+    def get_alive_count(self) -> int:
+        return int(np.count_nonzero(self.health > 0))
+
+    def get_remaining_health(self) -> int:
+        # Health left across the batch, monsters past 0 don't count against it
+        return int(np.maximum(self.health, 0).sum())
+
+    def apply_damage(self, damage: int | np.ndarray, indexes: np.ndarray = None) -> np.ndarray:
+        """Takes damage off every monster, or off the monsters at indexes with one damage per index.
+
+        An index may repeat, and each of its hits lands.
+
+        Returns:
+            A mask of the monsters this damage killed.
+        """
+        was_alive: np.ndarray = self.health > 0
+        if indexes is None:
+            self.health -= np.asarray(damage, np.int64)
+        else:
+            self.health -= np.bincount(indexes, np.broadcast_to(damage, np.shape(indexes)), len(self)).astype(np.int64)
+        return was_alive & (self.health <= 0)
+
+    def apply_carried_damage(self, damage: int | np.ndarray, indexes: np.ndarray) -> bool:
+        """Like apply_damage on monsters still alive, but damage a hit has left over once its monster is dead carries on
+        to the monsters still alive, in batch order, so a batch loses exactly the damage dealt to it until it is wiped out.
+
+        Monsters stop at 0 health rather than going below it.
+
+        Returns:
+            Whether this damage killed any monster, checking only the hit monsters when it didn't.
+        """
+        np.subtract.at(self.health, indexes, damage)
+        if self.health[indexes].min() > 0:
+            return False
+
+        # Only the monsters just killed are below 0. Dead monsters then hold 0, so each survivor keeps what the overkill
+        # hasn't reached once it used up everything before it
+        overkill: int = -int(np.minimum(self.health, 0).sum())
+        np.maximum(self.health, 0, out=self.health)
+        if overkill > 0:
+            np.minimum(self.health, np.cumsum(self.health) - overkill, out=self.health)
+            np.maximum(self.health, 0, out=self.health)
+        return True
@@ -0,0 +1,105 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_batch import MonsterBatch
+
+
+class MonsterGroup:
+    """A swarm of one monster type, fought as a single encounter.
+
+    The swarm splits its monster type's health exactly between its members, and a hit that kills a member carries its
+    leftover damage on to the next ones, so the swarm loses health just like the single monster would. Every member
+    still alive strikes back with member_attack at member_attack_rate, so the swarm hits softer as it thins out. The
+    member stats are tuned so a full swarm is about as hard to beat as its single monster across the weapons, which
+    keeps the win rate tools that model single monsters close for swarms, though a weapon that takes out most of a
+    swarm in one round finds it easier. The members are a MonsterBatch, so hits are resolved for the whole swarm at once.
+    """
+    swarm_sizes: Dict[MonsterType, int] = {
+        MonsterType.GHOST: 10,
+        MonsterType.SPIDER: 30,
+    }
+    # Attack and attack rate of every member of a swarm
+    member_stats: Dict[MonsterType, Tuple[int, int]] = {
+        MonsterType.GHOST: (30, 4),
+        MonsterType.SPIDER: (13, 5),
+    }
+
+    def __init__(self, monster_type: MonsterType, count: int = None):
+        if count is None:
+            count = MonsterGroup.swarm_sizes.get(monster_type, 1)
+        self.monster_type: MonsterType = monster_type
+        self.monster_name: str = monster_type.get_monster_name()
+        self.count: int = count
+        self.attack: int = monster_type.get_attack()
+        self.attack_rate: int = monster_type.get_attack_rate()
+        self.member_attack, self.member_attack_rate = MonsterGroup.member_stats.get(monster_type, (self.attack, self.attack_rate))
+        # The first members take the health that doesn't split evenly
+        member_health: np.ndarray = np.full(count, monster_type.get_health() // count, np.int64)
+        member_health[:monster_type.get_health() % count] += 1
+        self.members: MonsterBatch = MonsterBatch(np.full(count, MonsterBatch.catalog_indexes[monster_type], np.int64),
+                                                  member_health, self.member_attack, self.member_attack_rate)
+        # Kept alongside the members and only refreshed when one dies, so a round never has to go through them for these
+        self.remaining_health: int = monster_type.get_health()
+        self.alive_count: int = count
+        self.alive_members: np.ndarray = np.arange(count)
+
+    @property
+    def health(self) -> int:
+        # The health the swarm has left, dead members don't count against it
+        return self.remaining_health
+
+    @property
+    def member_health(self) -> np.ndarray:
+        return self.members.health
+
+    def get_alive_members(self) -> np.ndarray:
+        return self.alive_members
+
+    def get_alive_count(self) -> int:
+        return self.alive_count
+
+    def take_hits(self, hit_damage: np.ndarray, targets: np.ndarray, damage: int) -> int:
+        """Lands every hit on its target member, carrying what a hit has left after killing its member on to the rest.
+
+        :param hit_damage: Damage of every hit
+        :param targets: Member every hit is aimed at, which has to be alive
+        :param damage: The hits' total damage
+        Returns:
+            The number of members the hits killed.
+        """
+        # No damage is lost to the carry, so the swarm loses all of it until it is wiped out
+        self.remaining_health = max(0, self.remaining_health - damage)
+        if self.remaining_health == 0:
+            # Nothing is left to carry on to, so there is no need to work out who took what
+            killed: int = self.alive_count
+            self.members.health.fill(0)
+            self.alive_members = self.alive_members[:0]
+            self.alive_count = 0
+            return killed
+
+        if not self.members.apply_carried_damage(hit_damage, targets):
+            return 0
+
+        self.alive_members = self.members.get_alive_indexes()
+        killed: int = self.alive_count - len(self.alive_members)
+        self.alive_count = len(self.alive_members)
+        return killed
+
+    def get_original_health(self):
+        return self.monster_type.get_health()
+
+    def get_original_attack(self):
+        return self.monster_type.get_attack()
+
+    @staticmethod
+    def is_swarm(monster_type: MonsterType) -> bool:
+        return monster_type in MonsterGroup.swarm_sizes
+
+    @staticmethod
+    def create_encounter(monster_type: MonsterType) -> "Monster | MonsterGroup":
+        # Swarm monster types come as a group, everything else is a single monster
+        if MonsterGroup.is_swarm(monster_type):
+            return MonsterGroup(monster_type)
+        return Monster(monster_type)
@@ -0,0 +1,104 @@
+import random
+from typing import Callable, List
+
+import numpy as np
+
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+
+
+class MonsterSpawner:
+    """Weighted monster spawning with a Walker alias table per level, compiled once.
+
+    Each level gets a weight for every monster type in its spawn pool (the same pool Monster.get_random_monster_type
+    draws from). The weights are compiled with Vose's method into an alias table of spawnable monster count columns,
+    so a draw is a column pick plus one comparison whatever the weights are, and the fractional part of the same
+    random number decides between a column and its alias. Levels are clamped to 0-100.
+
+    :param weight_function: Weight of a spawn index at a level, only asked for the indexes in that level's pool.
+                            Defaults to every monster in the pool being equally likely, like get_random_monster_type
+    """
+    max_level: int = 100
+    default: "MonsterSpawner" = None
+
+    def __init__(self, weight_function: Callable[[int, int], float] = None):
+        self.monster_types: tuple = MonsterType.get_spawnable_monster_types()
+        self.column_count: int = len(self.monster_types)
+        self.probability: np.ndarray = np.zeros((MonsterSpawner.max_level + 1, self.column_count))
+        self.alias: np.ndarray = np.zeros((MonsterSpawner.max_level + 1, self.column_count), np.int64)
+
+        for level in range(MonsterSpawner.max_level + 1):
+            weights: np.ndarray = np.zeros(self.column_count)
+            for spawn_index in range(Monster.get_max_monster_index(level) + 1):
+                weights[spawn_index] = 1.0 if weight_function is None else weight_function(level, spawn_index)
+            self.probability[level], self.alias[level] = MonsterSpawner.build_alias_table(weights)
+
+        # Plain lists for single draws, which are quicker to index from Python than NumPy arrays
+        self.probability_rows: List[List[float]] = self.probability.tolist()
+        self.alias_rows: List[List[int]] = self.alias.tolist()
+
+    @staticmethod
+    def favor_tier(falloff: float) -> "MonsterSpawner":
+        # Each monster is falloff times as likely as the next one up, so the newest monsters in a pool spawn the most
+        return MonsterSpawner(lambda level, spawn_index: falloff ** (Monster.get_max_monster_index(level) - spawn_index))
+
+    @staticmethod
+    def build_alias_table(weights: np.ndarray) -> tuple:
+        # Vose's alias method, scaled so the average column holds exactly 1
+        column_count: int = len(weights)
+        scaled: List[float] = (weights * column_count / weights.sum()).tolist()
+        probability: np.ndarray = np.zeros(column_count)
+        alias: np.ndarray = np.arange(column_count)
+
+        small: List[int] = [column for column in range(column_count) if scaled[column] < 1]
+        large: List[int] = [column for column in range(column_count) if scaled[column] >= 1]
+        while len(small) > 0 and len(large) > 0:
+            small_column: int = small.pop()
+            large_column: int = large.pop()
+            probability[small_column] = scaled[small_column]
+            alias[small_column] = large_column
+
+            # The large column gives up what the small one was missing
+            scaled[large_column] += scaled[small_column] - 1
+            if scaled[large_column] < 1:
+                small.append(large_column)
+            else:
+                large.append(large_column)
+
+        # Whatever is left is 1 up to rounding error
+        for column in small + large:
+            probability[column] = 1.0
+        return probability, alias
+
+    def get_level_row(self, level: int) -> int:
+        return min(max(level, 0), MonsterSpawner.max_level)
+
+    def spawn_index(self, level: int, rng: random.Random = None) -> int:
+        if rng is None:
+            rng = random
+
+        row: int = self.get_level_row(level)
+        draw: float = rng.random() * self.column_count
+        column: int = int(draw)
+        if draw - column < self.probability_rows[row][column]:
+            return column
+        return self.alias_rows[row][column]
+
+    def spawn(self, level: int, rng: random.Random = None) -> MonsterType:
+        return self.monster_types[self.spawn_index(level, rng)]
+
+    def spawn_indexes(self, level: int | np.ndarray, count: int, generator: np.random.Generator) -> np.ndarray:
+        # count spawn indexes, for one level or one level per draw
+        rows: np.ndarray = np.clip(level, 0, MonsterSpawner.max_level)
+        draw: np.ndarray = generator.random(count) * self.column_count
+        column: np.ndarray = draw.astype(np.int64)
+        return np.where(draw - column < self.probability[rows, column], column, self.alias[rows, column])
+
+    def get_spawn_chances(self, level: int) -> np.ndarray:
+        # The chance of every spawn index at a level, rebuilt from its alias table
+        row: int = self.get_level_row(level)
+        chances: np.ndarray = self.probability[row].copy()
+        np.add.at(chances, self.alias[row], 1 - self.probability[row])
+        return chances / self.column_count
+
+
+MonsterSpawner.default = MonsterSpawner()
@@ -1,9 +1,11 @@
-from typing import List, Any
+from typing import Any, Iterable
 
 from PySide6.QtCore import QObject, Signal, SignalInstance, Property
 
 from com.github.dm0896665.main.core.math.math import Math
 from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_inventory import WeaponInventory
+from com.github.dm0896665.main.core.weapon.weapon_table import WeaponTable
 
 
 class PlayerSignal(QObject):
@@ -19,7 +21,9 @@ class Player:
         self.bank: int = 0
         self.score: int = 0
         self._selected_weapon: Weapon = Weapon.STICK
-        self.weapons: List[Weapon] = []
+        self.weapons: WeaponInventory = WeaponInventory()
+        # Weapons with their own durability, upgrades and kills, upgraded no further than upgrade_limit
+        self.weapon_instances: WeaponTable = WeaponTable()
         self.math: Math = Math()
         self.kills: int = 0
         self.deaths: int = 0
@@ -61,6 +65,15 @@ class Player:
     def selected_weapon(self, weapon: Weapon) -> None:
         self._selected_weapon = weapon
 
+    @property
+    def weapons(self) -> WeaponInventory:
+        return self._weapons
+
+    @weapons.setter
+    def weapons(self, weapons: Iterable[Weapon]) -> None:
+        # Any list of weapons is taken as a new inventory
+        self._weapons = weapons if isinstance(weapons, WeaponInventory) else WeaponInventory(weapons)
+
     @property
     def name(self) -> str:
         return self._name
@@ -97,6 +110,13 @@ class Player:
         # return the formatted KD
         return kd_formatted
 
+    def __setstate__(self, state: dict):
+        # Saves from before WeaponInventory hold the weapons as a list in weapons, and have no weapon instances yet
+        if "weapons" in state:
+            state["_weapons"] = WeaponInventory(state.pop("weapons"))
+        state.setdefault("weapon_instances", WeaponTable())
+        self.__dict__.update(state)
+
     def __setattr__(self, name, value):
         # Detect property value changes
         if hasattr(self, name) and getattr(self, name) != value:
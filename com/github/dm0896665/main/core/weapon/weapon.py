@@ -1,4 +1,6 @@
+import bisect
 from enum import Enum
+from typing import Dict, List, Tuple
 
 class WeaponType(Enum):
     PICKAXE_AND_CLUB = "Pickaxe and Club", 4
@@ -21,10 +23,7 @@ class WeaponType(Enum):
 
     @staticmethod
     def get_weapon_type_by_weapon_type_name(weapon_type_name: str):
-        for weapon_type in WeaponType:
-            if weapon_type.weapon_type_name == weapon_type_name:
-                return weapon_type
-        return None
+        return WeaponRegistry.weapon_types_by_name.get(weapon_type_name)
 
     def get_weapon_type_name(self):
         return self.weapon_type_name
@@ -83,7 +82,98 @@ class Weapon(Enum):
 
     @staticmethod
     def get_weapon_by_weapon_name(weapon_name: str):
-        for weapon in Weapon:
-            if weapon.weapon_name == weapon_name:
-                return weapon
-        return None
+        return WeaponRegistry.by_name.get(weapon_name)
+
+    def get_catalog_index(self) -> int:
+        return WeaponRegistry.catalog_indexes[self]
+
+    @staticmethod
+    def get_weapons_by_weapon_type(weapon_type: WeaponType) -> Tuple["Weapon", ...]:
+        return WeaponRegistry.by_weapon_type.get(weapon_type, ())
+
+    @staticmethod
+    def get_weapons_by_image_name(weapon_image_name: str) -> Tuple["Weapon", ...]:
+        return WeaponRegistry.by_image_name.get(weapon_image_name, ())
+
+    @staticmethod
+    def get_weapons_within(max_price: int = None, max_strength: int = None) -> Tuple["Weapon", ...]:
+        # Every weapon priced at most max_price that needs at most max_strength, in catalog order
+        mask: int = WeaponRegistry.all_mask
+        if max_price is not None:
+            mask &= WeaponRegistry.price_masks[bisect.bisect_right(WeaponRegistry.prices, max_price)]
+        if max_strength is not None:
+            mask &= WeaponRegistry.strength_masks[bisect.bisect_right(WeaponRegistry.strengths, max_strength)]
+        return WeaponRegistry.get_mask_weapons(mask)
+
+    @staticmethod
+    def get_weapons_by_price_range(min_price: int, max_price: int) -> Tuple["Weapon", ...]:
+        # Cheapest first
+        return WeaponRegistry.by_price[bisect.bisect_left(WeaponRegistry.prices, min_price):bisect.bisect_right(WeaponRegistry.prices, max_price)]
+
+    @staticmethod
+    def get_weapons_by_strength_range(min_strength: int, max_strength: int) -> Tuple["Weapon", ...]:
+        # Least strength needed first
+        return WeaponRegistry.by_strength[bisect.bisect_left(WeaponRegistry.strengths, min_strength):bisect.bisect_right(WeaponRegistry.strengths, max_strength)]
+
+
+class WeaponRegistry:
+    """Lookups over the WeaponType and Weapon catalogs, built once when this module is imported.
+
+    by_price and by_strength are the catalog sorted by price and by strength, ties in catalog order, next to their sorted
+    prices and strengths. price_masks[count] and strength_masks[count] are bitmasks over catalog indexes of the first
+    count weapons of each, so a price or strength limit is one bisect and both limits together are one &.
+    """
+    weapon_types_by_name: Dict[str, WeaponType] = {}
+    catalog: Tuple[Weapon, ...] = ()
+    catalog_indexes: Dict[Weapon, int] = {}
+    by_name: Dict[str, Weapon] = {}
+    by_weapon_type: Dict[WeaponType, Tuple[Weapon, ...]] = {}
+    by_image_name: Dict[str, Tuple[Weapon, ...]] = {}
+    by_price: Tuple[Weapon, ...] = ()
+    prices: List[int] = []
+    price_masks: List[int] = []
+    by_strength: Tuple[Weapon, ...] = ()
+    strengths: List[int] = []
+    strength_masks: List[int] = []
+    all_mask: int = 0
+    # Weapons per catalog bitmask, filled as masks are asked for
+    _mask_weapons: Dict[int, Tuple[Weapon, ...]] = {}
+
+    @staticmethod
+    def build():
+        WeaponRegistry.weapon_types_by_name = {weapon_type.weapon_type_name: weapon_type for weapon_type in WeaponType}
+        WeaponRegistry.catalog = tuple(Weapon)
+        WeaponRegistry.catalog_indexes = {weapon: index for index, weapon in enumerate(WeaponRegistry.catalog)}
+        WeaponRegistry.by_name = {weapon.weapon_name: weapon for weapon in WeaponRegistry.catalog}
+        WeaponRegistry.by_weapon_type = {weapon_type: tuple(weapon for weapon in WeaponRegistry.catalog if weapon.weapon_type == weapon_type) for weapon_type in WeaponType}
+        WeaponRegistry.by_image_name = {image_name: tuple(weapon for weapon in WeaponRegistry.catalog if weapon.weapon_image_name == image_name)
+                                        for image_name in dict.fromkeys(weapon.weapon_image_name for weapon in WeaponRegistry.catalog)}
+        WeaponRegistry.all_mask = (1 << len(WeaponRegistry.catalog)) - 1
+
+        # sorted keeps ties in catalog order
+        WeaponRegistry.by_price = tuple(sorted(WeaponRegistry.catalog, key=lambda weapon: weapon.price))
+        WeaponRegistry.prices = [weapon.price for weapon in WeaponRegistry.by_price]
+        WeaponRegistry.price_masks = WeaponRegistry.get_prefix_masks(WeaponRegistry.by_price)
+        WeaponRegistry.by_strength = tuple(sorted(WeaponRegistry.catalog, key=lambda weapon: weapon.strength))
+        WeaponRegistry.strengths = [weapon.strength for weapon in WeaponRegistry.by_strength]
+        WeaponRegistry.strength_masks = WeaponRegistry.get_prefix_masks(WeaponRegistry.by_strength)
+        WeaponRegistry._mask_weapons = {}
+
+    @staticmethod
+    def get_prefix_masks(weapons: Tuple[Weapon, ...]) -> List[int]:
+        masks: List[int] = [0]
+        for weapon in weapons:
+            masks.append(masks[-1] | 1 << WeaponRegistry.catalog_indexes[weapon])
+        return masks
+
+    @staticmethod
+    def get_mask_weapons(mask: int) -> Tuple[Weapon, ...]:
+        weapons: Tuple[Weapon, ...] = WeaponRegistry._mask_weapons.get(mask)
+        if weapons is None:
+            weapons = tuple(weapon for index, weapon in enumerate(WeaponRegistry.catalog) if mask >> index & 1)
+            WeaponRegistry._mask_weapons[mask] = weapons
+        return weapons
+
+
+WeaponRegistry.build()
+
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Tuple
+
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+
+
+class WeaponInventory:
+    """The weapons a player carries besides their selected one, as a count per weapon of the catalog.
+
+    Adding, removing and checking for a weapon only touch its count and a bitmask of the weapons with a count above 0,
+    and iteration is in catalog order. The weapons, owned and unowned views are tuples built at most once per change
+    to the inventory, and unowned views are shared by every inventory with the same owned weapons, so drop rolls and
+    shop screens never rescan the catalog. An inventory pickles as a few bytes, see to_bytes.
+
+    :param weapons: Weapons to start with, a weapon may appear more than once
+    """
+    catalog: Tuple[Weapon, ...] = WeaponRegistry.catalog
+    catalog_indexes: Dict[Weapon, int] = WeaponRegistry.catalog_indexes
+    drop_pool_count: int = 4
+    # Unowned drop pools per owned weapon mask, shared by every inventory
+    _unowned_drop_pools: Dict[int, Tuple[Tuple[Weapon, ...], ...]] = {}
+
+    def __init__(self, weapons: Iterable[Weapon] = ()):
+        self.counts: List[int] = [0] * len(WeaponInventory.catalog)
+        self.mask: int = 0
+        self.size: int = 0
+        self._weapons_view: Tuple[Weapon, ...] = None
+        self._owned_view: Tuple[Weapon, ...] = None
+        self._owned_view_weapon: Weapon = None
+        self._owned_drop_pools: Tuple[Tuple[Weapon, ...], ...] = None
+        for weapon in weapons:
+            self.add(weapon)
+
+    def add(self, weapon: Weapon):
+        weapon_index: int = WeaponInventory.catalog_indexes[weapon]
+        self.counts[weapon_index] += 1
+        self.mask |= 1 << weapon_index
+        self.size += 1
+        self.clear_views()
+
+    def append(self, weapon: Weapon):
+        # The list method Player.weapons callers already use
+        self.add(weapon)
+
+    def remove(self, weapon: Weapon):
+        weapon_index: int = WeaponInventory.catalog_indexes[weapon]
+        if self.counts[weapon_index] == 0:
+            raise ValueError(weapon.weapon_name + " is not in the inventory")
+
+        self.counts[weapon_index] -= 1
+        if self.counts[weapon_index] == 0:
+            self.mask &= ~(1 << weapon_index)
+        self.size -= 1
+        self.clear_views()
+
+    def count(self, weapon: Weapon) -> int:
+        return self.counts[WeaponInventory.catalog_indexes[weapon]]
+
+    def clear_views(self):
+        self._weapons_view = None
+        self._owned_view = None
+        self._owned_drop_pools = None
+
+    def __contains__(self, weapon: Weapon) -> bool:
+        return self.mask >> WeaponInventory.catalog_indexes[weapon] & 1 == 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return iter(self.get_weapons())
+
+    def __getitem__(self, index: int) -> Weapon:
+        return self.get_weapons()[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WeaponInventory):
+            return NotImplemented
+        return self.counts == other.counts
+
+    def __repr__(self) -> str:
+        return "WeaponInventory(" + ", ".join(weapon.weapon_name for weapon in self) + ")"
+
+    def get_weapons(self) -> Tuple[Weapon, ...]:
+        if self._weapons_view is None:
+            self._weapons_view = tuple(weapon for weapon, count in zip(WeaponInventory.catalog, self.counts) for _ in range(count))
+        return self._weapons_view
+
+    def get_owned_weapons(self, selected_weapon: Weapon) -> Tuple[Weapon, ...]:
+        # The inventory with the selected weapon in its catalog place
+        if self._owned_view is None or self._owned_view_weapon != selected_weapon:
+            selected_index: int = WeaponInventory.catalog_indexes[selected_weapon]
+            self._owned_view = tuple(weapon for weapon_index, (weapon, count) in enumerate(zip(WeaponInventory.catalog, self.counts))
+                                     for _ in range(count + (weapon_index == selected_index)))
+            self._owned_view_weapon = selected_weapon
+            self._owned_drop_pools = None
+        return self._owned_view
+
+    def get_unowned_weapons(self, selected_weapon: Weapon) -> Tuple[Weapon, ...]:
+        owned_mask: int = self.mask | 1 << WeaponInventory.catalog_indexes[selected_weapon]
+        return WeaponRegistry.get_mask_weapons(WeaponRegistry.all_mask & ~owned_mask)
+
+    @staticmethod
+    def get_drop_pools(weapons: Tuple[Weapon, ...]) -> Tuple[Tuple[Weapon, ...], ...]:
+        # Pool 0 never drops, pools 1 to 4 are consecutive quarters of the weapons, leaving out the remainder at the end
+        pool_size: int = len(weapons) // WeaponInventory.drop_pool_count
+        return ((),) + tuple(weapons[pool_size * pool:pool_size * (pool + 1)] for pool in range(WeaponInventory.drop_pool_count))
+
+    def get_owned_drop_pools(self, selected_weapon: Weapon) -> Tuple[Tuple[Weapon, ...], ...]:
+        owned_weapons: Tuple[Weapon, ...] = self.get_owned_weapons(selected_weapon)
+        if self._owned_drop_pools is None:
+            self._owned_drop_pools = WeaponInventory.get_drop_pools(owned_weapons)
+        return self._owned_drop_pools
+
+    def get_unowned_drop_pools(self, selected_weapon: Weapon) -> Tuple[Tuple[Weapon, ...], ...]:
+        owned_mask: int = self.mask | 1 << WeaponInventory.catalog_indexes[selected_weapon]
+        drop_pools: Tuple[Tuple[Weapon, ...], ...] = WeaponInventory._unowned_drop_pools.get(owned_mask)
+        if drop_pools is None:
+            drop_pools = WeaponInventory.get_drop_pools(self.get_unowned_weapons(selected_weapon))
+            WeaponInventory._unowned_drop_pools[owned_mask] = drop_pools
+        return drop_pools
+
+    def get_owned_counts(self, selected_weapon: Weapon) -> List[int]:
+        # Count per catalog weapon with the selected weapon included, the layout WeaponUtil.weapon_drop_many takes
+        owned_counts: List[int] = list(self.counts)
+        owned_counts[WeaponInventory.catalog_indexes[selected_weapon]] += 1
+        return owned_counts
+
+    def to_bytes(self) -> bytes:
+        # The owned weapon bitmask when no weapon is held twice, one count byte per catalog weapon while every count fits
+        # in one, otherwise four little-endian count bytes per catalog weapon
+        largest_count: int = max(self.counts, default=0)
+        if largest_count <= 1:
+            return b"\x00" + self.mask.to_bytes((len(WeaponInventory.catalog) + 7) // 8, "little")
+        if largest_count <= 255:
+            return b"\x01" + bytes(self.counts)
+        return b"\x02" + b"".join(count.to_bytes(4, "little") for count in self.counts)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "WeaponInventory":
+        weapon_inventory: WeaponInventory = WeaponInventory()
+        if data[0] == 0:
+            mask: int = int.from_bytes(data[1:], "little")
+            counts: List[int] = [mask >> weapon_index & 1 for weapon_index in range(len(WeaponInventory.catalog))]
+        elif data[0] == 1:
+            counts = list(data[1:len(WeaponInventory.catalog) + 1])
+        else:
+            counts = [int.from_bytes(data[1 + weapon_index * 4:5 + weapon_index * 4], "little") for weapon_index in range(len(WeaponInventory.catalog))]
+        weapon_inventory.counts = counts
+        weapon_inventory.mask = sum(1 << weapon_index for weapon_index, count in enumerate(counts) if count > 0)
+        weapon_inventory.size = sum(counts)
+        return weapon_inventory
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, state: bytes):
+        self.__dict__.update(WeaponInventory.from_bytes(state).__dict__)
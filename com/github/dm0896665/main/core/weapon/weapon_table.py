@@ -0,0 +1,243 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from com.github.dm0896665.main.core.weapon.weapon import Weapon, WeaponRegistry
+
+
+class WeaponTable:
+    """Weapon instances as struct-of-arrays, one row per instance in every column.
+
+    type_index is the instance's position in the Weapon catalog, and durability, upgrade_level and kills are its own
+    state, so two Swords can wear down and level up apart. Every instance gets a handle when it is added that stays
+    valid until it is removed and is never given out again. Handles are kept in ascending order, which makes finding
+    the rows of many handles one searchsorted, and removing rows keeps that order. Wear, kills and upgrades are applied
+    to every instance or to chosen handles at once. Columns grow by doubling, so adding one instance at a time stays
+    cheap. A table pickles as each column in the narrowest unsigned type that holds it, see to_bytes.
+
+    :param weapons: Weapons to start with, each as a new unworn instance
+    """
+    catalog: Tuple[Weapon, ...] = WeaponRegistry.catalog
+    max_durability: int = 100
+    column_names: Tuple[str, ...] = ("handle", "type_index", "durability", "upgrade_level", "kills")
+    # Format byte of to_bytes, bumped whenever the layout changes
+    format_version: int = 1
+    # Unsigned types a saved column may take, by the type code saved in front of it
+    saved_types: Dict[int, np.dtype] = {1: np.dtype("<u1"), 2: np.dtype("<u2"), 4: np.dtype("<u4"), 8: np.dtype("<u8")}
+
+    def __init__(self, weapons: Iterable[Weapon] = ()):
+        self.size: int = 0
+        self.next_handle: int = 0
+        self.handle: np.ndarray = np.zeros(0, np.int64)
+        self.type_index: np.ndarray = np.zeros(0, np.int64)
+        self.durability: np.ndarray = np.zeros(0, np.int64)
+        self.upgrade_level: np.ndarray = np.zeros(0, np.int64)
+        self.kills: np.ndarray = np.zeros(0, np.int64)
+        self.add_many(weapons)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def reserve(self, count: int):
+        # Room for count more rows, at least doubling the columns when they grow
+        capacity: int = len(self.handle)
+        if self.size + count <= capacity:
+            return
+
+        capacity = max(self.size + count, capacity * 2, 16)
+        for column_name in WeaponTable.column_names:
+            column: np.ndarray = np.zeros(capacity, np.int64)
+            column[:self.size] = getattr(self, column_name)[:self.size]
+            setattr(self, column_name, column)
+
+    def add(self, weapon: Weapon, durability: int = None, upgrade_level: int = 0, kills: int = 0) -> int:
+        return int(self.add_type_indexes([WeaponRegistry.catalog_indexes[weapon]], durability, upgrade_level, kills)[0])
+
+    def add_many(self, weapons: Iterable[Weapon]) -> np.ndarray:
+        return self.add_type_indexes(np.fromiter((WeaponRegistry.catalog_indexes[weapon] for weapon in weapons), np.int64))
+
+    def add_type_indexes(self, type_index: np.ndarray, durability: int | np.ndarray = None, upgrade_level: int | np.ndarray = 0,
+                         kills: int | np.ndarray = 0) -> np.ndarray:
+        """Adds an instance of every catalog index in type_index, unworn unless a durability is given.
+
+        Returns:
+            The handles of the new instances, in the order of type_index.
+        """
+        type_index = np.asarray(type_index, np.int64)
+        WeaponTable.check_range("Type index", type_index, len(WeaponTable.catalog) - 1)
+        if durability is not None:
+            WeaponTable.check_range("Durability", durability, WeaponTable.max_durability)
+        WeaponTable.check_range("Upgrade level", upgrade_level)
+        WeaponTable.check_range("Kills", kills)
+        count: int = len(type_index)
+        self.reserve(count)
+
+        rows: slice = slice(self.size, self.size + count)
+        handles: np.ndarray = np.arange(self.next_handle, self.next_handle + count, dtype=np.int64)
+        self.handle[rows] = handles
+        self.type_index[rows] = type_index
+        self.durability[rows] = WeaponTable.max_durability if durability is None else durability
+        self.upgrade_level[rows] = upgrade_level
+        self.kills[rows] = kills
+        self.size += count
+        self.next_handle += count
+        return handles
+
+    @staticmethod
+    def check_range(value_name: str, values: int | np.ndarray, maximum: int = None):
+        # Every column saves unsigned, so nothing may go below 0
+        values = np.asarray(values)
+        if np.any(values < 0):
+            raise ValueError(value_name + " can't be negative, not " + str(values.min()))
+        if maximum is not None and np.any(values > maximum):
+            raise ValueError(value_name + " can't be above " + str(maximum) + ", not " + str(values.max()))
+
+    def get_rows(self, handles: int | np.ndarray) -> np.ndarray:
+        # Rows of handles, every one of which has to be in the table
+        handles = np.asarray(handles, np.int64)
+        handle_column: np.ndarray = self.handle[:self.size]
+        rows: np.ndarray = np.searchsorted(handle_column, handles)
+        is_found: np.ndarray = np.zeros(handles.shape, bool) if self.size == 0 else (rows < self.size) & (handle_column.take(rows, mode="clip") == handles)
+        if not np.all(is_found):
+            raise ValueError("Weapon handle " + str(np.atleast_1d(handles)[~np.atleast_1d(is_found)][0]) + " is not in the table")
+        return rows
+
+    def __contains__(self, handle: int) -> bool:
+        row: int = int(np.searchsorted(self.handle[:self.size], handle))
+        return row < self.size and self.handle[row] == handle
+
+    def remove(self, handles: int | np.ndarray):
+        # Later rows move up to close the gaps, so handles stay in ascending order
+        is_kept: np.ndarray = np.ones(self.size, bool)
+        is_kept[self.get_rows(handles)] = False
+        kept_count: int = int(np.count_nonzero(is_kept))
+        for column_name in WeaponTable.column_names:
+            column: np.ndarray = getattr(self, column_name)
+            column[:kept_count] = column[:self.size][is_kept]
+        self.size = kept_count
+
+    def get_handles(self) -> np.ndarray:
+        return self.handle[:self.size].copy()
+
+    def get_weapon(self, handle: int) -> Weapon:
+        return WeaponTable.catalog[self.type_index[self.get_rows(handle)]]
+
+    def get_durability(self, handles: int | np.ndarray) -> int | np.ndarray:
+        return self.get_values(self.durability, handles)
+
+    def get_upgrade_level(self, handles: int | np.ndarray) -> int | np.ndarray:
+        return self.get_values(self.upgrade_level, handles)
+
+    def get_kills(self, handles: int | np.ndarray) -> int | np.ndarray:
+        return self.get_values(self.kills, handles)
+
+    def get_values(self, column: np.ndarray, handles: int | np.ndarray) -> int | np.ndarray:
+        # A plain int for one handle, an array for an array of them
+        values: np.ndarray = column[self.get_rows(handles)]
+        return int(values) if np.ndim(values) == 0 else values
+
+    def get_selected_rows(self, handles: np.ndarray = None) -> np.ndarray | slice:
+        return slice(0, self.size) if handles is None else self.get_rows(handles)
+
+    def wear(self, amount: int | np.ndarray, handles: np.ndarray = None) -> np.ndarray:
+        """Takes durability off every instance, or off the instances of handles with one amount per handle.
+
+        Durability stops at 0, and a handle may repeat, with each of its amounts taken off.
+
+        Returns:
+            The handles of the instances this wear broke.
+        """
+        WeaponTable.check_range("Wear", amount)
+        was_whole: np.ndarray = self.durability[:self.size] > 0
+        if handles is None:
+            self.durability[:self.size] -= np.asarray(amount, np.int64)
+        else:
+            handles = np.asarray(handles, np.int64)
+            self.durability[:self.size] -= np.bincount(self.get_rows(handles), np.broadcast_to(amount, handles.shape), self.size).astype(np.int64)
+        np.maximum(self.durability[:self.size], 0, out=self.durability[:self.size])
+        return self.handle[:self.size][was_whole & (self.durability[:self.size] == 0)]
+
+    def repair(self, handles: np.ndarray = None):
+        self.durability[self.get_selected_rows(handles)] = WeaponTable.max_durability
+
+    def add_kills(self, kills: int | np.ndarray, handles: np.ndarray = None):
+        # Like wear, a handle may repeat and each of its kills counts
+        WeaponTable.check_range("Kills", kills)
+        if handles is None:
+            self.kills[:self.size] += np.asarray(kills, np.int64)
+        else:
+            handles = np.asarray(handles, np.int64)
+            self.kills[:self.size] += np.bincount(self.get_rows(handles), np.broadcast_to(kills, handles.shape), self.size).astype(np.int64)
+
+    def upgrade(self, upgrade_limit: int, handles: np.ndarray = None) -> np.ndarray:
+        """Raises the upgrade level of every instance, or of the instances of handles, by 1 up to upgrade_limit.
+
+        Returns:
+            The handles of the instances that were upgraded, those already at the limit are left as they are.
+        """
+        rows: np.ndarray = np.arange(self.size) if handles is None else np.unique(self.get_rows(handles))
+        rows = rows[self.upgrade_level[rows] < upgrade_limit]
+        self.upgrade_level[rows] += 1
+        return self.handle[rows]
+
+    def get_type_counts(self) -> np.ndarray:
+        # Instances per catalog weapon, the layout of WeaponInventory.counts
+        return np.bincount(self.type_index[:self.size], minlength=len(WeaponTable.catalog))
+
+    def get_broken_handles(self) -> np.ndarray:
+        return self.handle[:self.size][self.durability[:self.size] == 0]
+
+    def get_page(self, start: int, count: int) -> List[Tuple[int, Weapon, int, int, int]]:
+        # (handle, weapon, durability, upgrade level, kills) of the rows a screen shows, without touching the rest
+        rows: slice = slice(max(start, 0), min(start + count, self.size))
+        return list(zip(self.handle[rows].tolist(), [WeaponTable.catalog[type_index] for type_index in self.type_index[rows].tolist()],
+                        self.durability[rows].tolist(), self.upgrade_level[rows].tolist(), self.kills[rows].tolist()))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WeaponTable):
+            return NotImplemented
+        return self.size == other.size and self.next_handle == other.next_handle and all(
+            np.array_equal(getattr(self, column_name)[:self.size], getattr(other, column_name)[:other.size]) for column_name in WeaponTable.column_names)
+
+    def __repr__(self) -> str:
+        return "WeaponTable(" + ", ".join(f"{handle}: {weapon.weapon_name}" for handle, weapon, _, _, _ in self.get_page(0, self.size)) + ")"
+
+    def to_bytes(self) -> bytes:
+        """The table as a format byte, the row count and next handle as 8 byte unsigned ints, then every column.
+
+        A column is one byte with the size of its values followed by the values, each in the fewest of 1, 2, 4 or 8
+        bytes that hold the column's largest value, so a few thousand instances save in a few kilobytes.
+        """
+        parts: List[bytes] = [bytes([WeaponTable.format_version]), self.size.to_bytes(8, "little"), self.next_handle.to_bytes(8, "little")]
+        for column_name in WeaponTable.column_names:
+            column: np.ndarray = getattr(self, column_name)[:self.size]
+            if self.size > 0 and column.min() < 0:
+                raise ValueError("Can't save a negative " + column_name + " of " + str(column.min()))
+            largest: int = int(column.max()) if self.size > 0 else 0
+            item_size: int = next(item_size for item_size, saved_type in WeaponTable.saved_types.items() if largest <= np.iinfo(saved_type).max)
+            parts.append(bytes([item_size]))
+            parts.append(column.astype(WeaponTable.saved_types[item_size]).tobytes())
+        return b"".join(parts)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "WeaponTable":
+        if data[0] != WeaponTable.format_version:
+            raise ValueError("Unknown weapon table format " + str(data[0]))
+
+        weapon_table: WeaponTable = WeaponTable()
+        size: int = int.from_bytes(data[1:9], "little")
+        weapon_table.reserve(size)
+        offset: int = 17
+        for column_name in WeaponTable.column_names:
+            saved_type: np.dtype = WeaponTable.saved_types[data[offset]]
+            getattr(weapon_table, column_name)[:size] = np.frombuffer(data, saved_type, size, offset + 1)
+            offset += 1 + size * saved_type.itemsize
+        weapon_table.size = size
+        weapon_table.next_handle = int.from_bytes(data[9:17], "little")
+        return weapon_table
+
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+
+    def __setstate__(self, state: bytes):
+        self.__dict__.update(WeaponTable.from_bytes(state).__dict__)
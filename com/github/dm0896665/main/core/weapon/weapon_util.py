@@ -1,49 +1,102 @@
+import bisect
 import random
-from typing import List
+from typing import Dict, List, Tuple
 
-from com.github.dm0896665.main.core.monster.monster import Monster
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.loadout_optimizer import LoadoutOptimizer
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_batch import MonsterBatch
 from com.github.dm0896665.main.core.player.player import Player
 from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_inventory import WeaponInventory
 from com.github.dm0896665.main.ui.prompts.dropdown_prompt import DropdownPrompt
 from com.github.dm0896665.main.util.player_util import PlayerUtil
 
 
 class WeaponUtil:
+    # Highest original health of drop sections 1 to 3, anything tougher drops from section 4
+    drop_section_health: Tuple[int, ...] = (1000, 2500, 4000)
+    drop_sections: Dict[MonsterType, int] = {}
+    catalog_drop_sections: np.ndarray = None
+
     @staticmethod
     def switch_weapon():
+        WeaponUtil.select_weapon(WeaponUtil.choose_weapon())
+
+    @staticmethod
+    def choose_weapon(monster_health: int = None) -> Weapon:
         player: Player = PlayerUtil.current_player
         selected_weapon: Weapon = player.selected_weapon
-        current_weapons: List[Weapon] = player.weapons + [selected_weapon]
+        current_weapons: Tuple[Weapon, ...] = WeaponUtil.get_owned_weapons(player)
+
+        # Against a monster the weapons are listed best first, with the best one already picked
+        prompt_text: str = "You currently have the " + selected_weapon.weapon_name + " that does " + str(selected_weapon.damage) + " damage with an attack rate of " + str(selected_weapon.attack_rate) + " selected.\n What weapon would you like to swap it out for?"
+        best_weapon_name: str = None
+        if monster_health is not None:
+            current_weapons = tuple(LoadoutOptimizer.rank_weapons(current_weapons, monster_health))
+            best_weapon_name = current_weapons[0].weapon_name
+            prompt_text += "\nYour " + best_weapon_name + " should do the most damage against it."
         weapon_names: List[str] = [weapon.weapon_name for weapon in current_weapons]
 
-        new_weapon: str = DropdownPrompt("You currently have the " + selected_weapon.weapon_name + " that does " + str(selected_weapon.damage) + " damage with an attack rate of " + str(selected_weapon.attack_rate) + " selected.\n What weapon would you like to swap it out for?",
-                                         *weapon_names).show_and_get_results()
+        new_weapon: str = DropdownPrompt(prompt_text, *weapon_names, selected_option=best_weapon_name).show_and_get_results()
 
-        if selected_weapon.weapon_name != new_weapon:
-            player.weapons.append(selected_weapon)
-            player.selected_weapon = next((weapon for weapon in current_weapons if weapon.weapon_name == new_weapon), None)
+        # The dropdown only offers owned weapons, anything else keeps the selected one
+        weapon: Weapon = Weapon.get_weapon_by_weapon_name(new_weapon)
+        return weapon if weapon is not None and weapon in player.weapons else selected_weapon
 
     @staticmethod
-    def get_owned_weapons() -> List[Weapon]:
-        player: Player = PlayerUtil.current_player
-        return player.weapons + [player.selected_weapon]
+    def get_best_weapon(monster_health: int, player: Player = None) -> Weapon:
+        if player is None:
+            player = PlayerUtil.current_player
+        return LoadoutOptimizer.get_best_weapon(WeaponUtil.get_owned_weapons(player), monster_health)
+
+    @staticmethod
+    def select_weapon(weapon: Weapon, player: Player = None):
+        if player is None:
+            player = PlayerUtil.current_player
+
+        if player.selected_weapon != weapon:
+            player.weapons.remove(weapon)
+            player.weapons.add(player.selected_weapon)
+            player.selected_weapon = weapon
+
+    @staticmethod
+    def get_owned_weapons(player: Player = None) -> Tuple[Weapon, ...]:
+        # Every weapon the player has, the selected one included, in catalog order
+        if player is None:
+            player = PlayerUtil.current_player
+        return player.weapons.get_owned_weapons(player.selected_weapon)
+
+    @staticmethod
+    def get_unowned_weapons(player: Player = None) -> Tuple[Weapon, ...]:
+        if player is None:
+            player = PlayerUtil.current_player
+        return player.weapons.get_unowned_weapons(player.selected_weapon)
 
     @staticmethod
-    def get_unowned_weapons() -> List[Weapon]:
-        owned_weapons: List[Weapon] = WeaponUtil.get_owned_weapons()
-        owned_weapon_names: List[str] = [weapon.name for weapon in owned_weapons]
-        return [weapon for weapon in Weapon if weapon.name not in owned_weapon_names]
+    def get_all_weapons() -> Tuple[Weapon, ...]:
+        return WeaponInventory.catalog
 
     @staticmethod
-    def get_all_weapons() -> List[Weapon]:
-        return [weapon for weapon in Weapon]
+    def get_drop_section(health: int) -> int:
+        # Monsters up to 1000 health drop from pool 1, up to 2500 from pool 2, up to 4000 from pool 3 and tougher ones from pool 4
+        if health < 0:
+            return 0
+        return bisect.bisect_left(WeaponUtil.drop_section_health, health) + 1
 
     @staticmethod
-    def weapon_drop(monster: Monster) -> List[Weapon]:
+    def weapon_drop(monster: Monster, player: Player = None, rng: random.Random = None) -> List[Weapon]:
+        # Use the global random module unless the caller has its own stream
+        if rng is None:
+            rng = random
+        if player is None:
+            player = PlayerUtil.current_player
+
         # Initialize variables
         weapons_dropped: List[Weapon] = []
-        owned_weapons: List[Weapon] = WeaponUtil.get_owned_weapons()
-        unowned_weapons: List[Weapon] = WeaponUtil.get_unowned_weapons()
+        owned_weapons: Tuple[Weapon, ...] = WeaponUtil.get_owned_weapons(player)
+        unowned_weapons: Tuple[Weapon, ...] = WeaponUtil.get_unowned_weapons(player)
         owned_weapon_drop_chance: int = 50
         unowned_weapon_drop_chance: int = 50
 
@@ -51,52 +104,69 @@ class WeaponUtil:
         # Owned weapons will drop after player has more than 4 weapons
         # Unowned weapons will drop until the player only has 4 unowned weapons
         if len(owned_weapons) > 4:
-            owned_weapon_drop_chance = random.randint(0,100)
+            owned_weapon_drop_chance = rng.randint(0,100)
         if len(unowned_weapons) > 4:
-            unowned_weapon_drop_chance = random.randint(0,100)
-
-        # Initialize owned weapon pool
-        weapons_in_owned_pool: int = len(owned_weapons) / 4
-        owned_weapon_pool_section: int = 0
-
-        # Initialize unowned weapon pool
-        weapons_in_unowned_pool: int = len(unowned_weapons) / 4
-        unowned_weapon_pool_section: int = 0
-
-        # Find weapon pool section based on monster health
-        weapon_pool_section: int = 0
-        if 1000 >= monster.get_original_health() >= 0:
-            weapon_pool_section = 1
-        elif 2500 >= monster.get_original_health() > 1000:
-            weapon_pool_section = 2
-        elif 4000 >= monster.get_original_health() > 2500:
-            weapon_pool_section = 3
-        elif monster.get_original_health() > 4000:
-            weapon_pool_section = 4
-
-        # Assign the section for owned weapons at a 25% chance and for unowned weapons at a 15% chance
+            unowned_weapon_drop_chance = rng.randint(0,100)
+
+        # The pool section comes from the monster's health band, the pools themselves are cached by the inventory
+        weapon_pool_section: int = WeaponUtil.drop_sections[monster.monster_type]
+        if weapon_pool_section == 0:
+            return weapons_dropped
+
+        # Add copy of owned weapon to drop list if one was dropped, at a 25% chance
         if 25 > owned_weapon_drop_chance >= 0:
-            owned_weapon_pool_section = weapon_pool_section
+            owned_pool: Tuple[Weapon, ...] = player.weapons.get_owned_drop_pools(player.selected_weapon)[weapon_pool_section]
+            weapons_dropped.append(owned_pool[rng.randint(0, len(owned_pool) - 1)])
+
+        # Add unowned weapon to drop list if one was dropped, at a 15% chance
         if 15 > unowned_weapon_drop_chance >= 0:
-            unowned_weapon_pool_section = weapon_pool_section
-
-        # Add copy of owned weapon to drop list if one was dropped
-        if owned_weapon_pool_section > 0:
-            owned_weapon_pool_max: int = (weapons_in_owned_pool * owned_weapon_pool_section) - 1
-            owned_weapon_pool_min: int = owned_weapon_pool_max - weapons_in_owned_pool + 1
-            found_index: int = random.randint(owned_weapon_pool_min, owned_weapon_pool_max)
-            weapons_dropped.append(Weapon.get_weapon_by_weapon_name(owned_weapons[found_index].weapon_name))
-
-        # Add unowned weapon to drop list if one was dropped
-        if unowned_weapon_pool_section > 0:
-            unowned_weapon_pool_max: int = (weapons_in_unowned_pool * unowned_weapon_pool_section) - 1
-            unowned_weapon_pool_min: int = unowned_weapon_pool_max - weapons_in_unowned_pool + 1
-            found_index: int = random.randint(unowned_weapon_pool_min, unowned_weapon_pool_max)
-            weapons_dropped.append(unowned_weapons[found_index])
+            unowned_pool: Tuple[Weapon, ...] = player.weapons.get_unowned_drop_pools(player.selected_weapon)[weapon_pool_section]
+            weapons_dropped.append(unowned_pool[rng.randint(0, len(unowned_pool) - 1)])
 
         # Return dropped weapons
         return weapons_dropped
 
+    @staticmethod
+    def weapon_drop_many(monsters: MonsterBatch, generator: np.random.Generator, owned_counts: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Rolls weapon_drop for every monster in the batch at once.
+
+        owned_counts holds how many of each catalog weapon is owned, selected weapon included, as one row for every
+        kill or one row per kill (a bool array of owned weapons works too). It defaults to the current player's. Drops
+        aren't added between kills, so every kill in a row rolls against the same inventory.
+
+        Returns:
+            A tuple of (owned_drops, unowned_drops) arrays of catalog weapon indexes, -1 where no weapon dropped.
+        """
+        if owned_counts is None:
+            player: Player = PlayerUtil.current_player
+            owned_counts = np.array(player.weapons.get_owned_counts(player.selected_weapon))
+        owned_counts = np.broadcast_to(np.asarray(owned_counts, np.int64), (len(monsters), len(WeaponInventory.catalog)))
+        is_unowned: np.ndarray = owned_counts == 0
+        sections: np.ndarray = WeaponUtil.catalog_drop_sections[monsters.type_index]
+
+        owned_drops: np.ndarray = WeaponUtil.roll_drops(owned_counts, sections, 25, generator)
+        unowned_drops: np.ndarray = WeaponUtil.roll_drops(is_unowned, sections, 15, generator)
+        return owned_drops, unowned_drops
+
+    @staticmethod
+    def roll_drops(pool_counts: np.ndarray, sections: np.ndarray, drop_chance: int, generator: np.random.Generator) -> np.ndarray:
+        # Only pools of more than 4 weapons roll, their drop chance is out of randint(0, 100) like weapon_drop's
+        pool_total: np.ndarray = pool_counts.sum(axis=1)
+        is_rolled: np.ndarray = pool_total > 4
+        is_dropped: np.ndarray = is_rolled & (generator.integers(0, 101, len(sections)) < drop_chance) & (sections > 0)
+
+        drops: np.ndarray = np.full(len(sections), -1, np.int64)
+        droppers: np.ndarray = np.flatnonzero(is_dropped)
+        if len(droppers) == 0:
+            return drops
+
+        pool_size: np.ndarray = pool_total[droppers] // WeaponInventory.drop_pool_count
+        found_index: np.ndarray = pool_size * (sections[droppers] - 1) + generator.integers(0, pool_size)
+
+        # The found_index-th weapon of the pool in catalog order, counting a weapon once per copy
+        drops[droppers] = np.argmax(np.cumsum(pool_counts[droppers], axis=1) > found_index[:, None], axis=1)
+        return drops
+
     @staticmethod
     def remove_weapon(weapon: Weapon):
         player: Player = PlayerUtil.current_player
@@ -109,5 +179,9 @@ class WeaponUtil:
     @staticmethod
     def add_weapon(weapon: Weapon):
         player: Player = PlayerUtil.current_player
-        player.weapons.append(player.selected_weapon)
-        player.selected_weapon = weapon
\ No newline at end of file
+        player.weapons.add(player.selected_weapon)
+        player.selected_weapon = weapon
+
+
+WeaponUtil.drop_sections = {monster_type: WeaponUtil.get_drop_section(monster_type.health) for monster_type in MonsterType}
+WeaponUtil.catalog_drop_sections = np.array([WeaponUtil.drop_sections[monster_type] for monster_type in MonsterBatch.catalog], np.int64)
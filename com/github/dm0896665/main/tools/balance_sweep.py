@@ -0,0 +1,45 @@
+import argparse
+import os
+import time
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.balance_sweeper import BalanceSweeper, BalanceSweep
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+
+
+# Run from the repository root: python -m com.github.dm0896665.main.tools.balance_sweep --battles 10000 --output sweep
+def main():
+    parser = argparse.ArgumentParser(description="Sweep player level x weapon x monster type battle outcomes across all cores.")
+    parser.add_argument("--battles", type=int, default=10000, help="battles simulated per (level, weapon) pair")
+    parser.add_argument("--health", type=int, default=1000, help="player starting health")
+    parser.add_argument("--attack", choices=["best", "fast", "large"], default="best", help="attack style used every round")
+    parser.add_argument("--min-level", type=int, default=1)
+    parser.add_argument("--max-level", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the number of cores")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="balance_sweep", help="output path without extension")
+    parser.add_argument("--format", choices=["csv", "npz", "both"], default="both")
+    args = parser.parse_args()
+
+    battle_action: BattleAction = {"best": None, "fast": BattleAction.FAST_ATTACK, "large": BattleAction.LARGE_ATTACK}[args.attack]
+    sweeper: BalanceSweeper = BalanceSweeper(args.battles, args.health, battle_action, args.seed, args.workers)
+
+    start_time: float = time.perf_counter()
+    sweep: BalanceSweep = sweeper.sweep(list(range(args.min_level, args.max_level + 1)))
+    elapsed: float = time.perf_counter() - start_time
+
+    total_battles: int = int(sweep.stats[..., BalanceSweep.STAT_BATTLES].sum())
+    print(f"Simulated {total_battles} battles on {sweeper.max_workers} workers in {elapsed:.2f}s ({total_battles / elapsed:,.0f} battles/s)")
+
+    if args.format in ("csv", "both"):
+        sweep.save_csv(args.output + ".csv")
+        print("Wrote " + args.output + ".csv")
+    if args.format in ("npz", "both"):
+        sweep.save_npz(args.output + ".npz")
+        print("Wrote " + args.output + ".npz")
+
+
+if __name__ == "__main__":
+    main()
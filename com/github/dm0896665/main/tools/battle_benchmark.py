@@ -0,0 +1,45 @@
+import argparse
+import json
+import os
+import sys
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.battle_benchmark import BattleBenchmark
+
+
+# Run from the repository root: python -m com.github.dm0896665.main.tools.battle_benchmark --output bench.json --compare baseline.json
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the battle engine and simulator with fixed seeds and write the results as JSON.")
+    parser.add_argument("--battles", type=int, default=2000, help="battles fought through the engine per run")
+    parser.add_argument("--simulated", type=int, default=1000000, help="battles simulated in bulk per run")
+    parser.add_argument("--sessions", type=int, default=1000, help="sessions held at once for the memory benchmark")
+    parser.add_argument("--monsters", type=int, default=100000, help="monsters built for the monster instance benchmark")
+    parser.add_argument("--weapons", type=int, default=100000, help="weapon instances held in the weapon table benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each throughput benchmark, the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="write the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="fraction a metric may get worse before it counts as a regression")
+    args = parser.parse_args()
+
+    results: dict = BattleBenchmark(args.battles, args.simulated, args.sessions, args.repeat, args.seed, args.monsters, args.weapons).run()
+    print(json.dumps(results, indent=2))
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+        print("Wrote " + args.output)
+
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            lines, regressions = BattleBenchmark.compare(json.load(baseline_file), results, args.threshold)
+        print("\n".join(["Compared with " + args.compare + ":"] + lines))
+        if len(regressions) > 0:
+            print(f"{len(regressions)} metrics regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import os
+import time
+from typing import List
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_replayer import BattleReplayer, BattleReplay
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+
+
+# Run from the repository root: python -m com.github.dm0896665.main.tools.battle_replay --player NAME --battle -1 --speed 2
+def main():
+    parser = argparse.ArgumentParser(description="Replay battles from a profile's battle journal through the battle engine.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--player", help="profile name, reads the journal from the saves folder")
+    source.add_argument("--journal", help="path to a journal file")
+    parser.add_argument("--battle", type=int, action="append", help="battle index to replay (negative counts from the end), can be repeated, defaults to all")
+    parser.add_argument("--speed", type=float, default=0, help="rounds shown per second, 0 replays as fast as possible")
+    parser.add_argument("--quiet", action="store_true", help="only print a line per battle")
+    args = parser.parse_args()
+
+    path: str = args.journal if args.journal is not None else BattleJournal.get_path(args.player)
+    records: np.ndarray = BattleJournal.read(path)
+    battles: List[np.ndarray] = BattleJournal.split_battles(records)
+    print(f"{path}: {len(records)} records, {len(battles)} battles")
+
+    def on_round(battle_round: BattleRound):
+        if not args.quiet:
+            print("  " + str(battle_round))
+        if args.speed > 0:
+            time.sleep(1 / args.speed)
+
+    battle_indexes: List[int] = args.battle if args.battle is not None else list(range(len(battles)))
+    unfaithful_count: int = 0
+    start_time: float = time.perf_counter()
+    for battle_index in battle_indexes:
+        battle_records: np.ndarray = battles[battle_index]
+        start_record: np.void = battle_records[0]
+        print(f"Battle {battle_index % len(battles)}: {BattleJournal.get_weapon(start_record).weapon_name} vs "
+              f"{BattleJournal.get_monster_type(start_record).get_monster_name()}, seed {int(start_record['seed'])}")
+
+        battle_replay: BattleReplay = BattleReplayer.replay_battle(battle_records, on_round)
+        print(f"  {battle_replay.battle_result.battle_status.name} after {battle_replay.battle_result.get_round_count()} rounds, "
+              f"{'matches the journal' if battle_replay.is_faithful() else 'differs at records ' + str(battle_replay.mismatched_records)}")
+        if not battle_replay.is_faithful():
+            unfaithful_count += 1
+
+    print(f"Replayed {len(battle_indexes)} battles in {time.perf_counter() - start_time:.2f}s, {unfaithful_count} differed from the journal")
+
+
+if __name__ == "__main__":
+    main()
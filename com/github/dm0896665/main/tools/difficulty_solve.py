@@ -0,0 +1,56 @@
+import argparse
+import os
+import time
+from typing import List
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.difficulty_solver import DifficultyCurve, DifficultyFit, DifficultySolver
+
+
+def parse_curve(curve: str) -> List[tuple]:
+    # "1:0.95,50:0.8,100:0.6" -> [(1, 0.95), (50, 0.8), (100, 0.6)]
+    points: List[tuple] = []
+    for point in curve.split(","):
+        level, win_rate = point.split(":")
+        points.append((int(level), float(win_rate)))
+    return sorted(points)
+
+
+# Run from the repository root: python -m com.github.dm0896665.main.tools.difficulty_solve --curve 1:0.95,50:0.8,100:0.6 --output monster_stats.diff
+def main():
+    parser = argparse.ArgumentParser(description="Fit MonsterType stats to a target win rate curve and propose a catalog diff.")
+    parser.add_argument("--curve", type=parse_curve, default=DifficultyCurve.default_points,
+                        help="level:win_rate points the target curve is interpolated between, e.g. 1:0.95,50:0.8,100:0.6")
+    parser.add_argument("--health", type=int, default=1000, help="player starting health")
+    parser.add_argument("--battles", type=int, default=4000, help="battles simulated to score each candidate")
+    parser.add_argument("--closeness", type=float, default=0.001, help="how strongly the fit is pulled towards the current stats")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the number of cores")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=None, help="write the catalog diff to this path instead of printing it")
+    args = parser.parse_args()
+
+    solver: DifficultySolver = DifficultySolver(DifficultyCurve(args.curve, args.health), args.battles, args.closeness, args.seed, args.workers)
+
+    start_time: float = time.perf_counter()
+    difficulty_fit: DifficultyFit = solver.solve()
+    elapsed: float = time.perf_counter() - start_time
+
+    evaluations: int = sum(monster_fit.evaluations for monster_fit in difficulty_fit.monster_fits)
+    print(f"Fit {len(difficulty_fit.monster_fits)} monster types with {evaluations * args.battles:,} battles on {solver.max_workers} workers in {elapsed:.2f}s")
+    print(difficulty_fit.get_report())
+
+    catalog_diff: str = difficulty_fit.get_catalog_diff()
+    if catalog_diff == "":
+        print("Every monster type already matches the curve, no changes proposed.")
+    elif args.output is not None:
+        with open(args.output, "w") as diff_file:
+            diff_file.write(catalog_diff)
+        print("Wrote " + args.output)
+    else:
+        print(catalog_diff)
+
+
+if __name__ == "__main__":
+    main()
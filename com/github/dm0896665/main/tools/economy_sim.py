@@ -0,0 +1,49 @@
+import argparse
+import os
+import time
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.economy.economy_simulator import EconomyHistory, EconomySimulator
+from com.github.dm0896665.main.core.monster.monster_spawner import MonsterSpawner
+
+
+# Run from the repository root: python -m com.github.dm0896665.main.tools.economy_sim --players 100000 --sessions 200 --output economy
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the money, score and weapon economy of a population of players over many sessions.")
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--battles", type=int, default=5, help="battles each player fights per session")
+    parser.add_argument("--score-per-level", type=int, default=5000, help="score needed for each level")
+    parser.add_argument("--strength-per-level", type=int, default=10, help="strength gained with each level")
+    parser.add_argument("--heal", type=int, default=0, help="health restored after each session")
+    parser.add_argument("--spawn-falloff", type=float, default=None, help="favor each level's newest monsters, each one this many times as likely as the next one up")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="economy", help="output path without extension")
+    parser.add_argument("--format", choices=["csv", "npz", "both"], default="both")
+    args = parser.parse_args()
+
+    monster_spawner: MonsterSpawner = MonsterSpawner.favor_tier(args.spawn_falloff) if args.spawn_falloff is not None else None
+    simulator: EconomySimulator = EconomySimulator(args.players, args.battles, args.score_per_level, args.strength_per_level, args.heal, args.seed,
+                                                   monster_spawner)
+
+    start_time: float = time.perf_counter()
+    economy_history: EconomyHistory = simulator.simulate(args.sessions)
+    elapsed: float = time.perf_counter() - start_time
+
+    total_battles: int = args.players * args.sessions * args.battles
+    print(f"Simulated {total_battles:,} battles for {args.players:,} players in {elapsed:.2f}s ({total_battles / elapsed:,.0f} battles/s)")
+    print(f"Money supply went from {economy_history.money_supply[0]:,.0f} to {economy_history.money_supply[-1]:,.0f} coins, "
+          f"median level {economy_history.level[-1][EconomyHistory.percentiles.index(50)]:.0f} after {args.sessions} sessions")
+
+    if args.format in ("csv", "both"):
+        economy_history.save_csv(args.output + ".csv")
+        print("Wrote " + args.output + ".csv")
+    if args.format in ("npz", "both"):
+        economy_history.save_npz(args.output + ".npz")
+        print("Wrote " + args.output + ".npz")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Callable
+from typing import Generic, TypeVar, Callable, Dict
 
 from PySide6 import QtCore, QtWidgets
 from PySide6.QtCore import Qt, QEvent, QPoint
@@ -20,8 +20,11 @@ class Menu(QWidget, Generic[T]):
         self.valid_check_function: Callable[[T], bool] = None
         self.get_custom_invalid_menu_text: Callable[[T], bool] = None
         self.buttons = []
+        self.button_options = button_options
         self.menu: Menu = None
         self.column_number: int = column_number
+        # Outcomes picked by a key alone, without a button of their own
+        self.key_options: Dict[int, T] = {}
         self.loop: QtCore.QEventLoop = QtCore.QEventLoop(self)
 
         # Create container for menu options
@@ -157,6 +160,10 @@ class Menu(QWidget, Generic[T]):
 
     # This method will automatically be picked up by the QT Framework
     def keyPressEvent(self, event):
+        if event.key() in self.key_options:
+            self.on_menu_button_clicked(self.key_options[event.key()])
+            return
+
         # Enter key is the first option
         if event.key() + 1 == Qt.Key_Enter or event.key() + 1 == Qt.Key_Insert:
             self.buttons[0].click()
@@ -177,6 +184,15 @@ class Menu(QWidget, Generic[T]):
         self.setParent(None)
         self.loop.quit()
 
+    def add_key_option(self, key: int, option: T):
+        self.key_options[key] = option
+
+    def highlight_option(self, option: MenuOption):
+        # Outline the option's button so it stands out from the rest, without changing what can be clicked
+        for button_option, option_button in zip(self.button_options, self.buttons):
+            border: str = " border: 3px solid " + UiObjects.highlight_color + ";" if button_option == option else ""
+            option_button.setStyleSheet("background-color: darkGray;" + border)
+
     def on_menu_button_clicked(self, selected_option: T):
         self.outcome = selected_option
         self.loop.exit(True)
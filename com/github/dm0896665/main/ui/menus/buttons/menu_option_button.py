@@ -13,6 +13,8 @@ class MenuOption(Enum):
     RUN = "Run"
     SWITCH_WEAPONS = "Switch weapons"
     VIEW_STATS = "View stats"
+    AUTO_BATTLE = "Auto battle"
+    BEST_WEAPON = "Best weapon"
 
     def __new__(cls, *args, **kwds):
         obj = object.__new__(cls)
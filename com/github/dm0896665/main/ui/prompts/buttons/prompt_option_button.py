@@ -15,6 +15,8 @@ class PromptOption(Enum):
     OFF = "Off"
     HEALTH = "Health"
     STRENGTH = "Strength"
+    FIGHT = "Fight"
+    GRIND = "Grind"
 
     def __new__(cls, *args, **kwds):
         obj = object.__new__(cls)
@@ -5,9 +5,11 @@ from com.github.dm0896665.main.ui.prompts.buttons.prompt_option_button import Pr
 
 
 class DropdownPrompt(Prompt[str]):
-    def __init__(self, prompt_text: str, *dropdown_options: str):
+    def __init__(self, prompt_text: str, *dropdown_options: str, selected_option: str = None):
         self.dropdown :QComboBox = QComboBox()
         self.dropdown.addItems(dropdown_options)
+        if selected_option is not None:
+            self.dropdown.setCurrentText(selected_option)
         self.dropdown.setStyleSheet("background-color: darkGray;")
         super().__init__(prompt_text, [])
 
@@ -1,15 +1,26 @@
 import copy
-import random
 import time
-from enum import Enum
 from typing import Callable
 
-from PySide6.QtCore import QThreadPool, Qt, QSize, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import QThreadPool, Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer, QEventLoop
 from PySide6.QtGui import QPalette, QResizeEvent, QFont
 from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QVBoxLayout, QWidget, QLabel, QGraphicsPixmapItem, \
     QSizePolicy
 
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_result import BattleReward
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.battle.policies.optimal_policy import OptimalPolicy
+from com.github.dm0896665.main.core.battle.policy_solver import PolicySolver, PolicySolution
 from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.monster.monster_spawner import MonsterSpawner
 from com.github.dm0896665.main.core.player import player
 from com.github.dm0896665.main.core.player.player import Player
 from com.github.dm0896665.main.core.weapon.weapon import Weapon
@@ -25,54 +36,10 @@ from com.github.dm0896665.main.util.custom_ui_widgets import CustomGraphicsView
 from com.github.dm0896665.main.util.image_util import ImageUtil
 from com.github.dm0896665.main.util.player_util import PlayerUtil
 from com.github.dm0896665.main.util.save_load_util import SaveLoadUtil
+from com.github.dm0896665.main.util.thread_util import Worker
 from com.github.dm0896665.main.util.ui_util import UiUtil
-from com.github.dm0896665.main.util.ui_objects import CenteredWidget, Screen
-
-
-class BattleStatus(Enum):
-    READY = "Ready"
-    IN_PROGRESS = "In Progress"
-    PLAYER_WON = "Player Won"
-    MONSTER_WON = "Monster Won"
-    RAN_AWAY = "Ran Away"
-
-    def __new__(cls, *args, **kwds):
-        obj = object.__new__(cls)
-        obj._value_ = args[0]
-        return obj
-
-    def __init__(self, battle_status: str):
-        self.battle_status = battle_status
-
-    def __str__(self):
-        return self.battle_status
-
-    def get_battle_status(self):
-        return self.battle_status
-
-class BattleSession:
-    def __init__(self, is_practice):
-        self.monster: Monster = None
-        self.player: Player = None
-        self.fail: int = 0
-        self.round: int = 0
-        self.battle_status: BattleStatus = BattleStatus.READY
-        self.fast_attack_shown: bool = True
-        self.large_attack_shown: bool = True
-        self.choices_shown: bool = True
-        self.switch_weapons_shown: bool = True
-        self.view_stats_shown: bool = True
-        self.run_shown: bool = True
-        self.attacked_shown: bool = True
-
-        if is_practice:
-            self.fast_attack_shown = False
-            self.large_attack_shown = False
-            self.choices_shown = False
-            self.switch_weapons_shown = False
-            self.view_stats_shown = False
-            self.run_shown: bool = False
-            self.attacked_shown = False
+from com.github.dm0896665.main.util.ui_objects import CenteredWidget, Screen, CombatLogWidget, CenteredFocusWidget, UiObjects
+
 
 class Battle(Screen):
     def __init__(self, is_practice: bool = False):
@@ -80,19 +47,27 @@ class Battle(Screen):
         self.pixmap_unscaled: QGraphicsPixmapItem = None
         self.starting_player_health: int = 0
         self.battle_session: BattleSession = BattleSession(is_practice)
+        self.battle_engine: BattleEngine = BattleEngine(self.battle_session)
+        self.battle_menu: Menu = None
+        self.policy_solution: PolicySolution = None
         self.is_practice: bool = is_practice
 
     def on_screen_did_show(self):
         self.battle_session.player = PlayerUtil.current_player
+        if not self.is_practice:
+            self.battle_engine.battle_journal = BattleJournal.for_player(self.battle_session.player)
         self.assign_monster()
         self.show_monster()
         self.start()
 
     def show_monster(self):
         temp_monster: CustomGraphicsView  = CustomGraphicsView()
-        ImageUtil.load_monster_image(self.battle_session.monster.monster_name.lower().replace(" ", "_"), temp_monster)
+        ImageUtil.load_monster_image(self.battle_session.monster.monster_type.get_image_name(), temp_monster)
         temp_monster_label: QLabel = QLabel()
-        temp_monster_label.setText("A wild " + self.battle_session.monster.monster_name + " appears!")
+        if isinstance(self.battle_session.monster, MonsterGroup):
+            temp_monster_label.setText("A swarm of " + str(self.battle_session.monster.count) + " " + self.battle_session.monster.monster_name + "s appears!")
+        else:
+            temp_monster_label.setText("A wild " + self.battle_session.monster.monster_name + " appears!")
         temp_monster_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         font: QFont = temp_monster_label.font()
         font.setPointSize(28)
@@ -140,7 +115,8 @@ class Battle(Screen):
         if self.is_practice:
             self.battle_session.monster = Monster(MonsterType.PRACTICE_DUMMY)
         else:
-            self.battle_session.monster = Monster()
+            self.battle_session.monster = MonsterGroup.create_encounter(
+                MonsterSpawner.default.spawn(PlayerUtil.current_player.level, self.battle_session.spawn_random))
 
     def resize_function(self, source, event: QResizeEvent):
         width: int = source.rect().width()
@@ -155,7 +131,7 @@ class Battle(Screen):
         player.setMaximumWidth(width/3 + width/20)
 
         monster.hide()
-        ImageUtil.load_monster_image(self.battle_session.monster.monster_name.lower().replace(" ", "_"), monster)
+        ImageUtil.load_monster_image(self.battle_session.monster.monster_type.get_image_name(), monster)
         UiUtil.toggle_visibility(monster)
 
         player.hide()
@@ -166,21 +142,26 @@ class Battle(Screen):
             OkayPrompt("This is a simulated fight. You will not hurt your stats in any way, and if you beat the practice dummy you will get 10xp.\n However, in a real fight, if you die, you will lose 500xp, your health will be set to 500hp, and you will lose all of your on-hand coins.\n**So make sure you visit the bank and put all your money in it before you enter a fight!")
             OkayPrompt("When you fight monsters you can choose 1 of 5 things each round. You can either...\n1.) Do a fast attack\t2.) Do a Large attack\t3.) Run away from the fight\n4.) Switch which weapon you are using\t5.) View your current stats to help make a decision on what to do\n\nTry choosing some of the different options to see what they do.")
 
-        monster: Monster = self.battle_session.monster
-        OkayPrompt("The " + monster.monster_name + " starts out with " + str(monster.health) + " hp, and does " + str(monster.attack) + " damage at an attack rate of " + str(monster.attack_rate) + ".")
+        monster: Monster | MonsterGroup = self.battle_session.monster
+        if isinstance(monster, MonsterGroup):
+            OkayPrompt("The " + str(monster.count) + " " + monster.monster_name + "s share " + str(monster.health) + " hp between them, and each one does " + str(monster.member_attack) + " damage at an attack rate of " + str(monster.member_attack_rate) + ".\nDamage left over from a hit that kills one carries on to the next, and the fewer are left the softer they hit.")
+        else:
+            OkayPrompt("The " + monster.monster_name + " starts out with " + str(monster.health) + " hp, and does " + str(monster.attack) + " damage at an attack rate of " + str(monster.attack_rate) + ".")
 
         if self.is_practice:
             OkayPrompt("When you fight monsters you can choose 1 of 5 things each round. You can either...\n1.) Do a fast attack\t2.) Do a Large attack\t3.) Run away from the fight\n4.) Switch which weapon you are using\t5.) View your current stats to help make a decision on what to do\n\nTry choosing some of the different options to see what they do.")
 
         self.starting_player_health = copy.deepcopy(self.battle_session.player.health)
+        self.start_policy_solver()
 
-        self.battle_session.battle_status = BattleStatus.IN_PROGRESS
+        self.battle_engine.start()
         while self.battle_session.battle_status == BattleStatus.IN_PROGRESS:
             self.run_battle_round()
 
+        battle_reward: BattleReward = self.battle_engine.finish()
         match self.battle_session.battle_status:
             case BattleStatus.PLAYER_WON:
-                self.player_won()
+                self.player_won(battle_reward)
             case BattleStatus.MONSTER_WON:
                 self.monster_won()
 
@@ -188,19 +169,103 @@ class Battle(Screen):
 
     def run_battle_round(self):
         attack_options = [MenuOption.FAST_ATTACK, MenuOption.LARGE_ATTACK]
-        button_options = attack_options + [MenuOption.SWITCH_WEAPONS, MenuOption.RUN, MenuOption.VIEW_STATS]
-
-        choice: MenuOption = Menu(2, *button_options).show_and_get_results()
-
-        if choice in attack_options:
-            self.do_attack(choice)
-            self.do_monster_attack()
+        button_options = attack_options + [MenuOption.SWITCH_WEAPONS, MenuOption.RUN, MenuOption.VIEW_STATS, MenuOption.AUTO_BATTLE]
+
+        self.battle_menu = Menu(2, *button_options)
+        self.battle_menu.add_key_option(Qt.Key.Key_B, MenuOption.BEST_WEAPON)
+        self.highlight_recommended_option()
+        choice: MenuOption = self.battle_menu.show_and_get_results()
+        self.battle_menu = None
+
+        if choice == MenuOption.AUTO_BATTLE:
+            self.auto_battle()
+            return
+        if choice == MenuOption.BEST_WEAPON:
+            self.switch_to_best_weapon()
+            return
+        battle_action: BattleAction = BattleAction[choice.name]
+
+        if battle_action.is_attack:
+            self.do_attack(battle_action)
         else:
-            self.do_nonattack(choice)
+            self.do_nonattack(battle_action)
+
+    def auto_battle(self):
+        # Resolve the rest of the fight with a policy and stream the rounds into one combat log instead of prompts
+        self.battle_engine.battle_policy = self.get_auto_battle_policy()
+        combat_log: CombatLogWidget = CombatLogWidget("Auto battle against the " + self.battle_session.monster.monster_name)
+        container: CenteredFocusWidget = CenteredFocusWidget(combat_log, 60, 70, UiObjects.current_screen.ui)
+
+        # Each tick resolves a batch of rounds, skipping resolves everything that is left at once
+        timer: QTimer = QTimer(self)
+        timer.timeout.connect(lambda: self.run_auto_battle_rounds(combat_log, timer, combat_log.get_rounds_per_tick()))
+        combat_log.speed_box.currentIndexChanged.connect(lambda: timer.setInterval(combat_log.get_tick_interval()))
+        combat_log.skip_button.clicked.connect(lambda: self.run_auto_battle_rounds(combat_log, timer))
+
+        # Wait for the player to read the result before going back to the battle screen
+        loop: QEventLoop = QEventLoop()
+        combat_log.continue_button.clicked.connect(lambda: (
+            container.hide(),
+            loop.exit(True)
+        ))
+
+        container.show()
+        timer.start(combat_log.get_tick_interval())
+        loop.exec()
+        container.setParent(None)
+        self.battle_engine.battle_policy = None
+
+    def get_auto_battle_policy(self) -> BattlePolicy:
+        # Only use the optimal policy once it is solved, otherwise the first round would wait on the solver
+        if self.policy_solution is not None:
+            return OptimalPolicy()
+        return BestAttackPolicy()
+
+    def run_auto_battle_rounds(self, combat_log: CombatLogWidget, timer: QTimer, round_count: int = None):
+        lines: list = []
+        while self.battle_session.battle_status == BattleStatus.IN_PROGRESS and (round_count is None or len(lines) < round_count):
+            lines.append(str(self.battle_engine.run_battle_round()))
+        combat_log.append_lines(lines)
+
+        if self.battle_session.battle_status != BattleStatus.IN_PROGRESS and timer.isActive():
+            timer.stop()
+            combat_log.set_finished(str(self.battle_session.battle_status) + " after " + str(self.battle_session.round) + " rounds.")
+
+    def start_policy_solver(self):
+        # Solve the matchup on a worker thread so the menu can recommend options without the UI waiting on it
+        self.policy_solution = None
+        if isinstance(self.battle_session.monster, MonsterGroup):
+            # The solver only models a single monster, so swarms go without recommendations
+            return
+
+        player: Player = self.battle_session.player
+        monster_type: MonsterType = self.battle_session.monster.monster_type
+        owned_weapons: list = WeaponUtil.get_owned_weapons(player)
+
+        self.policy_solution = PolicySolver.get_cached_solution(player.health, owned_weapons, monster_type)
+        if self.policy_solution is None:
+            worker: Worker = Worker(PolicySolver.get_solution, player.health, owned_weapons, monster_type)
+            worker.signals.result.connect(self.on_policy_solved)
+            QThreadPool.globalInstance().start(worker)
+
+    def on_policy_solved(self, policy_solution: PolicySolution):
+        self.policy_solution = policy_solution
+        self.highlight_recommended_option()
+
+    def get_recommended_option(self) -> MenuOption:
+        player: Player = self.battle_session.player
+        monster: Monster = self.battle_session.monster
+        if self.policy_solution is None or not self.policy_solution.has_state(player.health, monster.health):
+            return None
+
+        return MenuOption[self.policy_solution.get_action(player.health, monster.health, player.selected_weapon).name]
 
-        self.battle_session.round+=1
+    def highlight_recommended_option(self):
+        recommended_option: MenuOption = self.get_recommended_option()
+        if self.battle_menu is not None and recommended_option is not None:
+            self.battle_menu.highlight_option(recommended_option)
 
-    def do_attack(self, choice: MenuOption):
+    def do_attack(self, battle_action: BattleAction):
         should_attack: bool = True
         if self.battle_session.player.math.is_math_enabled:
             # TODO:Implement math here
@@ -208,121 +273,109 @@ class Battle(Screen):
         else:
             should_attack = True
 
-        if should_attack:
-            weapon: Weapon = self.battle_session.player.selected_weapon
-            damage: int = 0
-
-            if choice == MenuOption.FAST_ATTACK:
-                if not self.battle_session.fast_attack_shown:
-                    OkayPrompt("Note that Fast attacks will do a random number between 1 and the attack rate number of your selected weapon * the damage number of your weapon's damage.\nSo try to only use this if you have a high attack rate with your selected weapon type.")
-                    self.battle_session.fast_attack_shown = True
-
-                number_of_attacks: int = random.randint(1, weapon.attack_rate)
-                damage = weapon.damage * number_of_attacks
-                damage = self.crit(damage)
-                plural: str = "s" if number_of_attacks > 1 else ""
-                OkayPrompt("You do " + str(number_of_attacks) + " fast attack" + plural + " with your " + weapon.weapon_name + ", dealing " + str(damage) + " damage.")
-            elif choice == MenuOption.LARGE_ATTACK:
-                if not self.battle_session.large_attack_shown:
-                    OkayPrompt("Note that Large attacks will do your selected weapon's damage + an attack boost between 0 and 3x your weapon's damage.\nSo try to only use this if you have a low attack rate with your selected weapon type.")
-                    self.battle_session.large_attack_shown = True
-
-                attack_boost: int = random.randint(0, weapon.damage*3)
-                damage = weapon.damage + attack_boost
-                OkayPrompt("With a " + str(attack_boost) + " attack boost, you use your " + weapon.weapon_name + " to deal " + str(damage) + " damage.")
-
-            self.battle_session.monster.health -= damage
-            OkayPrompt("The " + self.battle_session.monster.monster_name + " now has " + str(self.battle_session.monster.health) + "hp.")
-        else:
+        if not should_attack:
             OkayPrompt("You were not able to do your attack, but the " + self.battle_session.monster.monster_name + " still makes an attack.")
-
-    def crit(self, damage: int):
-        random_int: int = random.randint(0, 3)
-        if random_int == 3:
-            return damage * 2
+            return
+
+        if battle_action == BattleAction.FAST_ATTACK and not self.battle_session.fast_attack_shown:
+            OkayPrompt("Note that Fast attacks will do a random number between 1 and the attack rate number of your selected weapon * the damage number of your weapon's damage.\nSo try to only use this if you have a high attack rate with your selected weapon type.")
+            self.battle_session.fast_attack_shown = True
+        elif battle_action == BattleAction.LARGE_ATTACK and not self.battle_session.large_attack_shown:
+            OkayPrompt("Note that Large attacks will do your selected weapon's damage + an attack boost between 0 and 3x your weapon's damage.\nSo try to only use this if you have a low attack rate with your selected weapon type.")
+            self.battle_session.large_attack_shown = True
+
+        battle_round: BattleRound = self.battle_engine.run_battle_round(battle_action)
+        self.show_attack(battle_round)
+        self.show_monster_attack(battle_round)
+
+    def show_attack(self, battle_round: BattleRound):
+        weapon: Weapon = battle_round.weapon
+
+        if battle_round.battle_action == BattleAction.FAST_ATTACK:
+            plural: str = "s" if battle_round.number_of_attacks > 1 else ""
+            OkayPrompt("You do " + str(battle_round.number_of_attacks) + " fast attack" + plural + " with your " + weapon.weapon_name + ", dealing " + str(battle_round.damage) + " damage.")
+        elif battle_round.battle_action == BattleAction.LARGE_ATTACK:
+            OkayPrompt("With a " + str(battle_round.attack_boost) + " attack boost, you use your " + weapon.weapon_name + " to deal " + str(battle_round.damage) + " damage.")
+
+        if isinstance(self.battle_session.monster, MonsterGroup):
+            killed_text: str = "You take out " + str(battle_round.monsters_killed) + " of them. " if battle_round.monsters_killed > 0 else ""
+            OkayPrompt(killed_text + "The swarm has " + str(self.battle_session.monster.get_alive_count()) + " " + self.battle_session.monster.monster_name + "s left with " + str(battle_round.monster_health) + "hp.")
         else:
-            return damage
-
-    def do_nonattack(self, choice: MenuOption):
-        match choice:
-            case MenuOption.SWITCH_WEAPONS:
+            OkayPrompt("The " + self.battle_session.monster.monster_name + " now has " + str(battle_round.monster_health) + "hp.")
+
+    def switch_to_best_weapon(self):
+        player: Player = self.battle_session.player
+        best_weapon: Weapon = WeaponUtil.get_best_weapon(self.battle_session.monster.health, player)
+        if best_weapon == player.selected_weapon:
+            # Nothing to switch to, so the round isn't used up
+            OkayPrompt("Your " + best_weapon.weapon_name + " is already your best weapon against the " + self.battle_session.monster.monster_name + ".")
+            return
+
+        self.battle_engine.run_battle_round(BattleAction.SWITCH_WEAPONS, best_weapon)
+        OkayPrompt("You switch to your " + best_weapon.weapon_name + ".")
+
+    def do_nonattack(self, battle_action: BattleAction):
+        match battle_action:
+            case BattleAction.SWITCH_WEAPONS:
                 if not self.battle_session.switch_weapons_shown:
-                    OkayPrompt("In battle, you can switch to different weapons. This would be a good option to pick if you forgot to equip a certain weapon.")
+                    OkayPrompt("In battle, you can switch to different weapons. This would be a good option to pick if you forgot to equip a certain weapon.\nYou can also press B to switch straight to your best weapon against the monster.")
                     self.battle_session.switch_weapons_shown = True
-                WeaponUtil.switch_weapon()
-            case MenuOption.VIEW_STATS:
+                self.battle_engine.run_battle_round(battle_action, WeaponUtil.choose_weapon(self.battle_session.monster.health))
+            case BattleAction.VIEW_STATS:
                 if not self.battle_session.view_stats_shown:
                     OkayPrompt("You can view your stats during battle to, make sure that you don't have any coins on you, make sure your health is high enough,\nor for any other reason that will help you make a decision on what to do next in battle.")
                     self.battle_session.view_stats_shown = True
                 PlayerUtil.show_current_stats()
-            case MenuOption.RUN:
+                self.battle_engine.run_battle_round(battle_action)
+            case BattleAction.RUN:
                 if not self.battle_session.run_shown:
                     should_run: PromptOption = YesNoPrompt("This is a smart option to pick if you don't think that you can beat a monster and you don't want to hurt your stats,\nbut this is a simulated fight. It can't hurt your stats, and if you beat the practice dummy you get 10xp.\nDo you still want to run?").show_and_get_results()
                     self.battle_session.run_shown = True
                     if should_run == PromptOption.NO:
+                        # Thinking it over still takes the round
+                        self.battle_engine.run_battle_round(BattleAction.STAY)
                         return
 
                 self.run_away()
 
     def run_away(self):
-        OkayPrompt("You run away as fast as you can, but the " + self.battle_session.monster.monster_name + " does 150 damage to you as you run away.")
-        self.battle_session.player.health -= 150
-        self.battle_session.battle_status = BattleStatus.RAN_AWAY
-
-    def do_monster_attack(self):
-        monster: Monster = self.battle_session.monster
+        OkayPrompt("You run away as fast as you can, but the " + self.battle_session.monster.monster_name + " does " + str(BattleEngine.run_away_damage) + " damage to you as you run away.")
+        self.battle_engine.run_battle_round(BattleAction.RUN)
 
+    def show_monster_attack(self, battle_round: BattleRound):
         if not self.battle_session.attacked_shown:
             OkayPrompt("Everytime that you do an attack the monster has a chance of doing an attack back.\nThey do their damage times a random number between 0 and their attack rate, and every attack they do has a 25% chance of getting a 2x crit.")
             self.battle_session.attacked_shown = True
 
-        if monster.health <= 0:
-            self.battle_session.battle_status = BattleStatus.PLAYER_WON
+        if battle_round.battle_status == BattleStatus.PLAYER_WON:
+            return
+
+        damage: int = battle_round.monster_damage
+        health: str = str(battle_round.player_health)
+        if damage == self.battle_session.monster.attack:
+            OkayPrompt("The monster strikes back with a(n) " + str(damage) + " damage attack. You now have " + health + " hp.")
+        elif damage == 0:
+            OkayPrompt("The monster misses and does 0 damage.")
         else:
-            damage: int = monster.attack * random.randint(0, monster.attack_rate)
-            damage = self.crit(damage)
-            self.battle_session.player.health -= damage
-            health: str = str(self.battle_session.player.health)
-
-            if damage == monster.attack:
-                OkayPrompt("The monster strikes back with a(n) " + str(damage) + " damage attack. You now have " + health + " hp.")
-            elif damage == 0:
-                OkayPrompt("The monster misses and does 0 damage.")
-            else:
-                OkayPrompt("The monster strikes back with a crit attack of " + str(damage) + ". You now have " + health + " hp.")
-
-            if self.battle_session.player.health <= 0:
-                self.battle_session.battle_status = BattleStatus.MONSTER_WON
-
-    def player_won(self):
+            OkayPrompt("The monster strikes back with a crit attack of " + str(damage) + ". You now have " + health + " hp.")
+
+    def player_won(self, battle_reward: BattleReward):
         UiUtil.toggle_visibility(self.ui.monster)
 
         if self.is_practice:
-            xp: int = 10
-            OkayPrompt("Great job on that practice dummy! You've earned " + str(xp) + "xp!")
-            self.battle_session.player.score+=xp
+            OkayPrompt("Great job on that practice dummy! You've earned " + str(battle_reward.score) + "xp!")
         else:
             monster: Monster = self.battle_session.monster
-            money: int = (((monster.get_original_health() + monster.attack) * monster.attack_rate) / 10) + 50
-            score: int = (monster.get_original_health() * random.randint(0, monster.attack_rate)) + 100;
-
             OkayPrompt("You have defeated the " + monster.monster_name + "! Great job!" +
-                       "\n+" + str(money) + " coins." +
-                       "\n+" + str(score) + " xp.")
-            self.battle_session.player.money += money
-            self.battle_session.player.score += score
+                       "\n+" + str(battle_reward.money) + " coins." +
+                       "\n+" + str(battle_reward.score) + " xp.")
 
-            weapon_drops = WeaponUtil.weapon_drop(monster)
+            weapon_drops = battle_reward.weapon_drops
             if len(weapon_drops) > 0:
                 weapon_helper_text: str = "these weapons" if len(weapon_drops) > 1 else "this weapon"
-                weapon_text: str = ""
-                for i, weapon in weapon_drops:
-                    weapon_text = str(weapon)
-                    if i != len(weapon_drops) - 1:
-                        weapon_text = weapon_text + "\n"
+                weapon_text: str = "\n".join([str(weapon) for weapon in weapon_drops])
 
                 OkayPrompt("Looks like the monster dropped " + weapon_helper_text + ": \n" + weapon_text)
-            self.battle_session.player.kills += 1
 
     def monster_won(self):
         UiUtil.toggle_visibility(self.ui.player)
@@ -335,4 +388,3 @@ class Battle(Screen):
                        "\nYour score was " + str(self.battle_session.player.score) +
                        "\nYou had " + str(self.battle_session.player.money) + "coins on you that the monster stole." +
                        "\nYou will loose 500xp; your health will be set to 500h, and you will return to the Travel Menu.")
-            self.battle_session.player.deaths += 1
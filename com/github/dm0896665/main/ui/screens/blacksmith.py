@@ -1,9 +1,12 @@
+from PySide6.QtCore import QThreadPool
 from PySide6.QtGui import QResizeEvent, Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 
+from com.github.dm0896665.main.core.battle.win_rate_preview import WinRatePreview
 from com.github.dm0896665.main.core.player.player import Player
 from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
 from com.github.dm0896665.main.util.player_util import PlayerUtil
+from com.github.dm0896665.main.util.thread_util import Worker
 from com.github.dm0896665.main.util.ui_objects import Screen, ItemTableView, OutlinedLabel, \
     WeaponItemTableCell, WeaponItemTableCellType, PlayerStatusWidget
 
@@ -20,6 +23,9 @@ class Blacksmith(Screen):
     def on_screen_did_show(self):
         self.player: Player = PlayerUtil.current_player
 
+        # Every weapon's tooltip compares against the equipped one, so start on its odds before anything is hovered
+        QThreadPool.globalInstance().start(Worker(WinRatePreview.get_win_rates, [self.player.selected_weapon], self.player.level))
+
         self.for_sale: ItemTableView = ItemTableView()
         for weapon in WeaponUtil.get_all_weapons():
             cell: WeaponItemTableCell = WeaponItemTableCell(weapon, self.player, WeaponItemTableCellType.BUY, self.on_buy_actioned_callback)
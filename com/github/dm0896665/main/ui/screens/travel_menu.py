@@ -1,10 +1,20 @@
-from PySide6.QtCore import Qt
+from typing import Callable
 
+from PySide6.QtCore import Qt, QThreadPool, QEventLoop
+
+from com.github.dm0896665.main.core.battle.battle_grinder import BattleGrinder, GrindResult
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.ui.prompts.buttons.prompt_option_button import PromptOption
+from com.github.dm0896665.main.ui.prompts.multichoice_prompt import MultichoicePrompt
 from com.github.dm0896665.main.ui.prompts.okay_prompt import OkayPrompt
+from com.github.dm0896665.main.ui.prompts.text_prompt import TextPrompt
 from com.github.dm0896665.main.ui.screens.bank import Bank
 from com.github.dm0896665.main.ui.screens.village import Village
 from com.github.dm0896665.main.util.image_util import ImageUtil
-from com.github.dm0896665.main.util.ui_objects import MapScreen, MapLocation
+from com.github.dm0896665.main.util.player_util import PlayerUtil
+from com.github.dm0896665.main.util.thread_util import Worker
+from com.github.dm0896665.main.util.ui_objects import MapScreen, MapLocation, ProgressWidget, CenteredFocusWidget, UiObjects
 from com.github.dm0896665.main.util.ui_util import UiUtil
 
 
@@ -12,6 +22,8 @@ class TravelMenu(MapScreen):
     def __init__(self, is_first_time: bool = False):
         super().__init__()
         self.is_first_time: bool = is_first_time
+        self.grind_progress_widget: ProgressWidget = None
+        self.max_grind_battles: int = 1000
 
 
     def setup_locations(self):
@@ -38,4 +50,62 @@ class TravelMenu(MapScreen):
         UiUtil.change_screen(Village())
 
     def on_forrest_location_clicked(self, location: MapLocation):
-        print(f"{location.name} was clicked!")
\ No newline at end of file
+        choice: PromptOption = MultichoicePrompt("Do you want to fight a monster, or grind through a bunch of battles at once?",
+                                                 PromptOption.FIGHT, PromptOption.GRIND, PromptOption.CANCEL).show_and_get_results()
+        if choice == PromptOption.FIGHT:
+            # Imported here because the battle screen comes back to the travel menu when it's done
+            from com.github.dm0896665.main.ui.screens.battle import Battle
+            UiUtil.change_screen(Battle())
+        elif choice == PromptOption.GRIND:
+            self.grind()
+
+    def grind(self):
+        player: Player = PlayerUtil.current_player
+        battle_count_prompt: TextPrompt = TextPrompt("How many battles do you want to fight? (1 - " + str(self.max_grind_battles) + ")")
+        battle_count_prompt.valid_check_function: Callable[[str], bool] = self.battle_count_prompt_check
+        battle_count: int = int(battle_count_prompt.show_and_get_results())
+
+        # Stop before the player is worn all the way down, a battle in progress can still kill them though
+        stop_health: int = player.health // 4
+        OkayPrompt("You head into the forrest to fight up to " + str(battle_count) + " battles. You will head back once you are down to " + str(stop_health) + " hp.")
+        grinder: BattleGrinder = BattleGrinder(player, battle_count, stop_health=stop_health, battle_journal=BattleJournal.for_player(player))
+
+        # Fight the battles on a worker thread while the progress widget keeps the UI responsive
+        self.grind_progress_widget = ProgressWidget("Grinding in the forrest...")
+        container: CenteredFocusWidget = CenteredFocusWidget(self.grind_progress_widget, 50, 50, UiObjects.current_screen.ui)
+        loop: QEventLoop = QEventLoop()
+        self.grind_progress_widget.cancel_button.clicked.connect(grinder.cancel)
+        self.grind_progress_widget.continue_button.clicked.connect(lambda: (
+            container.hide(),
+            loop.exit(True)
+        ))
+
+        worker: Worker = Worker(grinder.grind)
+        worker.signals.progress.connect(self.on_grind_progress)
+        worker.signals.result.connect(self.on_grind_finished)
+        worker.signals.error.connect(self.on_grind_failed)
+        container.show()
+        QThreadPool.globalInstance().start(worker)
+        loop.exec()
+
+        container.setParent(None)
+        self.grind_progress_widget = None
+
+    def battle_count_prompt_check(self, selected_option: str) -> bool:
+        return selected_option.isdigit() and 1 <= int(selected_option) <= self.max_grind_battles
+
+    def on_grind_progress(self, progress: float):
+        if self.grind_progress_widget is not None:
+            self.grind_progress_widget.set_progress(progress)
+
+    def on_grind_finished(self, grind_result: GrindResult):
+        grind_result.apply(PlayerUtil.current_player)
+        if self.grind_progress_widget is not None:
+            self.grind_progress_widget.set_finished(str(grind_result))
+
+    def on_grind_failed(self, error: tuple):
+        # The grinder fights on a copy of the player, so nothing from the failed grind is kept
+        exctype, value, _ = error
+        if self.grind_progress_widget is not None:
+            self.grind_progress_widget.set_finished("Something went wrong in the forrest, so none of the battles count.\n"
+                                                   + exctype.__name__ + ": " + str(value))
@@ -6,7 +6,7 @@ from typing import Callable, Any
 
 from PySide6 import QtWidgets, QtCore
 from PySide6.QtCore import QEvent, QPoint, Qt, QSignalBlocker, QObject, QPointF, QSize, QPropertyAnimation, QEventLoop, \
-    QTimer, Signal, QEasingCurve
+    QTimer, Signal, QEasingCurve, QThreadPool
 from PySide6.QtGui import QPalette, QResizeEvent, QPixmap, QColor, QPen, QFont, QTextCursor, QTextCharFormat, QBrush, \
     QRadialGradient, QPainter, QCursor, QFontMetrics, QPainterPath, QIcon, QMouseEvent, QWheelEvent, QEnterEvent
 
@@ -17,6 +17,7 @@ from PySide6.QtWidgets import QApplication, QGridLayout, QWidget, QMainWindow, Q
 from com.github.dm0896665.main.core.player.player import Player
 from com.github.dm0896665.main.core.weapon.weapon import Weapon
 from com.github.dm0896665.main.util.image_util import ImageUtil
+from com.github.dm0896665.main.util.thread_util import Worker
 
 
 class GameWindow(QMainWindow):
@@ -445,6 +446,110 @@ class IntegerInput(QtWidgets.QLineEdit):
         font_size = max(16, UiObjects.window.width() // 60)
         self.setFont(QFont(UiObjects.font_name, font_size))
 
+class CombatLogWidget(QtWidgets.QWidget):
+    # Rounds per second the player can pick from, the timer never ticks faster than min_tick_interval
+    speeds: list = [1, 2, 5, 10, 25, 100]
+    min_tick_interval: int = 50
+
+    def __init__(self, title: str, parent: QWidget = None):
+        super().__init__(parent)
+        self.setLayout(QVBoxLayout())
+        self.setStyleSheet("border: 2px solid " + UiObjects.dark_text_color + ";"
+                           "border-radius: 13%;"
+                           "background-color: " + UiObjects.light_text_color + ";")
+
+        # Set up title
+        self.title_label: Label = Label(title, 30)
+        self.title_label.setStyleSheet("border: 2px solid transparent; color: " + UiObjects.dark_text_color + ";")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout().addWidget(self.title_label)
+
+        # Set up the log, old lines are dropped so long fights don't keep growing the document
+        self.log: QtWidgets.QPlainTextEdit = QtWidgets.QPlainTextEdit()
+        self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(1000)
+        self.log.setFont(QFont(UiObjects.font_name, max(10, UiObjects.window.width() // 90)))
+        self.log.setStyleSheet("color: " + UiObjects.dark_text_color + "; background-color: " + UiObjects.get_transparent_light_background_color(.5))
+        self.layout().addWidget(self.log)
+
+        # Set up speed control and buttons
+        self.controls_layout: QHBoxLayout = QHBoxLayout()
+        self.speed_box: QtWidgets.QComboBox = QtWidgets.QComboBox()
+        for speed in CombatLogWidget.speeds:
+            self.speed_box.addItem(str(speed) + " rounds/s", speed)
+        self.speed_box.setCurrentIndex(CombatLogWidget.speeds.index(5))
+        self.controls_layout.addWidget(self.speed_box)
+        self.skip_button: Button = Button("Skip to result", 15)
+        self.controls_layout.addWidget(self.skip_button)
+        self.continue_button: Button = Button("Continue", 15)
+        self.continue_button.setEnabled(False)
+        self.controls_layout.addWidget(self.continue_button)
+        self.layout().addLayout(self.controls_layout)
+
+    def append_lines(self, lines: list):
+        # A whole batch goes in with one append so fast speeds don't re-layout the log per round
+        if len(lines) > 0:
+            self.log.appendPlainText("\n".join(lines))
+            self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+
+    def get_rounds_per_second(self) -> int:
+        return self.speed_box.currentData()
+
+    def get_tick_interval(self) -> int:
+        return max(CombatLogWidget.min_tick_interval, 1000 // self.get_rounds_per_second())
+
+    def get_rounds_per_tick(self) -> int:
+        return max(1, self.get_rounds_per_second() * self.get_tick_interval() // 1000)
+
+    def set_finished(self, result_text: str):
+        self.append_lines([result_text])
+        self.speed_box.setEnabled(False)
+        self.skip_button.setEnabled(False)
+        self.continue_button.setEnabled(True)
+
+
+class ProgressWidget(QtWidgets.QWidget):
+    def __init__(self, title: str, parent: QWidget = None):
+        super().__init__(parent)
+        self.setLayout(QVBoxLayout())
+        self.setStyleSheet("border: 2px solid " + UiObjects.dark_text_color + ";"
+                           "border-radius: 13%;"
+                           "background-color: " + UiObjects.light_text_color + ";")
+
+        # Set up title and the label the result is shown in once finished
+        self.title_label: Label = Label(title, 30)
+        self.title_label.setStyleSheet("border: 2px solid transparent; color: " + UiObjects.dark_text_color + ";")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout().addWidget(self.title_label)
+        self.result_label: Label = Label("", 15)
+        self.result_label.setStyleSheet("border: 2px solid transparent; color: " + UiObjects.dark_text_color + ";")
+        self.layout().addWidget(self.result_label)
+
+        # Set up progress bar
+        self.progress_bar: QtWidgets.QProgressBar = QtWidgets.QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.layout().addWidget(self.progress_bar)
+
+        # Set up buttons
+        self.buttons_layout: QHBoxLayout = QHBoxLayout()
+        self.cancel_button: Button = Button("Stop", 15)
+        self.buttons_layout.addWidget(self.cancel_button)
+        self.continue_button: Button = Button("Continue", 15)
+        self.continue_button.setEnabled(False)
+        self.buttons_layout.addWidget(self.continue_button)
+        self.layout().addLayout(self.buttons_layout)
+
+    def set_progress(self, progress: float):
+        self.progress_bar.setValue(int(progress))
+
+    def set_finished(self, result_text: str):
+        self.progress_bar.setValue(100)
+        self.result_label.setText(result_text)
+        self.cancel_button.setEnabled(False)
+        self.continue_button.setEnabled(True)
+
+
 class PlayerStatusWidget(QtWidgets.QWidget):
     def __init__(self, player: Player, parent: QWidget):
         super().__init__(parent)
@@ -1094,6 +1199,10 @@ class WeaponItemTableCell(ItemTableCell):
         # Set up when function called when action button is pressed
         self.on_actioned_callback: Callable[[WeaponItemTableCell], None] = on_actioned_callback
 
+        # Shop cells preview the odds with this weapon in their tooltip, worked out off the UI thread
+        self.win_rate_label: Label = None
+        self.is_win_rate_pending: bool = False
+
         # Set up price of weapon
         self.price_color: str = ""
         if weapon_cell_type == WeaponItemTableCellType.BUY:
@@ -1125,6 +1234,57 @@ class WeaponItemTableCell(ItemTableCell):
             self.player.property_change_listener.connect(self.player_property_updated)
             self.layout.addWidget(self.price_label)
 
+    def enterEvent(self, event: QEnterEvent):
+        self.update_win_rate_label()
+        super().enterEvent(event)
+
+    def is_shop_cell(self) -> bool:
+        return self.weapon_cell_type in (WeaponItemTableCellType.BUY, WeaponItemTableCellType.SELL)
+
+    def update_win_rate_label(self):
+        if self.win_rate_label is None:
+            return
+
+        # Imported here since the battle modules import PlayerUtil, which imports this module
+        from com.github.dm0896665.main.core.battle.win_rate_preview import WinRatePreview
+
+        # Hovering only ever reads the cache, anything missing is worked out on a worker thread
+        selected_weapon: Weapon = self.player.selected_weapon
+        win_rate: float = WinRatePreview.get_cached_win_rate(self.weapon, self.player.level)
+        selected_win_rate: float = WinRatePreview.get_cached_win_rate(selected_weapon, self.player.level)
+        if win_rate is None or selected_win_rate is None:
+            self.win_rate_label.setText("Win rate vs level " + str(self.player.level) + " monsters: working it out...")
+            self.start_win_rate_worker([self.weapon, selected_weapon])
+            return
+
+        compared_text: str = "equipped" if self.weapon == selected_weapon else f"{selected_win_rate:.0%} with your " + selected_weapon.weapon_name
+        self.win_rate_label.setText(f"Win rate vs level {self.player.level} monsters: {win_rate:.0%} ({compared_text})")
+        self.win_rate_label.setStyleSheet("border: 2px solid transparent;" + self.get_color_based_on_selected(round(selected_win_rate, 2), round(win_rate, 2)))
+        self.tooltip_widget.adjustSize()
+
+    def start_win_rate_worker(self, weapons: list):
+        if self.is_win_rate_pending:
+            return
+
+        from com.github.dm0896665.main.core.battle.win_rate_preview import WinRatePreview
+
+        self.is_win_rate_pending = True
+        worker: Worker = Worker(WinRatePreview.get_win_rates, weapons, self.player.level)
+        worker.signals.result.connect(self.on_win_rate_worked_out)
+        worker.signals.error.connect(self.on_win_rate_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_win_rate_worked_out(self, _win_rates: list):
+        # The player may have levelled or switched weapons since, so read the cache again rather than using the result
+        self.is_win_rate_pending = False
+        self.update_win_rate_label()
+
+    def on_win_rate_failed(self, _error: tuple):
+        # Nothing was cached, so the next hover tries again instead of waiting on a worker that is gone
+        self.is_win_rate_pending = False
+        if self.win_rate_label is not None:
+            self.win_rate_label.setText("Win rate vs level " + str(self.player.level) + " monsters: couldn't be worked out")
+
     @staticmethod
     def get_color_based_on_selected(selected_value, value) -> str:
         match selected_value:
@@ -1340,6 +1500,13 @@ class WeaponItemTableCell(ItemTableCell):
             new_price_label.setObjectName("price_label")
             widget.layout().addWidget(new_price_label)
 
+        if self.is_shop_cell() and not is_action_widget:
+            # Filled in from the win rate preview cache whenever the cell is hovered
+            self.win_rate_label = Label("", name_label_font_size-4)
+            self.win_rate_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.win_rate_label.setStyleSheet(label_styles)
+            widget.layout().addWidget(self.win_rate_label)
+
         widget.adjustSize()
 
         return widget
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from typing import List
+
+import numpy as np
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_journal import BattleJournal
+from com.github.dm0896665.main.core.battle.battle_policy import BattlePolicy
+from com.github.dm0896665.main.core.battle.battle_replayer import BattleReplay, BattleReplayer
+from com.github.dm0896665.main.core.battle.battle_result import BattleResult
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.battle.policies.fast_attack_policy import FastAttackPolicy
+from com.github.dm0896665.main.core.battle.policies.large_attack_policy import LargeAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class BattleJournalTest(unittest.TestCase):
+    """Battles written to a journal file have to replay through BattleReplayer record for record."""
+    # Single monsters from a few drop sections and both swarm types
+    monster_types: List[MonsterType] = [MonsterType.ZOMBIE, MonsterType.BANSHEE, MonsterType.KRAKEN, MonsterType.SPIDER, MonsterType.GHOST]
+    policies: List[BattlePolicy] = [FastAttackPolicy(), LargeAttackPolicy(), BestAttackPolicy()]
+
+    @staticmethod
+    def get_player(weapon: Weapon) -> Player:
+        player: Player = Player()
+        player.health = 3000
+        player.selected_weapon = weapon
+        player.weapons = [Weapon.STICK, Weapon.KNIFE, Weapon.KNIFE, Weapon.CROSSBOW]
+        return player
+
+    def fight_battles(self, battle_journal: BattleJournal) -> List[BattleResult]:
+        battle_results: List[BattleResult] = []
+        weapons: List[Weapon] = list(Weapon)
+        for seed in range(30):
+            battle_session: BattleSession = BattleSession(seed % 5 == 0, seed)
+            monster_type: MonsterType = BattleJournalTest.monster_types[seed % len(BattleJournalTest.monster_types)]
+            battle_policy: BattlePolicy = BattleJournalTest.policies[seed % len(BattleJournalTest.policies)]
+            battle_engine: BattleEngine = BattleEngine(battle_session, self.get_player(weapons[seed % len(weapons)]),
+                                                       MonsterGroup.create_encounter(monster_type), battle_policy, battle_journal)
+            battle_results.append(battle_engine.fight())
+        return battle_results
+
+    def fight_scripted_battle(self, battle_journal: BattleJournal, monster_type: MonsterType) -> BattleResult:
+        # Attacks, a weapon switch, a round that passes and running away, which no policy above ever picks. The monster
+        # has to outlast a stick and a knife, so every round is played in a battle that is still going
+        battle_session: BattleSession = BattleSession(seed=7)
+        battle_engine: BattleEngine = BattleEngine(battle_session, self.get_player(Weapon.STICK), MonsterGroup.create_encounter(monster_type),
+                                                   battle_journal=battle_journal)
+        battle_engine.start()
+        rounds: List[BattleRound] = [battle_engine.run_battle_round(BattleAction.FAST_ATTACK), battle_engine.run_battle_round(BattleAction.SWITCH_WEAPONS, Weapon.KNIFE),
+                        battle_engine.run_battle_round(BattleAction.LARGE_ATTACK), battle_engine.run_battle_round(BattleAction.STAY),
+                        battle_engine.run_battle_round(BattleAction.RUN)]
+        self.assertEqual(battle_session.battle_status, BattleStatus.RAN_AWAY)
+        return BattleResult(battle_session.battle_status, rounds, battle_engine.finish())
+
+    def assert_replays(self, battle_records: np.ndarray, battle_result: BattleResult):
+        battle_replay: BattleReplay = BattleReplayer.replay_battle(battle_records)
+        self.assertTrue(battle_replay.is_faithful(), "records " + str(battle_replay.mismatched_records) + " differ")
+        self.assertEqual(battle_replay.battle_result.battle_status, battle_result.battle_status)
+        self.assertEqual(len(battle_replay.battle_result.rounds), len(battle_result.rounds))
+        self.assertEqual(battle_replay.battle_result.battle_reward.weapon_drops, battle_result.battle_reward.weapon_drops)
+
+    def test_round_trip_through_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            battle_journal: BattleJournal = BattleJournal(os.path.join(directory, "player" + BattleJournal.ext))
+            battle_results: List[BattleResult] = self.fight_battles(battle_journal)
+            for monster_type in (MonsterType.KRAKEN, MonsterType.GHOST):
+                battle_results.append(self.fight_scripted_battle(battle_journal, monster_type))
+
+            # Everything was flushed as each battle ended
+            self.assertEqual(len(battle_journal.buffer), 0)
+            battles: List[np.ndarray] = BattleJournal.split_battles(BattleJournal.read(battle_journal.path))
+
+        self.assertEqual(len(battles), len(battle_results))
+        for index, (battle_records, battle_result) in enumerate(zip(battles, battle_results)):
+            with self.subTest(battle=index, monster_type=BattleJournal.get_monster_type(battle_records[0]).monster_name):
+                self.assertEqual(np.count_nonzero(battle_records["kind"] == BattleJournal.KIND_ROUND), len(battle_result.rounds))
+                self.assert_replays(battle_records, battle_result)
+
+    def test_detects_changed_records(self):
+        battle_journal: BattleJournal = BattleJournal()
+        self.fight_battles(battle_journal)
+        for battle_records in BattleJournal.split_battles(battle_journal.get_buffered_records())[:5]:
+            # A round whose damage was written wrong no longer matches what the engine does with the same seed
+            changed_records: np.ndarray = battle_records.copy()
+            round_index: int = int(np.flatnonzero(changed_records["kind"] == BattleJournal.KIND_ROUND)[0])
+            changed_records[round_index]["damage"] += 1
+            self.assertIn(round_index, BattleReplayer.replay_battle(changed_records).mismatched_records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import unittest
+from typing import List
+
+import numpy as np
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_engine import BattleEngine
+from com.github.dm0896665.main.core.battle.battle_round import BattleRound
+from com.github.dm0896665.main.core.battle.battle_session import BattleSession
+from com.github.dm0896665.main.core.battle.battle_status import BattleStatus
+from com.github.dm0896665.main.core.battle.policies.best_attack_policy import BestAttackPolicy
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_group import MonsterGroup
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class SwarmBalanceTest(unittest.TestCase):
+    """A full swarm has to be about as hard to beat as its single monster, since the win rate tools and the economy model
+    swarm monster types as the single monster.
+
+    A swarm hits softer as it thins out while a single monster hits just as hard until it dies, so a weapon that takes
+    out most of a swarm in its first round finds it easier than the single monster. Each weapon is held to tolerance,
+    and across every weapon the swarm has to be within mean_tolerance of the single monster on average.
+    """
+    battle_count: int = 1000
+    tolerance: float = 0.12
+    mean_tolerance: float = 0.05
+
+    @staticmethod
+    def get_win_rate(weapon: Weapon, monster_type: MonsterType, is_swarm: bool) -> float:
+        player: Player = Player()
+        wins: int = 0
+        for seed in range(SwarmBalanceTest.battle_count):
+            player.health = 1000
+            player.selected_weapon = weapon
+            monster: Monster | MonsterGroup = MonsterGroup(monster_type) if is_swarm else Monster(monster_type)
+            battle_status: BattleStatus = BattleEngine(BattleSession(seed=seed), player, monster, BestAttackPolicy()).fight().battle_status
+            wins += battle_status == BattleStatus.PLAYER_WON
+        return wins / SwarmBalanceTest.battle_count
+
+    def test_swarm_win_rate_matches_single_monster(self):
+        for monster_type in MonsterGroup.swarm_sizes:
+            differences: List[float] = []
+            for weapon in Weapon:
+                differences.append(self.get_win_rate(weapon, monster_type, True) - self.get_win_rate(weapon, monster_type, False))
+                with self.subTest(monster_type=monster_type.monster_name, weapon=weapon.weapon_name):
+                    self.assertLessEqual(abs(differences[-1]), SwarmBalanceTest.tolerance)
+            with self.subTest(monster_type=monster_type.monster_name):
+                self.assertLessEqual(abs(sum(differences) / len(differences)), SwarmBalanceTest.mean_tolerance)
+
+    def test_counter_attack_scales_with_members_alive(self):
+        # Half the spiders hit back about half as hard as the full swarm
+        full_damage: float = self.get_mean_counter_attack(MonsterGroup(MonsterType.SPIDER))
+        monster_group: MonsterGroup = MonsterGroup(MonsterType.SPIDER)
+        half_count: int = monster_group.count // 2
+        targets: np.ndarray = np.arange(half_count)
+        hit_damage: np.ndarray = monster_group.members.health[targets].copy()
+        self.assertEqual(monster_group.take_hits(hit_damage, targets, int(hit_damage.sum())), half_count)
+
+        self.assertEqual(monster_group.get_alive_count(), monster_group.count - half_count)
+        self.assertAlmostEqual(self.get_mean_counter_attack(monster_group) / full_damage, (monster_group.count - half_count) / monster_group.count, delta=0.05)
+
+    @staticmethod
+    def get_mean_counter_attack(monster_group: MonsterGroup) -> float:
+        player: Player = Player()
+        player.health = 10 ** 9
+        battle_engine: BattleEngine = BattleEngine(BattleSession(seed=0), player, monster_group, BestAttackPolicy())
+        total: int = 0
+        for _ in range(SwarmBalanceTest.battle_count):
+            battle_round: BattleRound = BattleRound(0, BattleAction.FAST_ATTACK, Weapon.STICK)
+            battle_engine.do_swarm_monster_attack(battle_round)
+            total += battle_round.monster_damage
+        return total / SwarmBalanceTest.battle_count
+
+    def test_swarm_loses_exactly_the_damage_dealt(self):
+        monster_group: MonsterGroup = MonsterGroup(MonsterType.SPIDER)
+        self.assertEqual(monster_group.health, MonsterType.SPIDER.health)
+
+        # Weapon.SWORD's hits are well over a spider's share of the health, none of it may be lost
+        session: BattleSession = BattleSession(seed=0)
+        player: Player = Player()
+        player.health = 10 ** 9
+        player.selected_weapon = Weapon.SWORD
+        battle_engine: BattleEngine = BattleEngine(session, player, monster_group, BestAttackPolicy())
+        battle_engine.start()
+        dealt: int = 0
+        while session.battle_status == BattleStatus.IN_PROGRESS:
+            dealt += battle_engine.run_battle_round().damage
+            self.assertEqual(monster_group.health, max(0, MonsterType.SPIDER.health - dealt))
+            self.assertEqual(monster_group.health, monster_group.members.get_remaining_health())
+            self.assertEqual(monster_group.get_alive_count(), monster_group.members.get_alive_count())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import unittest
+from typing import Tuple
+
+import numpy as np
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.battle.battle_action import BattleAction
+from com.github.dm0896665.main.core.battle.battle_simulator import BattleSimulator
+from com.github.dm0896665.main.core.battle.win_probability import WinProbabilityCalculator
+from com.github.dm0896665.main.core.monster.monster import MonsterType
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class WinProbabilityTest(unittest.TestCase):
+    """The exact odds have to agree with BattleSimulator, which plays the same rules out battle by battle."""
+    battle_count: int = 20000
+    # Standard errors of the simulated win rate allowed between the two, plus a floor for odds near 0 or 1
+    sigma_count: float = 4
+    tolerance_floor: float = 0.002
+    weapons: Tuple[Weapon, ...] = (Weapon.STICK, Weapon.SWORD, Weapon.CROSSBOW, Weapon.HEAVY_CROSSBOW)
+    # One monster type from each of the drop sections 1 to 4
+    monster_types: Tuple[MonsterType, ...] = (MonsterType.ZOMBIE, MonsterType.BANSHEE, MonsterType.CYCLOPS, MonsterType.KRAKEN)
+
+    def assert_agrees(self, player_health: int, weapon: Weapon, monster_type: MonsterType, battle_action: BattleAction):
+        win_probability: float = WinProbabilityCalculator.get_win_probability(player_health, weapon, monster_type, battle_action).win_probability
+        simulator: BattleSimulator = BattleSimulator(player_health, battle_action, np.random.default_rng(0))
+        win_rate: float = simulator.simulate(weapon, monster_type, WinProbabilityTest.battle_count).get_win_rate()
+
+        standard_error: float = np.sqrt(win_probability * (1 - win_probability) / WinProbabilityTest.battle_count)
+        tolerance: float = WinProbabilityTest.sigma_count * standard_error + WinProbabilityTest.tolerance_floor
+        self.assertAlmostEqual(win_rate, win_probability, delta=tolerance)
+
+    def test_matches_simulator(self):
+        for weapon in WinProbabilityTest.weapons:
+            for monster_type in WinProbabilityTest.monster_types:
+                # None is BestAttackPolicy's pick, the other two make sure both attack distributions are right
+                for battle_action in (None, BattleAction.FAST_ATTACK, BattleAction.LARGE_ATTACK):
+                    with self.subTest(weapon=weapon.weapon_name, monster_type=monster_type.monster_name, battle_action=battle_action):
+                        self.assert_agrees(1000, weapon, monster_type, battle_action)
+
+    def test_matches_simulator_at_low_health(self):
+        # A player health that isn't a multiple of any monster attack, so the last row is a partial one
+        for monster_type in WinProbabilityTest.monster_types:
+            with self.subTest(monster_type=monster_type.monster_name):
+                self.assert_agrees(137, Weapon.SWORD, monster_type, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import unittest
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_inventory import WeaponInventory
+from com.github.dm0896665.main.core.weapon.weapon_table import WeaponTable
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class PlayerTest(unittest.TestCase):
+    def test_loads_legacy_weapon_list(self):
+        # A save from before WeaponInventory, with the weapons as a list in weapons and no weapon instances
+        state: dict = dict(Player("Legacy").__dict__)
+        del state["_weapons"]
+        del state["weapon_instances"]
+        state["weapons"] = [Weapon.SWORD, Weapon.STICK, Weapon.SWORD]
+
+        player: Player = Player.__new__(Player)
+        player.__setstate__(state)
+        self.assertIsInstance(player.weapons, WeaponInventory)
+        self.assertEqual(player.weapons, WeaponInventory([Weapon.STICK, Weapon.SWORD, Weapon.SWORD]))
+        self.assertNotIn("weapons", player.__dict__)
+        self.assertEqual(player.weapon_instances, WeaponTable())
+        self.assertEqual(player.name, "Legacy")
+
+    def test_loads_current_state(self):
+        source: Player = Player("Current")
+        source.weapons = [Weapon.KNIFE]
+        source.weapon_instances.add(Weapon.KNIFE)
+
+        player: Player = Player.__new__(Player)
+        player.__setstate__(dict(source.__dict__))
+        self.assertIs(player.weapons, source.weapons)
+        self.assertIs(player.weapon_instances, source.weapon_instances)
+
+
+if __name__ == "__main__":
+    unittest.main()
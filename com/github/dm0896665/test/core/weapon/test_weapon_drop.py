@@ -0,0 +1,69 @@
+import os
+import random
+import unittest
+from typing import List, Tuple
+
+import numpy as np
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.monster.monster import Monster, MonsterType
+from com.github.dm0896665.main.core.monster.monster_batch import MonsterBatch
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_inventory import WeaponInventory
+from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class WeaponDropTest(unittest.TestCase):
+    """weapon_drop_many has to drop every weapon as often as weapon_drop does, for every drop section."""
+    kill_count: int = 20000
+    tolerance: float = 0.01
+    # One monster type from each of the drop sections 1 to 4
+    monster_types: Tuple[MonsterType, ...] = (MonsterType.ZOMBIE, MonsterType.BANSHEE, MonsterType.CYCLOPS, MonsterType.KRAKEN)
+
+    @staticmethod
+    def get_players() -> List[Player]:
+        # Enough owned and unowned weapons for both drops to roll, once without and once with weapons held twice
+        player: Player = Player()
+        player.selected_weapon = Weapon.SWORD
+        player.weapons = [Weapon.STICK, Weapon.KNIFE, Weapon.CLUB, Weapon.BOW_AND_ARROW, Weapon.LONG_BOW, Weapon.CROSSBOW]
+        player_with_copies: Player = Player()
+        player_with_copies.selected_weapon = Weapon.KNIFE
+        player_with_copies.weapons = [Weapon.STICK] * 3 + [Weapon.KNIFE, Weapon.CLEAVER, Weapon.SPEAR, Weapon.SPEAR, Weapon.HEAVY_CROSSBOW]
+        return [player, player_with_copies]
+
+    @staticmethod
+    def get_drop_rates(drops: List[int]) -> np.ndarray:
+        # Share of kills that dropped each catalog weapon
+        drops = np.asarray(drops)
+        return np.bincount(drops[drops >= 0], minlength=len(WeaponInventory.catalog)) / WeaponDropTest.kill_count
+
+    def test_drop_many_matches_weapon_drop(self):
+        catalog_indexes: dict = WeaponInventory.catalog_indexes
+        for player_index, player in enumerate(WeaponDropTest.get_players()):
+            owned_counts: np.ndarray = np.array(player.weapons.get_owned_counts(player.selected_weapon))
+            for monster_type in WeaponDropTest.monster_types:
+                rng: random.Random = random.Random(0)
+                owned_drops: List[int] = []
+                unowned_drops: List[int] = []
+                for _ in range(WeaponDropTest.kill_count):
+                    # weapon_drop lists the owned drop before the unowned one, and a weapon is either owned or not
+                    for weapon in WeaponUtil.weapon_drop(Monster(monster_type), player, rng):
+                        (owned_drops if weapon in WeaponUtil.get_owned_weapons(player) else unowned_drops).append(catalog_indexes[weapon])
+
+                monsters: MonsterBatch = MonsterBatch.from_monster_types([monster_type] * WeaponDropTest.kill_count)
+                owned_drops_many, unowned_drops_many = WeaponUtil.weapon_drop_many(monsters, np.random.default_rng(0), owned_counts)
+
+                with self.subTest(player=player_index, monster_type=monster_type.monster_name):
+                    np.testing.assert_allclose(self.get_drop_rates(owned_drops_many), self.get_drop_rates(owned_drops), atol=WeaponDropTest.tolerance)
+                    np.testing.assert_allclose(self.get_drop_rates(unowned_drops_many), self.get_drop_rates(unowned_drops), atol=WeaponDropTest.tolerance)
+                    # Both drops happen at all, so a broken roll can't pass by never dropping anything
+                    self.assertGreater(len(owned_drops), 0)
+                    self.assertGreater(len(unowned_drops), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import pickle
+import unittest
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.player.player import Player
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_inventory import WeaponInventory
+from com.github.dm0896665.main.core.weapon.weapon_util import WeaponUtil
+from com.github.dm0896665.main.util.player_util import PlayerUtil
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class WeaponInventoryTest(unittest.TestCase):
+    def assert_round_trip(self, weapon_inventory: WeaponInventory, format_byte: int):
+        data: bytes = weapon_inventory.to_bytes()
+        self.assertEqual(data[0], format_byte)
+
+        loaded: WeaponInventory = WeaponInventory.from_bytes(data)
+        self.assertEqual(loaded, weapon_inventory)
+        self.assertEqual(len(loaded), len(weapon_inventory))
+        self.assertEqual(tuple(loaded), tuple(weapon_inventory))
+        for weapon in Weapon:
+            self.assertEqual(weapon in loaded, weapon in weapon_inventory)
+
+    def test_mask_format(self):
+        # No weapon held twice saves as just the owned weapon bitmask
+        self.assert_round_trip(WeaponInventory(), 0)
+        weapon_inventory: WeaponInventory = WeaponInventory([Weapon.SWORD, Weapon.STICK, Weapon.HEAVY_CROSSBOW])
+        self.assert_round_trip(weapon_inventory, 0)
+        self.assertEqual(len(weapon_inventory.to_bytes()), 1 + (len(WeaponInventory.catalog) + 7) // 8)
+
+    def test_count_byte_format(self):
+        self.assert_round_trip(WeaponInventory([Weapon.SWORD, Weapon.SWORD, Weapon.KNIFE]), 1)
+        self.assert_round_trip(WeaponInventory([Weapon.KNIFE] * 255), 1)
+
+    def test_counts_over_255(self):
+        weapon_inventory: WeaponInventory = WeaponInventory([Weapon.STICK] * 300 + [Weapon.SWORD] * 256 + [Weapon.BOW_AND_ARROW])
+        self.assert_round_trip(weapon_inventory, 2)
+
+        loaded: WeaponInventory = WeaponInventory.from_bytes(weapon_inventory.to_bytes())
+        self.assertEqual(loaded.count(Weapon.STICK), 300)
+        self.assertEqual(loaded.count(Weapon.SWORD), 256)
+        self.assertEqual(loaded.count(Weapon.BOW_AND_ARROW), 1)
+
+    def test_pickle_round_trip(self):
+        for weapons in [[], [Weapon.SWORD, Weapon.STICK], [Weapon.SWORD] * 3, [Weapon.CLUB] * 1000]:
+            with self.subTest(weapon_count=len(weapons)):
+                weapon_inventory: WeaponInventory = WeaponInventory(weapons)
+                self.assertEqual(pickle.loads(pickle.dumps(weapon_inventory)), weapon_inventory)
+
+    def test_iterates_in_catalog_order(self):
+        weapon_inventory: WeaponInventory = WeaponInventory([Weapon.SWORD, Weapon.STICK, Weapon.SWORD])
+        self.assertEqual(tuple(weapon_inventory), (Weapon.STICK, Weapon.SWORD, Weapon.SWORD))
+        self.assertEqual(weapon_inventory[0], Weapon.STICK)
+
+        weapon_inventory.remove(Weapon.SWORD)
+        self.assertEqual(tuple(weapon_inventory), (Weapon.STICK, Weapon.SWORD))
+        with self.assertRaises(ValueError):
+            weapon_inventory.remove(Weapon.KNIFE)
+
+    def test_select_weapon(self):
+        player: Player = Player()
+        player.selected_weapon = Weapon.STICK
+        player.weapons = [Weapon.SWORD, Weapon.KNIFE]
+
+        WeaponUtil.select_weapon(Weapon.SWORD, player)
+        self.assertEqual(player.selected_weapon, Weapon.SWORD)
+        self.assertEqual(tuple(player.weapons), (Weapon.STICK, Weapon.KNIFE))
+        self.assertEqual(WeaponUtil.get_owned_weapons(player), (Weapon.STICK, Weapon.KNIFE, Weapon.SWORD))
+
+        # A weapon the player doesn't have can't be selected, and nothing changes
+        with self.assertRaises(ValueError):
+            WeaponUtil.select_weapon(Weapon.DAGGER, player)
+        self.assertEqual(player.selected_weapon, Weapon.SWORD)
+        self.assertEqual(tuple(player.weapons), (Weapon.STICK, Weapon.KNIFE))
+
+    def test_remove_weapon(self):
+        current_player: Player = PlayerUtil.current_player
+        player: Player = Player()
+        player.selected_weapon = Weapon.SWORD
+        # Acquired crossbow first, but the knife comes first in the catalog
+        player.weapons = [Weapon.HEAVY_CROSSBOW, Weapon.KNIFE, Weapon.CLUB]
+        PlayerUtil.current_player = player
+        try:
+            WeaponUtil.remove_weapon(Weapon.CLUB)
+            self.assertEqual(player.selected_weapon, Weapon.SWORD)
+            self.assertEqual(tuple(player.weapons), (Weapon.KNIFE, Weapon.HEAVY_CROSSBOW))
+
+            # Removing the selected weapon equips the first weapon in catalog order
+            WeaponUtil.remove_weapon(Weapon.SWORD)
+            self.assertEqual(player.selected_weapon, Weapon.KNIFE)
+            self.assertEqual(tuple(player.weapons), (Weapon.HEAVY_CROSSBOW,))
+        finally:
+            PlayerUtil.current_player = current_player
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import pickle
+import unittest
+
+import numpy as np
+
+# The core modules pull in Qt through PlayerUtil, so make sure it never needs a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from com.github.dm0896665.main.core.weapon.weapon import Weapon
+from com.github.dm0896665.main.core.weapon.weapon_table import WeaponTable
+
+
+# Run from the repository root: python -m pytest com/github/dm0896665/test
+class WeaponTableTest(unittest.TestCase):
+    @staticmethod
+    def get_worn_table() -> WeaponTable:
+        # Instances that have been worn, upgraded, credited with kills and removed from, so every column differs
+        weapon_table: WeaponTable = WeaponTable([Weapon.STICK, Weapon.SWORD, Weapon.SWORD, Weapon.HEAVY_CROSSBOW, Weapon.KNIFE])
+        weapon_table.wear(np.array([30, 100, 5]), np.array([0, 1, 3]))
+        weapon_table.upgrade(3, np.array([2, 3]))
+        weapon_table.add_kills(7, np.array([2]))
+        weapon_table.remove(4)
+        return weapon_table
+
+    def assert_round_trip(self, weapon_table: WeaponTable):
+        loaded: WeaponTable = WeaponTable.from_bytes(weapon_table.to_bytes())
+        self.assertEqual(loaded, weapon_table)
+        self.assertEqual(loaded.get_page(0, len(loaded)), weapon_table.get_page(0, len(weapon_table)))
+
+        # New instances keep getting handles no instance has had before
+        self.assertEqual(loaded.add(Weapon.CLUB), weapon_table.next_handle)
+
+    def test_round_trip(self):
+        for weapon_table in [WeaponTable(), WeaponTable([Weapon.STICK]), self.get_worn_table()]:
+            with self.subTest(weapon_table=repr(weapon_table)):
+                self.assert_round_trip(weapon_table)
+
+    def test_round_trip_of_wide_values(self):
+        # Kills past every narrower type have to save in 8 bytes without losing anything
+        weapon_table: WeaponTable = self.get_worn_table()
+        handle: int = weapon_table.add(Weapon.DAGGER, 0, 2 ** 16, 2 ** 40)
+        self.assert_round_trip(weapon_table)
+        self.assertEqual(WeaponTable.from_bytes(weapon_table.to_bytes()).get_kills(handle), 2 ** 40)
+
+    def test_pickle_round_trip(self):
+        weapon_table: WeaponTable = self.get_worn_table()
+        self.assertEqual(pickle.loads(pickle.dumps(weapon_table)), weapon_table)
+
+    def test_columns_save_in_the_narrowest_type(self):
+        weapon_table: WeaponTable = WeaponTable([Weapon.STICK] * 1000)
+        # Format byte, row count, next handle, then 2 byte handles and 1 byte columns
+        self.assertEqual(len(weapon_table.to_bytes()), 17 + 5 + 1000 * 2 + 4 * 1000)
+
+    def test_rejects_unknown_format(self):
+        data: bytearray = bytearray(self.get_worn_table().to_bytes())
+        data[0] = WeaponTable.format_version + 1
+        with self.assertRaises(ValueError):
+            WeaponTable.from_bytes(bytes(data))
+
+    def test_rejects_bad_values(self):
+        weapon_table: WeaponTable = WeaponTable([Weapon.STICK])
+        bad_calls: dict = {
+            "negative type index": lambda: weapon_table.add_type_indexes([-1]),
+            "type index past the catalog": lambda: weapon_table.add_type_indexes([len(WeaponTable.catalog)]),
+            "negative durability": lambda: weapon_table.add(Weapon.STICK, -1),
+            "durability above the max": lambda: weapon_table.add(Weapon.STICK, WeaponTable.max_durability + 1),
+            "negative upgrade level": lambda: weapon_table.add(Weapon.STICK, upgrade_level=-1),
+            "negative kills": lambda: weapon_table.add(Weapon.STICK, kills=-1),
+            "negative wear": lambda: weapon_table.wear(-1),
+            "negative kills added": lambda: weapon_table.add_kills(np.array([-1]), np.array([0])),
+            "handle not in the table": lambda: weapon_table.get_durability(1),
+        }
+        for name, bad_call in bad_calls.items():
+            with self.subTest(name):
+                with self.assertRaises(ValueError):
+                    bad_call()
+
+        # None of them may have left anything behind
+        self.assertEqual(weapon_table, WeaponTable([Weapon.STICK]))
+
+
+if __name__ == "__main__":
+    unittest.main()